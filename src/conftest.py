@@ -4,42 +4,51 @@ These fixtures are specifically for tests co-located with source code.
 The tests/conftest.py contains fixtures for tests in the tests/ directory.
 """
 
+import math
 from pathlib import Path
 
 import pytest
 
 
-@pytest.fixture
-def small_audio_file(tmp_path: Path) -> Path:
+# One MPEG-1 Layer III frame: 128 kbps, 44.1 kHz, mono, no padding.
+# A header followed by zeroed side info and main data decodes as silence.
+_SILENT_MP3_FRAME = b"\xff\xfb\x90\xc0" + bytes(413)
+_SAMPLES_PER_FRAME = 1152
+_SAMPLE_RATE = 44100
+
+
+def _write_silent_mp3(path: Path, duration_sec: float) -> Path:
+    """Write a silent CBR MP3 of at least duration_sec without encoding."""
+    frames = math.ceil(duration_sec * _SAMPLE_RATE / _SAMPLES_PER_FRAME)
+    path.write_bytes(_SILENT_MP3_FRAME * frames)
+    return path
+
+
+@pytest.fixture(scope="session")
+def small_audio_file(tmp_path_factory: pytest.TempPathFactory) -> Path:
     """Create a small audio file for testing (no chunking needed).
 
-    Creates a 5 second silent MP3 file (~50-100KB) that is small enough
-    to not require chunking with default 20MB limit.
+    Creates a 5 second silent 128 kbps MP3 file (~80KB) that is small enough
+    to not require chunking with default 20MB limit. Session-scoped: the
+    file is shared by all tests, copy it before modifying.
 
     Returns:
         Path: Path to the small audio file.
     """
-    from pydub import AudioSegment
-
-    audio = AudioSegment.silent(duration=5000)  # 5 seconds in ms
-    audio_path = tmp_path / "small_audio.mp3"
-    audio.export(str(audio_path), format="mp3")
-    return audio_path
+    audio_path = tmp_path_factory.mktemp("audio") / "small_audio.mp3"
+    return _write_silent_mp3(audio_path, 5.0)
 
 
-@pytest.fixture
-def large_audio_file(tmp_path: Path) -> Path:
+@pytest.fixture(scope="session")
+def large_audio_file(tmp_path_factory: pytest.TempPathFactory) -> Path:
     """Create a large audio file for testing (chunking required).
 
-    Creates a 90 second silent MP3 file (~1-2MB) that will require
-    chunking with default 30 second duration limit.
+    Creates a 90 second silent 128 kbps MP3 file (~1.4MB) that will require
+    chunking with default 30 second duration limit. Session-scoped: the
+    file is shared by all tests, copy it before modifying.
 
     Returns:
         Path: Path to the large audio file.
     """
-    from pydub import AudioSegment
-
-    audio = AudioSegment.silent(duration=90000)  # 90 seconds in ms
-    audio_path = tmp_path / "large_audio.mp3"
-    audio.export(str(audio_path), format="mp3")
-    return audio_path
+    audio_path = tmp_path_factory.mktemp("audio") / "large_audio.mp3"
+    return _write_silent_mp3(audio_path, 90.0)
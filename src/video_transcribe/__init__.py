@@ -2,6 +2,14 @@
 
 __version__ = "0.1.0"
 
-from video_transcribe.pipeline import process_video, is_video_file
-
 __all__ = ["process_video", "is_video_file"]
+
+
+def __getattr__(name: str) -> object:
+    # The pipeline pulls in the OpenAI SDK; import it on first use so that
+    # `import video_transcribe.cli` stays cheap
+    if name in __all__:
+        from video_transcribe import pipeline
+
+        return getattr(pipeline, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
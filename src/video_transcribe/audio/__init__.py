@@ -4,6 +4,10 @@ from video_transcribe.audio.converter import video_to_audio
 from video_transcribe.audio.chunker import (
     split_audio,
     split_audio_by_duration,
+    iter_split_audio,
+    iter_split_audio_by_duration,
+    split_audio_to_memory,
+    get_audio_duration,
     cleanup_chunks,
     AudioChunk,
 )
@@ -12,6 +16,10 @@ __all__ = [
     "video_to_audio",
     "split_audio",
     "split_audio_by_duration",
+    "iter_split_audio",
+    "iter_split_audio_by_duration",
+    "split_audio_to_memory",
+    "get_audio_duration",
     "cleanup_chunks",
     "AudioChunk",
 ]
@@ -1,11 +1,18 @@
 """Audio chunking for large files exceeding API limits."""
 
+import functools
+import os
+import shutil
+import subprocess
 import tempfile
+import threading
+import wave
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 
 import ffmpeg
-from pydub import AudioSegment
 
 from video_transcribe.config import (
     CHUNK_MAX_SIZE_MB,
@@ -13,8 +20,20 @@ from video_transcribe.config import (
     CHUNK_MAX_DURATION_SEC,
 )
 
+# Scratchpad for temporary chunk files
+_SCRATCHPAD_NAME = "video-transcribe-chunks"
+_SHM_DIR = "/dev/shm"
+# ffmpeg muxer names for the formats split_audio_to_memory() accepts
+_PIPE_MUXERS = {".mp3": "mp3", ".wav": "wav"}
+# Per-split directories inside the scratchpad. They are removed once
+# their last chunk is gone, but never while the split is still exporting:
+# a momentarily empty directory may have queued exports left to write.
+_SPLIT_DIR_PREFIX = "split-"
+_ACTIVE_SPLIT_DIRS: set[Path] = set()
+_SPLIT_DIRS_LOCK = threading.Lock()
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class AudioChunk:
     """Single audio chunk with metadata for transcription."""
 
@@ -51,78 +70,73 @@ def split_audio(
         max_size_mb: Maximum size per chunk in MB (default from CHUNK_MAX_SIZE_MB).
         overlap_sec: Overlap between chunks in seconds (default from CHUNK_OVERLAP_SEC).
         scratchpad_dir: Directory for temporary chunk files.
-            If None, uses system temp directory.
+            If None, uses /dev/shm when it has room, else the system
+            temp directory.
 
     Returns:
         List of AudioChunk objects ordered by index.
 
+    Raises:
+        FileNotFoundError: If audio file doesn't exist.
+        RuntimeError: If audio splitting fails.
+    """
+    return list(iter_split_audio(audio_path, max_size_mb, overlap_sec, scratchpad_dir))
+
+
+def iter_split_audio(
+    audio_path: str,
+    max_size_mb: int = CHUNK_MAX_SIZE_MB,
+    overlap_sec: float = CHUNK_OVERLAP_SEC,
+    scratchpad_dir: str | None = None,
+) -> Iterator[AudioChunk]:
+    """Split audio file into chunks, yielding each one as soon as it is ready.
+
+    Same as split_audio(), but the caller can start sending chunk 0 while
+    later chunks are still being cut. The file is validated and boundaries
+    are computed before this function returns; exports start on the first
+    next() call, run in the background and are yielded in index order.
+
+    Closing the iterator early removes chunks that were not yielded yet.
+
     Raises:
         FileNotFoundError: If audio file doesn't exist.
         RuntimeError: If audio splitting fails.
     """
     audio_file = Path(audio_path)
 
-    if not audio_file.exists():
-        raise FileNotFoundError(f"Audio file not found: {audio_path}")
+    # One stat answers both "does it exist" and "how big is it"
+    try:
+        file_size = audio_file.stat().st_size
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Audio file not found: {audio_path}") from None
+
+    # Both branches need the duration. It comes from the container header;
+    # the audio itself is never decoded, chunks are cut by ffmpeg with
+    # stream copy.
+    duration_sec = get_audio_duration(audio_path)
 
     # Check if chunking is needed
-    file_size_mb = audio_file.stat().st_size / (1024 * 1024)
-    if file_size_mb <= max_size_mb:
+    if file_size <= max_size_mb * 1024 * 1024:
         # No chunking needed - return single chunk with is_temp=False
-        duration = _get_audio_duration(audio_path)
-        return [AudioChunk(
+        return iter([AudioChunk(
             path=str(audio_file),
             index=0,
             start_sec=0.0,
-            end_sec=duration,
-            original_duration_sec=duration,
+            end_sec=duration_sec,
+            original_duration_sec=duration_sec,
             is_temp=False,  # Original file, should NOT be deleted
-        )]
+        )])
 
-    # Load audio for splitting
-    try:
-        audio = AudioSegment.from_file(audio_path)
-    except Exception as e:
-        raise RuntimeError(f"Failed to load audio file: {e}") from e
-
-    duration_ms = len(audio)
-    duration_sec = duration_ms / 1000.0
+    duration_ms = int(duration_sec * 1000)
 
     # Calculate chunks based on time strategy
     chunks_boundaries = _split_by_time(
-        audio, audio_path, duration_sec, file_size_mb, max_size_mb, overlap_sec
+        duration_ms, duration_sec, file_size / (1024 * 1024), max_size_mb, overlap_sec
     )
 
-    # Use system temp dir if not specified
-    if scratchpad_dir is None:
-        scratchpad = Path(tempfile.gettempdir()) / "video-transcribe-chunks"
-    else:
-        scratchpad = Path(scratchpad_dir)
-    scratchpad.mkdir(parents=True, exist_ok=True)
-
-    # Export chunks to files
-    chunk_results: list[AudioChunk] = []
-    for i, (start_ms, end_ms) in enumerate(chunks_boundaries):
-        chunk_path = scratchpad / f"{audio_file.stem}_chunk_{i:03d}{audio_file.suffix}"
-        chunk_audio = audio[start_ms:end_ms]
-
-        try:
-            chunk_audio.export(str(chunk_path), format="mp3")
-        except Exception as e:
-            # Cleanup on failure
-            for existing in chunk_results:
-                Path(existing.path).unlink(missing_ok=True)
-            raise RuntimeError(f"Failed to export chunk {i}: {e}") from e
-
-        chunk_results.append(AudioChunk(
-            path=str(chunk_path),
-            index=i,
-            start_sec=start_ms / 1000.0,
-            end_sec=end_ms / 1000.0,
-            original_duration_sec=duration_sec,
-        ))
-
-    return chunk_results
+    return _iter_export_chunks(
+        audio_path, chunks_boundaries, duration_sec, scratchpad_dir
+    )
 
 
 def split_audio_by_duration(
@@ -134,7 +148,7 @@ def split_audio_by_duration(
     """Split audio file into chunks based on duration limit.
 
     This is useful for APIs with duration-based limits (e.g., Z.AI 30s limit).
-    Uses pydub for accurate audio splitting by time.
+    Chunks are cut by ffmpeg with stream copy, so the audio is never decoded.
 
     Args:
         audio_path: Path to audio file to split.
@@ -143,12 +157,33 @@ def split_audio_by_duration(
         overlap_sec: Overlap between chunks in seconds.
             Default from CHUNK_OVERLAP_SEC (2.0).
         scratchpad_dir: Directory for temporary chunk files.
-            If None, uses system temp directory.
+            If None, uses /dev/shm when it has room, else the system
+            temp directory.
 
     Returns:
         List of AudioChunk objects ordered by index with accurate
         start_sec/end_sec metadata.
 
+    Raises:
+        FileNotFoundError: If audio file doesn't exist.
+        RuntimeError: If audio splitting fails.
+    """
+    return list(iter_split_audio_by_duration(
+        audio_path, max_duration_sec, overlap_sec, scratchpad_dir
+    ))
+
+
+def iter_split_audio_by_duration(
+    audio_path: str,
+    max_duration_sec: float = CHUNK_MAX_DURATION_SEC,
+    overlap_sec: float = CHUNK_OVERLAP_SEC,
+    scratchpad_dir: str | None = None,
+) -> Iterator[AudioChunk]:
+    """Split audio file by duration, yielding each chunk as soon as it is ready.
+
+    Streaming counterpart of split_audio_by_duration(); see
+    iter_split_audio() for the iteration contract.
+
     Raises:
         FileNotFoundError: If audio file doesn't exist.
         RuntimeError: If audio splitting fails.
@@ -159,94 +194,242 @@ def split_audio_by_duration(
         raise FileNotFoundError(f"Audio file not found: {audio_path}")
 
     # Get audio duration using ffprobe
-    duration = _get_audio_duration(audio_path)
+    duration = get_audio_duration(audio_path)
 
     # Check if chunking is needed
     if duration <= max_duration_sec:
         # No chunking needed - return single chunk with is_temp=False
-        return [AudioChunk(
+        return iter([AudioChunk(
             path=str(audio_file),
             index=0,
             start_sec=0.0,
             end_sec=duration,
             original_duration_sec=duration,
             is_temp=False,  # Original file, should NOT be deleted
-        )]
-
-    # Load audio for splitting using pydub
-    try:
-        audio = AudioSegment.from_file(audio_path)
-    except Exception as e:
-        raise RuntimeError(f"Failed to load audio file: {e}") from e
+        )])
 
-    duration_ms = len(audio)
-    duration_sec = duration_ms / 1000.0
+    duration_ms = int(duration * 1000)
 
     # Calculate chunk boundaries based on duration
-    # Note: overlap is included WITHIN the duration limit, not added on top
-    # For 30s limit with 2s overlap: chunks are [0-30s], [28-58s], [56-86s], etc.
-    chunk_duration_ms = int(max_duration_sec * 1000)
-    overlap_ms = int(overlap_sec * 1000)
+    chunks_boundaries = _split_by_duration(
+        duration_ms, max_duration_sec, overlap_sec
+    )
 
-    if chunk_duration_ms <= 0:
-        raise RuntimeError(
-            f"Max duration ({max_duration_sec}s) must be positive"
+    return _iter_export_chunks(
+        audio_path, chunks_boundaries, duration, scratchpad_dir
+    )
+
+
+def split_audio_to_memory(
+    audio_path: str,
+    max_duration_sec: float = CHUNK_MAX_DURATION_SEC,
+    overlap_sec: float = CHUNK_OVERLAP_SEC,
+) -> Iterator[tuple[AudioChunk, bytes]]:
+    """Split audio by duration without writing chunk files to disk.
+
+    Each chunk is stream-copied by ffmpeg straight into a pipe and yielded
+    together with its encoded bytes, ready to be sent as an upload body.
+    Chunk boundaries match split_audio_by_duration().
+
+    The yielded AudioChunk.path points at the source file and is_temp is
+    False, so cleanup_chunks() never touches anything. Only the formats
+    extraction produces (mp3, wav) are supported.
+
+    Args:
+        audio_path: Path to audio file to split.
+        max_duration_sec: Maximum duration per chunk in seconds.
+        overlap_sec: Overlap between chunks in seconds.
+
+    Yields:
+        (AudioChunk, bytes) pairs ordered by index.
+
+    Raises:
+        FileNotFoundError: If audio file doesn't exist.
+        ValueError: If the file is not mp3 or wav.
+        RuntimeError: If audio splitting fails.
+    """
+    audio_file = Path(audio_path)
+
+    if not audio_file.exists():
+        raise FileNotFoundError(f"Audio file not found: {audio_path}")
+
+    # Pipes need an explicit muxer
+    container = _PIPE_MUXERS.get(audio_file.suffix.lower())
+    if container is None:
+        raise ValueError(
+            f"Unsupported format for in-memory split: {audio_file.suffix}. "
+            f"Supported formats: {', '.join(_PIPE_MUXERS)}"
         )
-    if overlap_ms >= chunk_duration_ms:
-        raise RuntimeError(
-            f"Overlap ({overlap_sec}s) must be less than max duration ({max_duration_sec}s)"
+
+    duration = get_audio_duration(audio_path)
+    if duration <= max_duration_sec:
+        chunks_boundaries = [(0, int(duration * 1000))]
+    else:
+        chunks_boundaries = _split_by_duration(
+            int(duration * 1000), max_duration_sec, overlap_sec
         )
 
-    # Use system temp dir if not specified
+    for i, (start_ms, end_ms) in enumerate(chunks_boundaries):
+        try:
+            data, _ = (
+                ffmpeg
+                .input(audio_path, ss=start_ms / 1000.0, t=(end_ms - start_ms) / 1000.0)
+                .output("pipe:", format=container, acodec="copy", vn=None)
+                .run(capture_stdout=True, capture_stderr=True)
+            )
+        except ffmpeg.Error as e:
+            raise RuntimeError(f"Failed to export chunk {i}: {e}") from e
+
+        yield AudioChunk(
+            path=str(audio_file),
+            index=i,
+            start_sec=start_ms / 1000.0,
+            end_sec=end_ms / 1000.0,
+            original_duration_sec=duration,
+            is_temp=False,  # Nothing on disk to clean up
+        ), data
+
+
+def _iter_export_chunks(
+    audio_path: str,
+    chunks_boundaries: list[tuple[int, int]],
+    duration_sec: float,
+    scratchpad_dir: str | None,
+) -> Iterator[AudioChunk]:
+    """Cut every (start_ms, end_ms) window into its own temp chunk file.
+
+    Back-to-back windows go through a single segment-muxer pass;
+    overlapping windows are cut concurrently. Chunks are yielded in index
+    order as their export finishes. If any export fails, every chunk file
+    of this split is removed.
+    """
+    audio_file = Path(audio_path)
+
+    # Use a RAM-backed or system temp dir if not specified
     if scratchpad_dir is None:
-        scratchpad = Path(tempfile.gettempdir()) / "video-transcribe-chunks"
+        window_ms = sum(end_ms - start_ms for start_ms, end_ms in chunks_boundaries)
+        estimated_bytes = int(
+            os.stat(audio_path).st_size * window_ms / max(duration_sec * 1000, 1)
+        )
+        scratchpad = _default_scratchpad(estimated_bytes)
     else:
         scratchpad = Path(scratchpad_dir)
     scratchpad.mkdir(parents=True, exist_ok=True)
+    # Splits of different inputs with the same file name run concurrently,
+    # so each one writes into its own directory
+    split_dir = Path(tempfile.mkdtemp(prefix=_SPLIT_DIR_PREFIX, dir=scratchpad))
+    with _SPLIT_DIRS_LOCK:
+        _ACTIVE_SPLIT_DIRS.add(split_dir)
+
+    chunks = [
+        AudioChunk(
+            path=str(split_dir / f"{audio_file.stem}_chunk_{i:03d}{audio_file.suffix}"),
+            index=i,
+            start_sec=start_ms / 1000.0,
+            end_sec=end_ms / 1000.0,
+            original_duration_sec=duration_sec,
+        )
+        for i, (start_ms, end_ms) in enumerate(chunks_boundaries)
+    ]
+
+    if _is_contiguous(chunks_boundaries):
+        # No overlap between windows: a single segment-muxer pass writes
+        # every chunk
+        executor = ThreadPoolExecutor(max_workers=1)
+        segments = executor.submit(
+            _export_segments, audio_path, split_dir, chunks, chunks_boundaries
+        )
+        futures = [segments] * len(chunks)
+    else:
+        # Each export is an independent ffmpeg process, so threads are
+        # enough to keep several cuts in flight at once
+        executor = ThreadPoolExecutor(
+            max_workers=min(len(chunks), os.cpu_count() or 1) or 1
+        )
+        futures = [
+            executor.submit(_export_chunk, audio_path, chunk.path, start_ms, end_ms)
+            for chunk, (start_ms, end_ms) in zip(chunks, chunks_boundaries)
+        ]
 
-    # Export chunks to files
-    chunk_results: list[AudioChunk] = []
-    start_ms = 0
-    index = 0
+    handed_out = 0
+    try:
+        for chunk, future in zip(chunks, futures):
+            try:
+                future.result()
+            except Exception as e:
+                handed_out = 0  # Remove every chunk of the failed split
+                raise RuntimeError(f"Failed to export chunk {chunk.index}: {e}") from e
+            handed_out += 1
+            yield chunk
+    finally:
+        # Stop queued exports, wait for running ones, then drop chunks the
+        # caller never received
+        executor.shutdown(wait=True, cancel_futures=True)
+        cleanup_chunks(chunks[handed_out:])
+        # No more exports: the directory can go once it is empty
+        with _SPLIT_DIRS_LOCK:
+            _ACTIVE_SPLIT_DIRS.discard(split_dir)
+        _remove_split_dir(split_dir)
+
+
+def _default_scratchpad(estimated_bytes: int) -> Path:
+    """Pick the directory for temporary chunk files.
+
+    Prefers /dev/shm (tmpfs) when it exists and has room for twice the
+    estimated chunk size, so short-lived chunks never hit a block device.
+    Falls back to the system temp directory otherwise.
+    """
+    if os.path.isdir(_SHM_DIR):
+        try:
+            if shutil.disk_usage(_SHM_DIR).free > 2 * estimated_bytes:
+                return Path(_SHM_DIR) / _SCRATCHPAD_NAME
+        except OSError:
+            pass
+    return Path(tempfile.gettempdir()) / _SCRATCHPAD_NAME
 
-    while start_ms < duration_ms:
-        # End of chunk (respecting max_duration limit, NOT including overlap)
-        end_ms = min(start_ms + chunk_duration_ms, duration_ms)
 
-        chunk_path = scratchpad / f"{audio_file.stem}_chunk_{index:03d}{audio_file.suffix}"
-        chunk_audio = audio[start_ms:end_ms]
+def _is_contiguous(chunks_boundaries: list[tuple[int, int]]) -> bool:
+    """Check that every window starts exactly where the previous one ends."""
+    return len(chunks_boundaries) > 1 and all(
+        prev_end == start
+        for (_, prev_end), (start, _) in zip(chunks_boundaries, chunks_boundaries[1:])
+    )
 
-        try:
-            chunk_audio.export(str(chunk_path), format="mp3")
-        except Exception as e:
-            # Cleanup on failure
-            for existing in chunk_results:
-                Path(existing.path).unlink(missing_ok=True)
-            raise RuntimeError(f"Failed to export chunk {index}: {e}") from e
-
-        chunk_results.append(AudioChunk(
-            path=str(chunk_path),
-            index=index,
-            start_sec=start_ms / 1000.0,
-            end_sec=end_ms / 1000.0,
-            original_duration_sec=duration_sec,
-        ))
 
-        # Move start forward (accounting for overlap)
-        # Next chunk starts before current chunk ends to preserve context
-        start_ms = start_ms + chunk_duration_ms - overlap_ms
-        index += 1
+def _split_by_duration(
+    duration_ms: int,
+    max_duration_sec: float,
+    overlap_sec: float,
+) -> list[tuple[int, int]]:
+    """Split audio into windows of at most max_duration_sec.
 
-        # Avoid tiny final chunks or infinite loop
-        if start_ms >= duration_ms or duration_ms - start_ms < chunk_duration_ms // 2:
-            break
+    Returns list of (start_ms, end_ms) tuples.
+    """
+    # Note: overlap is included WITHIN the duration limit, not added on top
+    # For 30s limit with 2s overlap: chunks are [0-30s], [28-58s], [56-86s], etc.
+    chunk_duration_ms = int(max_duration_sec * 1000)
+    overlap_ms = int(overlap_sec * 1000)
+
+    if chunk_duration_ms <= 0:
+        raise RuntimeError(
+            f"Max duration ({max_duration_sec}s) must be positive"
+        )
+    if overlap_ms >= chunk_duration_ms:
+        raise RuntimeError(
+            f"Overlap ({overlap_sec}s) must be less than max duration ({max_duration_sec}s)"
+        )
 
-    return chunk_results
+    # Next chunk starts before current chunk ends to preserve context
+    return _window_boundaries(
+        duration_ms,
+        step_ms=chunk_duration_ms - overlap_ms,
+        window_ms=chunk_duration_ms,
+        min_tail_ms=chunk_duration_ms // 2,
+    )
 
 
 def _split_by_time(
-    audio: AudioSegment,
-    audio_path: str,
+    duration_ms: int,
     duration_sec: float,
     file_size_mb: float,
     max_size_mb: int,
@@ -269,29 +452,169 @@ def _split_by_time(
             f"({chunk_duration_sec:.2f}s). Use smaller overlap or larger max_size."
         )
 
-    chunks: list[tuple[int, int]] = []
-    start_ms = 0
+    return _window_boundaries(
+        duration_ms,
+        step_ms=chunk_duration_ms,
+        window_ms=chunk_duration_ms + overlap_ms,
+        min_tail_ms=chunk_duration_ms // 2,
+    )
+
+
+def _window_boundaries(
+    duration_ms: int,
+    step_ms: int,
+    window_ms: int,
+    min_tail_ms: int,
+) -> list[tuple[int, int]]:
+    """Compute (start_ms, end_ms) windows in closed form.
+
+    Windows start every step_ms and span window_ms, clipped to the end of
+    the audio. A window after the first one is only kept if at least
+    min_tail_ms of audio remain from its start (avoids tiny final chunks).
+    """
+    if duration_ms <= 0:
+        return []
+    # Window i > 0 is kept while duration_ms - i * step_ms >= min_tail_ms
+    # (and at least 1ms, so it never starts at or past the end)
+    count = 1 + max(0, (duration_ms - max(min_tail_ms, 1)) // step_ms)
+    return [
+        (start_ms, min(start_ms + window_ms, duration_ms))
+        for start_ms in range(0, count * step_ms, step_ms)
+    ]
+
+
+def _export_chunk(
+    audio_path: str,
+    chunk_path: str,
+    start_ms: int,
+    end_ms: int,
+) -> None:
+    """Cut [start_ms, end_ms) out of audio_path into chunk_path.
+
+    Seeks on the input side and copies the encoded stream, so no decode
+    or re-encode happens. Cut points snap to the nearest codec frame
+    (~26ms for MP3), well inside the chunk overlap.
 
-    while start_ms < len(audio):
-        end_ms = min(start_ms + chunk_duration_ms + overlap_ms, len(audio))
-        chunks.append((start_ms, end_ms))
+    Raises:
+        ffmpeg.Error: If ffmpeg fails to cut the chunk.
+    """
+    (
+        ffmpeg
+        .input(audio_path, ss=start_ms / 1000.0, t=(end_ms - start_ms) / 1000.0)
+        .output(chunk_path, acodec="copy", vn=None)
+        .run(overwrite_output=True, quiet=True)
+    )
 
-        # Move start forward (accounting for overlap)
-        start_ms = start_ms + chunk_duration_ms
 
-        # Avoid tiny final chunks
-        if len(audio) - start_ms < chunk_duration_ms // 2:
-            break
+def _export_segments(
+    audio_path: str,
+    scratchpad: Path,
+    chunks: list[AudioChunk],
+    chunks_boundaries: list[tuple[int, int]],
+) -> None:
+    """Write back-to-back chunks with one ffmpeg segment-muxer invocation.
 
-    return chunks
+    Args:
+        audio_path: Source audio file.
+        scratchpad: Directory the chunk files are written to.
+        chunks: Chunks whose files the segments must produce.
+        chunks_boundaries: Contiguous (start_ms, end_ms) windows.
 
+    Raises:
+        ffmpeg.Error: If ffmpeg fails to segment the file.
+        RuntimeError: If a chunk file was not produced.
+    """
+    audio_file = Path(audio_path)
+    pattern = str(
+        scratchpad
+        / f"{audio_file.stem.replace('%', '%%')}_chunk_%03d{audio_file.suffix}"
+    )
+    # Anything past the last window lands in one extra segment that is
+    # discarded, matching the overlapping path
+    tail_path = scratchpad / f"{audio_file.stem}_chunk_{len(chunks):03d}{audio_file.suffix}"
 
-def _get_audio_duration(audio_path: str) -> float:
-    """Get audio duration in seconds using ffprobe."""
+    cut_points = [start_ms for start_ms, _ in chunks_boundaries[1:]]
+    cut_points.append(chunks_boundaries[-1][1])
+    segment_times = ",".join(f"{ms / 1000.0:.3f}" for ms in cut_points)
     try:
-        probe = ffmpeg.probe(audio_path)
-        return float(probe['format']['duration'])
-    except Exception as e:
+        (
+            ffmpeg
+            .input(audio_path)
+            .output(
+                pattern,
+                f="segment",
+                segment_times=segment_times,
+                reset_timestamps=1,
+                acodec="copy",
+                vn=None,
+            )
+            .run(overwrite_output=True, quiet=True)
+        )
+    finally:
+        tail_path.unlink(missing_ok=True)
+
+    for chunk in chunks:
+        if not os.path.exists(chunk.path):
+            raise RuntimeError(f"Segment muxer did not write {chunk.path}")
+
+
+def get_audio_duration(audio_path: str) -> float:
+    """Get audio duration in seconds from the container header.
+
+    Uses ffprobe, so the audio is never decoded. Results are cached per
+    (path, mtime, size), so probing the same unchanged file again does not
+    spawn another ffprobe process.
+
+    Args:
+        audio_path: Path to audio file.
+
+    Returns:
+        Duration in seconds.
+
+    Raises:
+        RuntimeError: If the file is missing or ffprobe cannot read it.
+    """
+    try:
+        stat = os.stat(audio_path)
+    except OSError as e:
+        raise RuntimeError(f"Failed to get audio duration: {e}") from e
+    return _probe_duration(audio_path, stat.st_mtime_ns, stat.st_size)
+
+
+@functools.lru_cache(maxsize=256)
+def _probe_duration(audio_path: str, mtime_ns: int, size: int) -> float:
+    """Read the container duration with a single-entry ffprobe query.
+
+    PCM WAV files are answered from their header with the stdlib wave
+    module, without spawning a subprocess. mtime_ns and size are only
+    part of the cache key.
+    """
+    if audio_path.lower().endswith(".wav"):
+        try:
+            with wave.open(audio_path, "rb") as wav:
+                return wav.getnframes() / wav.getframerate()
+        except (wave.Error, EOFError, ZeroDivisionError):
+            # Not plain PCM (e.g. WAVE_FORMAT_EXTENSIBLE) - ask ffprobe
+            pass
+
+    try:
+        result = subprocess.run(
+            [
+                "ffprobe", "-v", "error",
+                "-show_entries", "format=duration",
+                "-of", "default=noprint_wrappers=1:nokey=1",
+                audio_path,
+            ],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        return float(result.stdout.strip())
+    except subprocess.CalledProcessError as e:
+        raise RuntimeError(
+            f"Failed to get audio duration: {e.stderr.strip() or e}"
+        ) from e
+    except (OSError, ValueError) as e:
         raise RuntimeError(f"Failed to get audio duration: {e}") from e
 
 
@@ -299,16 +622,36 @@ def cleanup_chunks(chunks: list[AudioChunk]) -> None:
     """Delete temporary chunk files.
 
     Only deletes chunks where is_temp=True to avoid deleting the original file.
+    A split's directory is removed together with its last chunk, once
+    the split has finished exporting.
 
     Args:
         chunks: List of AudioChunk objects to clean up.
     """
+    split_dirs: set[Path] = set()
     for chunk in chunks:
         if not chunk.is_temp:
             # Skip original file
             continue
         try:
-            Path(chunk.path).unlink(missing_ok=True)
-        except Exception:
-            # Best effort cleanup
+            os.unlink(chunk.path)
+        except OSError:
+            # Already gone or not removable - best effort cleanup
+            pass
+        split_dirs.add(Path(chunk.path).parent)
+    for split_dir in split_dirs:
+        _remove_split_dir(split_dir)
+
+
+def _remove_split_dir(split_dir: Path) -> None:
+    """Remove a per-split chunk directory if it is empty and done exporting."""
+    if not split_dir.name.startswith(_SPLIT_DIR_PREFIX):
+        return
+    with _SPLIT_DIRS_LOCK:
+        if split_dir in _ACTIVE_SPLIT_DIRS:
+            return  # The splitter removes it when it finishes
+        try:
+            split_dir.rmdir()
+        except OSError:
+            # Other chunks of the split are still in use
             pass
@@ -1,5 +1,6 @@
 """Video to audio converter."""
 
+import subprocess
 from pathlib import Path
 
 import ffmpeg
@@ -13,7 +14,8 @@ def video_to_audio(video_path: str, output_path: str | None = None) -> str:
     Args:
         video_path: Path to the video file.
         output_path: Path to save the audio file. If None, saves next to the video
-            with the same name and .mp3 extension.
+            with the same name and the AUDIO_FORMAT extension (.mp3 by default).
+            A .wav path produces 16-bit PCM, anything else MP3.
 
     Returns:
         Path to the created audio file.
@@ -30,15 +32,32 @@ def video_to_audio(video_path: str, output_path: str | None = None) -> str:
     if output_path is None:
         output_path = str(video_file.with_suffix(f".{DEFAULT_AUDIO_FORMAT}"))
 
+    # Only the first audio track is needed; skip video, subtitle and data
+    # streams so they are neither decoded nor muxed
+    output_options = {"map": "0:a:0", "vn": None, "sn": None, "dn": None}
+    if _can_stream_copy(video_path, output_path):
+        # Audio track already matches the target: demux it without encoding
+        output_options["acodec"] = "copy"
+    elif Path(output_path).suffix.lower() == ".wav":
+        # Raw PCM: decode and resample only, no encoder in the loop
+        output_options.update({
+            "acodec": "pcm_s16le",
+            "ar": DEFAULT_AUDIO_SAMPLE_RATE,
+            "ac": 1,
+        })
+    else:
+        output_options.update({
+            "acodec": "libmp3lame",
+            "q:a": 5,  # VBR, plenty for speech
+            "ar": DEFAULT_AUDIO_SAMPLE_RATE,
+            "ac": 1,  # mono
+            "threads": 0,
+        })
+
     try:
         (
             ffmpeg.input(video_path)
-            .output(
-                output_path,
-                acodec="libmp3lame",
-                ar=DEFAULT_AUDIO_SAMPLE_RATE,
-                ac=1,  # mono
-            )
+            .output(output_path, **output_options)
             .run(overwrite_output=True, quiet=True)
         )
     except ffmpeg.Error as e:
@@ -50,3 +69,43 @@ def video_to_audio(video_path: str, output_path: str | None = None) -> str:
         ) from None
 
     return output_path
+
+
+def _can_stream_copy(video_path: str, output_path: str) -> bool:
+    """Check whether the first audio stream can be copied as-is.
+
+    Only a mono MP3 track at or below DEFAULT_AUDIO_SAMPLE_RATE qualifies
+    for an .mp3 output. AAC tracks are still re-encoded because Z.AI only
+    accepts MP3/WAV uploads.
+    """
+    if Path(output_path).suffix.lower() != ".mp3":
+        return False
+
+    try:
+        result = subprocess.run(
+            [
+                "ffprobe", "-v", "error",
+                "-select_streams", "a:0",
+                "-show_entries", "stream=codec_name,channels,sample_rate",
+                "-of", "default=noprint_wrappers=1",
+                video_path,
+            ],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+    except (OSError, subprocess.CalledProcessError):
+        # Let the regular encode path report the problem
+        return False
+
+    stream = dict(
+        line.split("=", 1) for line in result.stdout.splitlines() if "=" in line
+    )
+    try:
+        return (
+            stream.get("codec_name") == "mp3"
+            and int(stream.get("channels", 0)) == 1
+            and int(stream.get("sample_rate", 0)) <= DEFAULT_AUDIO_SAMPLE_RATE
+        )
+    except ValueError:
+        return False
@@ -1,14 +1,20 @@
 """Tests for video_transcribe.audio.chunker module."""
 
+import subprocess
+import wave
 from pathlib import Path
 
 import pytest
 
 from video_transcribe.audio.chunker import (
     AudioChunk,
+    _probe_duration,
+    get_audio_duration,
     cleanup_chunks,
+    iter_split_audio_by_duration,
     split_audio,
     split_audio_by_duration,
+    split_audio_to_memory,
 )
 
 
@@ -314,7 +320,208 @@ class TestSplitAudioIntegration:
             scratchpad_dir=str(custom_dir),
         )
 
-        # Assert: All chunk files should be in custom directory
-        for chunk in chunks:
-            if chunk.is_temp:
-                assert Path(chunk.path).parent == custom_dir
+        # Assert: All chunk files should be in one split directory inside it
+        split_dirs = {Path(chunk.path).parent for chunk in chunks if chunk.is_temp}
+        assert len(split_dirs) == 1
+        assert split_dirs.pop().parent == custom_dir
+
+        # Cleanup removes the split directory with its last chunk
+        cleanup_chunks(chunks)
+        assert list(custom_dir.iterdir()) == []
+
+    def test_same_name_splits_do_not_collide(self, large_audio_file, tmp_path) -> None:
+        """Test that two splits of same-named inputs write separate files.
+
+        Given: Two different files both named large_audio.mp3
+        When: Both are split into the same scratchpad
+        Then: No chunk path is shared, so neither overwrites the other
+        """
+        # Arrange
+        other_dir = tmp_path / "other"
+        other_dir.mkdir()
+        other = other_dir / large_audio_file.name
+        other.write_bytes(large_audio_file.read_bytes())
+        custom_dir = tmp_path / "chunks"
+
+        # Act
+        first = split_audio_by_duration(str(large_audio_file), scratchpad_dir=str(custom_dir))
+        second = split_audio_by_duration(str(other), scratchpad_dir=str(custom_dir))
+
+        # Assert
+        assert not {c.path for c in first} & {c.path for c in second}
+        cleanup_chunks(first + second)
+        assert list(custom_dir.iterdir()) == []
+
+    def test_split_audio_export_failure_cleans_up(
+        self, large_audio_file, tmp_path, mocker
+    ) -> None:
+        """Test that a failed chunk export removes every chunk of the split."""
+        from video_transcribe.audio import chunker
+
+        real_export = chunker._export_chunk
+
+        def flaky_export(audio_path, chunk_path, start_ms, end_ms):
+            if chunk_path.endswith("_chunk_001.mp3"):
+                raise OSError("disk full")
+            real_export(audio_path, chunk_path, start_ms, end_ms)
+
+        mocker.patch.object(chunker, "_export_chunk", side_effect=flaky_export)
+        custom_dir = tmp_path / "chunks"
+
+        with pytest.raises(RuntimeError, match="Failed to export chunk 1"):
+            split_audio_by_duration(
+                str(large_audio_file), scratchpad_dir=str(custom_dir)
+            )
+
+        assert list(custom_dir.iterdir()) == []
+
+    def test_zero_overlap_uses_segment_muxer(self, large_audio_file, tmp_path) -> None:
+        """Test that back-to-back chunks are written in one segment pass."""
+        custom_dir = tmp_path / "chunks"
+
+        chunks = split_audio_by_duration(
+            str(large_audio_file),
+            max_duration_sec=30.0,
+            overlap_sec=0.0,
+            scratchpad_dir=str(custom_dir),
+        )
+
+        assert [c.start_sec for c in chunks] == [0.0, 30.0, 60.0]
+        split_dir = Path(chunks[0].path).parent
+        assert split_dir.parent == custom_dir
+        assert sorted(p.name for p in split_dir.iterdir()) == [
+            Path(c.path).name for c in chunks
+        ]
+        for prev, cur in zip(chunks, chunks[1:]):
+            assert prev.end_sec == cur.start_sec
+
+    def test_iter_split_yields_in_order_and_cleans_up_on_close(
+        self, large_audio_file, tmp_path
+    ) -> None:
+        """Test that closing the iterator early removes unyielded chunks."""
+        custom_dir = tmp_path / "chunks"
+
+        chunks_iter = iter_split_audio_by_duration(
+            str(large_audio_file), scratchpad_dir=str(custom_dir)
+        )
+        first = next(chunks_iter)
+        chunks_iter.close()
+
+        assert first.index == 0
+        assert Path(first.path).exists()
+        split_dir = Path(first.path).parent
+        assert [p.name for p in split_dir.iterdir()] == [Path(first.path).name]
+
+    def test_split_audio_to_memory(self, large_audio_file) -> None:
+        """Test that in-memory mp3 chunks match duration-based boundaries."""
+        pairs = list(split_audio_to_memory(str(large_audio_file)))
+        expected = split_audio_by_duration(str(large_audio_file))
+        cleanup_chunks(expected)
+
+        assert [c.start_sec for c, _ in pairs] == [c.start_sec for c in expected]
+        for chunk, data in pairs:
+            assert chunk.is_temp is False
+            assert chunk.path == str(large_audio_file)
+            assert len(data) > 0
+
+    def test_split_audio_by_duration_accepts_other_formats(self, tmp_path) -> None:
+        """Test that on-disk duration splits work for any format ffmpeg reads."""
+        # Arrange: 60 s of silence encoded as FLAC
+        wav = tmp_path / "audio.wav"
+        with wave.open(str(wav), "wb") as f:
+            f.setnchannels(1)
+            f.setsampwidth(2)
+            f.setframerate(8000)
+            f.writeframes(bytes(2 * 8000 * 60))
+        flac = tmp_path / "audio.flac"
+        subprocess.run(["ffmpeg", "-v", "error", "-i", str(wav), str(flac)], check=True)
+
+        # Act
+        chunks = split_audio_by_duration(
+            str(flac), max_duration_sec=30.0, scratchpad_dir=str(tmp_path / "chunks")
+        )
+
+        # Assert
+        assert len(chunks) > 1
+        assert all(c.path.endswith(".flac") and Path(c.path).stat().st_size > 0 for c in chunks)
+        cleanup_chunks(chunks)
+
+    def test_split_audio_to_memory_wav(self, tmp_path) -> None:
+        """Test that wav input is split through the wav muxer."""
+        # Arrange: 60 s of 8 kHz mono silence
+        audio = tmp_path / "audio.wav"
+        with wave.open(str(audio), "wb") as f:
+            f.setnchannels(1)
+            f.setsampwidth(2)
+            f.setframerate(8000)
+            f.writeframes(bytes(2 * 8000 * 60))
+
+        # Act
+        pairs = list(split_audio_to_memory(str(audio), max_duration_sec=30.0))
+
+        # Assert
+        assert len(pairs) > 1
+        assert pairs[1][0].start_sec == 28.0
+        assert all(data.startswith(b"RIFF") for _, data in pairs)
+
+    @pytest.mark.parametrize("suffix", [".m4a", ".aac", ".mp4"])
+    def test_split_audio_to_memory_rejects_other_formats(self, tmp_path, suffix) -> None:
+        """Test that formats without a matching pipe muxer are refused."""
+        audio = tmp_path / f"audio{suffix}"
+        audio.write_bytes(b"\0")
+
+        with pytest.raises(ValueError, match="Unsupported format"):
+            next(split_audio_to_memory(str(audio)))
+
+    def test_default_scratchpad_falls_back_to_temp_dir(self, tmp_path, mocker) -> None:
+        """Test that the system temp dir is used when /dev/shm is unavailable."""
+        import tempfile
+
+        from video_transcribe.audio import chunker
+
+        mocker.patch.object(chunker, "_SHM_DIR", str(tmp_path / "no-shm"))
+
+        scratchpad = chunker._default_scratchpad(1024)
+
+        assert scratchpad == Path(tempfile.gettempdir()) / "video-transcribe-chunks"
+
+
+class TestGetAudioDuration:
+    """Test suite for ffprobe-based duration lookup."""
+
+    def test_duration_is_cached_for_unchanged_file(
+        self, small_audio_file, mocker
+    ) -> None:
+        """Test that probing the same unchanged file spawns ffprobe once."""
+        _probe_duration.cache_clear()
+        spy = mocker.spy(subprocess, "run")
+
+        first = get_audio_duration(str(small_audio_file))
+        second = get_audio_duration(str(small_audio_file))
+
+        assert first == second
+        assert first == pytest.approx(5.0, abs=0.2)
+        assert spy.call_count == 1
+
+    def test_invalid_audio_raises(self, tmp_path) -> None:
+        """Test that a file ffprobe cannot read raises RuntimeError."""
+        bogus = tmp_path / "bogus.mp3"
+        bogus.write_text("not audio")
+
+        with pytest.raises(RuntimeError, match="Failed to get audio duration"):
+            get_audio_duration(str(bogus))
+
+    def test_wav_duration_read_from_header(self, tmp_path, mocker) -> None:
+        """Test that PCM WAV duration is read without spawning ffprobe."""
+        import wave
+
+        wav_path = tmp_path / "tone.wav"
+        with wave.open(str(wav_path), "wb") as wav:
+            wav.setnchannels(1)
+            wav.setsampwidth(2)
+            wav.setframerate(16000)
+            wav.writeframes(b"\x00\x00" * 16000 * 3)
+        spy = mocker.spy(subprocess, "run")
+
+        assert get_audio_duration(str(wav_path)) == pytest.approx(3.0)
+        assert spy.call_count == 0
@@ -1,13 +1,98 @@
 """CLI interface for video-transcribe."""
 
-import json
+import functools
+import os
+import threading
+import time
+from collections.abc import Callable
+from typing import TYPE_CHECKING, Any, TypeVar
+
 import click
-from pathlib import Path
 
-from video_transcribe.audio import video_to_audio
-from video_transcribe.transcribe import create_speech_to_text
-from video_transcribe.pipeline import process_video
-from video_transcribe.postprocess import list_presets
+if TYPE_CHECKING:
+    from video_transcribe.pipeline import ProcessResult
+
+
+class PresetChoice(click.ParamType):
+    """Case-insensitive choice of post-processing preset.
+
+    Unlike click.Choice, the preset list is resolved on first use, so
+    building the CLI does not import the post-processing package.
+    """
+
+    name = "preset"
+
+    @staticmethod
+    def _presets() -> tuple[str, ...]:
+        from video_transcribe.postprocess.prompts import list_presets
+
+        return list_presets()
+
+    def get_metavar(self, param: click.Parameter, ctx: click.Context | None = None) -> str:
+        # click < 8.2 passes only param
+        return f"[{'|'.join(self._presets())}]"
+
+    def convert(
+        self,
+        value: str,
+        param: click.Parameter | None,
+        ctx: click.Context | None,
+    ) -> str:
+        presets = self._presets()
+        for preset in presets:
+            if value.casefold() == preset.casefold():
+                return preset
+        self.fail(f"{value!r} is not one of {', '.join(map(repr, presets))}.", param, ctx)
+
+
+class _Progress:
+    """Chunk progress reporter that throttles stderr output.
+
+    Emits at most one line per ``interval`` seconds, plus the final one,
+    so many small or concurrently finishing chunks don't flood stderr.
+    """
+
+    def __init__(self, interval: float = 0.1) -> None:
+        self._interval = interval
+        self._last_emit = float("-inf")
+        self._lock = threading.Lock()
+
+    def __call__(self, current: int, total: int) -> None:
+        if total <= 1:
+            return
+        with self._lock:
+            now = time.monotonic()
+            if current < total and now - self._last_emit < self._interval:
+                return
+            self._last_emit = now
+            click.echo(f"  Processing chunk {current}/{total}...", err=True)
+
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+def _errors_to_abort(fn: F) -> F:
+    """Report any error from a command as "Error: ..." and abort.
+
+    Click's own exceptions (usage errors, Abort) pass through untouched.
+    """
+    @functools.wraps(fn)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        try:
+            return fn(*args, **kwargs)
+        except (click.ClickException, click.Abort):
+            raise
+        except Exception as e:
+            click.echo(f"Error: {e}", err=True)
+            raise click.Abort() from None
+
+    return wrapper  # type: ignore[return-value]
+
+
+# Shared option types, built once for all commands
+_MODEL_CHOICE = click.Choice(["gpt-4o-transcribe", "gpt-4o-transcribe-diarize"], case_sensitive=False)
+_FORMAT_CHOICE = click.Choice(["text", "json", "verbose_json", "diarized_json"], case_sensitive=False)
+_PRESET_CHOICE = PresetChoice()
 
 
 @click.group()
@@ -24,7 +109,7 @@ def cli() -> None:
 @click.option(
     "--model",
     "-m",
-    type=click.Choice(["gpt-4o-transcribe", "gpt-4o-transcribe-diarize"], case_sensitive=False),
+    type=_MODEL_CHOICE,
     default="gpt-4o-transcribe",
     help="Transcription model to use.",
 )
@@ -38,7 +123,7 @@ def cli() -> None:
     "--format",
     "-f",
     "response_format",
-    type=click.Choice(["text", "json", "verbose_json", "diarized_json"], case_sensitive=False),
+    type=_FORMAT_CHOICE,
     default="json",
     help="Response format. 'diarized_json' requires diarize model.",
 )
@@ -59,6 +144,12 @@ def cli() -> None:
     default=0,
     help="Sampling temperature (0-1). Lower = more deterministic.",
 )
+@click.option(
+    "--columnar",
+    is_flag=True,
+    help="Write JSON segments as parallel per-field lists (smaller for long transcripts).",
+)
+@_errors_to_abort
 def transcribe(
     audio_path: str,
     model: str,
@@ -67,6 +158,7 @@ def transcribe(
     language: str | None,
     output: str | None,
     temperature: float,
+    columnar: bool,
 ) -> None:
     """Transcribe audio file to text using OpenAI.
 
@@ -76,85 +168,57 @@ def transcribe(
         video-transcribe transcribe tutorial.mp3 -p "ZyntriQix, Digique Plus"
         video-transcribe transcribe meeting.mp3 -l ru -o transcript.txt
     """
-    try:
-        client = create_speech_to_text()
+    from video_transcribe.config import CHUNK_MAX_SIZE_MB
+    from video_transcribe.pipeline import save_transcript
+    from video_transcribe.transcribe import create_speech_to_text
 
-        file_size_mb = Path(audio_path).stat().st_size / (1024 * 1024)
-        if file_size_mb > 20:
-            click.echo(f"Transcribing {audio_path} using {model} (chunked)...")
-        else:
-            click.echo(f"Transcribing {audio_path} using {model}...")
-
-        # Progress callback for chunked processing
-        def progress_callback(current: int, total: int) -> None:
-            if total > 1:
-                click.echo(f"  Processing chunk {current}/{total}...", err=True)
-
-        result = client.transcribe_chunked(
-            audio_path=audio_path,
-            model=model,  # type: ignore
-            prompt=prompt,
-            response_format=response_format,  # type: ignore
-            language=language,
-            temperature=temperature,
-            progress_callback=progress_callback,
-        )
-
-        if output:
-            output_path = Path(output)
-            output_path.parent.mkdir(parents=True, exist_ok=True)
-
-            if response_format == "text":
-                output_path.write_text(result.text, encoding="utf-8")
-            else:
-                output_path.write_text(
-                    json.dumps({
-                        "text": result.text,
-                        "duration": result.duration,
-                        "model": result.model_used,
-                        "segments": [
-                            {
-                                "speaker": s.speaker,
-                                "start": s.start,
-                                "end": s.end,
-                                "text": s.text,
-                            }
-                            for s in result.segments
-                        ],
-                    }, ensure_ascii=False, indent=2),
-                    encoding="utf-8",
-                )
-
-            click.echo(f"Transcription saved: {output}")
-        else:
-            if result.segments:
-                for segment in result.segments:
-                    speaker = f"[{segment.speaker}] " if segment.speaker else ""
-                    click.echo(f"{speaker}{segment.text}")
-            else:
-                click.echo(result.text)
+    client = create_speech_to_text()
 
-            click.echo(f"\n---", err=True)
-            click.echo(f"Model: {result.model_used}", err=True)
-            click.echo(f"Duration: {result.duration:.2f}s" if result.duration else "Duration: N/A", err=True)
+    if os.stat(audio_path).st_size > CHUNK_MAX_SIZE_MB * 1024 * 1024:
+        click.echo(f"Transcribing {audio_path} using {model} (chunked)...")
+    else:
+        click.echo(f"Transcribing {audio_path} using {model}...")
 
-    except Exception as e:
-        click.echo(f"Error: {e}", err=True)
-        raise click.Abort()
+    result = client.transcribe_chunked(
+        audio_path=audio_path,
+        model=model,  # type: ignore
+        prompt=prompt,
+        response_format=response_format,  # type: ignore
+        language=language,
+        temperature=temperature,
+        progress_callback=_Progress(),
+    )
+
+    if output:
+        save_transcript(result, output, response_format, columnar=columnar)  # type: ignore
+
+        click.echo(f"Transcription saved: {output}")
+    else:
+        if result.segments:
+            for segment in result.segments:
+                speaker = f"[{segment.speaker}] " if segment.speaker else ""
+                click.echo(f"{speaker}{segment.text}")
+        else:
+            click.echo(result.text)
+
+        click.echo(f"\n---", err=True)
+        click.echo(f"Model: {result.model_used}", err=True)
+        click.echo(f"Duration: {result.duration:.2f}s" if result.duration else "Duration: N/A", err=True)
 
 
 @cli.command()
-@click.argument("video_path", type=click.Path(exists=True))
+@click.argument("video_paths", nargs=-1, required=True, type=click.Path(exists=True))
 @click.option(
     "--output",
     "-o",
     type=click.Path(),
-    help="Output text file path. Default: same as video with .txt extension.",
+    help="Output text file path. Default: same as video with .txt extension. "
+         "Only allowed with a single video.",
 )
 @click.option(
     "--model",
     "-m",
-    type=click.Choice(["gpt-4o-transcribe", "gpt-4o-transcribe-diarize"], case_sensitive=False),
+    type=_MODEL_CHOICE,
     default="gpt-4o-transcribe",
     help="Transcription model to use.",
 )
@@ -168,7 +232,7 @@ def transcribe(
     "--format",
     "-f",
     "response_format",
-    type=click.Choice(["text", "json", "verbose_json", "diarized_json"], case_sensitive=False),
+    type=_FORMAT_CHOICE,
     default="json",
     help="Response format. 'diarized_json' requires diarize model.",
 )
@@ -198,7 +262,7 @@ def transcribe(
     "--preset",
     "-P",
     "postprocess_preset",
-    type=click.Choice(list_presets(), case_sensitive=False),
+    type=_PRESET_CHOICE,
     default="meeting",
     help="Preset for post-processing. Ignored if --prompt-file is specified.",
 )
@@ -218,8 +282,20 @@ def transcribe(
     help="Path to custom prompt file (markdown with YAML frontmatter). "
          "Takes priority over --preset if both are specified.",
 )
+@click.option(
+    "--jobs",
+    "-j",
+    type=click.IntRange(min=1),
+    default=1,
+    help="Number of videos processed at once (default: 1).",
+)
+@click.option(
+    "--columnar",
+    is_flag=True,
+    help="Write JSON segments as parallel per-field lists (smaller for long transcripts).",
+)
 def process(
-    video_path: str,
+    video_paths: tuple[str, ...],
     output: str | None,
     model: str,
     prompt: str | None,
@@ -232,11 +308,16 @@ def process(
     smart_filename: bool,
     postprocess_dir: str | None,
     prompt_file: str | None,
+    jobs: int,
+    columnar: bool,
 ) -> None:
-    """Transcribe video file directly to text.
+    """Transcribe video files directly to text.
 
     This command combines video conversion and transcription in one step.
-    Post-processing is enabled by default.
+    Post-processing is enabled by default. Several videos are processed in
+    one run, sharing the transcription client; a failed video is reported
+    and the rest are still processed. Use --jobs to process several videos
+    at once.
 
     Examples:
         video-transcribe process meeting.mp4
@@ -249,56 +330,92 @@ def process(
         video-transcribe process meeting.mp4 --postprocess-dir ./summaries
         video-transcribe process meeting.mp4 --prompt-file ./prompts/custom.md
         video-transcribe process meeting.mp4 --no-postprocess  # disable post-processing
+        video-transcribe process day1.mp4 day2.mp4 day3.mp4
+        video-transcribe process *.mp4 --jobs 3
     """
+    from video_transcribe.pipeline import (
+        check_output_collisions,
+        process_video,
+        process_videos,
+        unique_videos,
+    )
+
+    # The same file listed twice is processed once; counts below reflect that
+    videos = unique_videos(video_paths)
+
+    if output and len(videos) > 1:
+        raise click.UsageError("--output can only be used with a single video.")
+
+    if keep_audio:
+        click.echo("Audio will be saved for debugging.", err=True)
+
+    options: dict[str, Any] = {
+        "output_path": output,
+        "model": model,
+        "prompt": prompt,
+        "response_format": response_format,
+        "language": language,
+        "temperature": temperature,
+        "keep_audio": keep_audio,
+        "postprocess": not no_postprocess,
+        "postprocess_preset": postprocess_preset,
+        "smart_filename": smart_filename,
+        "postprocess_dir": postprocess_dir,
+        "prompt_file": prompt_file,
+        "columnar": columnar,
+    }
+
+    # Same-stem videos would overwrite each other's outputs, whether they
+    # run one after another or concurrently
     try:
-        click.echo(f"Processing {video_path}...")
-
-        if keep_audio:
-            click.echo("Audio will be saved for debugging.", err=True)
-
-        # Progress callback for chunked processing
-        def progress_callback(current: int, total: int) -> None:
-            if total > 1:
-                click.echo(f"  Processing chunk {current}/{total}...", err=True)
-
-        result = process_video(
-            video_path=video_path,
-            output_path=output,
-            model=model,  # type: ignore
-            prompt=prompt,
-            response_format=response_format,  # type: ignore
-            language=language,
-            temperature=temperature,
-            keep_audio=keep_audio,
-            progress_callback=progress_callback,
-            postprocess=not no_postprocess,
-            postprocess_preset=postprocess_preset,
-            smart_filename=smart_filename,
-            postprocess_dir=postprocess_dir,
-            prompt_file=prompt_file,
-        )
-
-        click.echo(f"Transcription saved: {Path(result.output_path).resolve()}")
-        if result.audio_path:
-            click.echo(f"Audio saved: {Path(result.audio_path).resolve()}")
-        if result.postprocess:
-            click.echo(f"Post-process saved: {Path(result.postprocess.output_path).resolve()}", err=True)
-
-        click.echo(f"---", err=True)
-        click.echo(f"Model: {result.transcript.model_used}", err=True)
-        click.echo(f"Duration: {result.transcript.duration:.2f}s" if result.transcript.duration else "Duration: N/A", err=True)
-
-    except FileNotFoundError as e:
-        click.echo(f"Error: {e}", err=True)
-        raise click.Abort()
-    except RuntimeError as e:
-        click.echo(f"Error: {e}", err=True)
-        raise click.Abort()
-    except Exception as e:
-        click.echo(f"Error: {e}", err=True)
+        check_output_collisions(videos, **options)
+    except ValueError as e:
+        raise click.UsageError(str(e)) from e
+
+    def report_error(video_path: str, e: Exception) -> None:
+        where = f" ({video_path})" if len(videos) > 1 else ""
+        click.echo(f"Error{where}: {e}", err=True)
+
+    failed = 0
+    if jobs == 1:
+        for video_path in videos:
+            click.echo(f"Processing {video_path}...")
+            try:
+                _report_result(process_video(video_path, progress_callback=_Progress(), **options))
+            except Exception as e:
+                report_error(video_path, e)
+                failed += 1
+    else:
+        # Per-chunk progress from concurrent videos would interleave; report
+        # each video as it finishes instead
+        click.echo(f"Processing {len(videos)} videos, {jobs} at a time...")
+        for video_path, result in process_videos(videos, max_workers=jobs, **options):
+            if isinstance(result, Exception):
+                report_error(video_path, result)
+                failed += 1
+            else:
+                click.echo(f"Finished {video_path}")
+                _report_result(result)
+
+    if failed:
+        if len(videos) > 1:
+            click.echo(f"{failed} of {len(videos)} videos failed.", err=True)
         raise click.Abort()
 
 
+def _report_result(result: "ProcessResult") -> None:
+    """Report where the pipeline saved its outputs for one video."""
+    click.echo(f"Transcription saved: {os.path.abspath(result.output_path)}")
+    if result.audio_path:
+        click.echo(f"Audio saved: {os.path.abspath(result.audio_path)}")
+    if result.postprocess:
+        click.echo(f"Post-process saved: {os.path.abspath(result.postprocess.output_path)}", err=True)
+
+    click.echo(f"---", err=True)
+    click.echo(f"Model: {result.transcript.model_used}", err=True)
+    click.echo(f"Duration: {result.transcript.duration:.2f}s" if result.transcript.duration else "Duration: N/A", err=True)
+
+
 @cli.command()
 @click.argument("video_path", type=click.Path(exists=True))
 @click.option(
@@ -306,6 +423,7 @@ def process(
     "-o",
     help="Path to save the audio file. Default: same as video with .mp3 extension.",
 )
+@_errors_to_abort
 def convert(video_path: str, output_audio: str | None) -> None:
     """Convert video file to audio.
 
@@ -313,12 +431,7 @@ def convert(video_path: str, output_audio: str | None) -> None:
         video-transcribe convert meeting.mp4
         video-transcribe convert meeting.mp4 -o audio/meeting.mp3
     """
-    try:
-        result_path = video_to_audio(video_path, output_audio)
-        click.echo(f"Audio saved: {result_path}")
-    except FileNotFoundError as e:
-        click.echo(f"Error: {e}", err=True)
-        raise click.Abort()
-    except RuntimeError as e:
-        click.echo(f"Error: {e}", err=True)
-        raise click.Abort()
+    from video_transcribe.audio import video_to_audio
+
+    result_path = video_to_audio(video_path, output_audio)
+    click.echo(f"Audio saved: {result_path}")
@@ -1,12 +1,17 @@
-"""Configuration constants for video-transcribe."""
+"""Configuration constants for video-transcribe.
+
+Env-driven settings are resolved on first access (PEP 562 module
+``__getattr__``): ``.env`` is loaded once, the value is parsed and then
+memoized until ``reload()`` is called.
+"""
 
 import os
-from dotenv import load_dotenv
+from collections.abc import Callable
+from typing import Any
 
-load_dotenv()
+from dotenv import load_dotenv
 
 # Audio settings
-DEFAULT_AUDIO_FORMAT: str = "mp3"
 DEFAULT_AUDIO_SAMPLE_RATE: int = 16000  # kHz, recommended for Whisper API
 
 # Transcription settings
@@ -14,47 +19,129 @@ DEFAULT_TRANSCRIPTION_MODEL: str = "gpt-4o-transcribe"
 DEFAULT_TRANSCRIPTION_LANGUAGE: str | None = None  # Auto-detect
 DEFAULT_TRANSCRIPTION_TEMPERATURE: float = 0  # Deterministic
 
+# API limits
+OPENAI_MAX_FILE_SIZE_MB: int = 25
+OPENAI_SUPPORTED_AUDIO_FORMATS = frozenset({".mp3", ".mp4", ".mpeg", ".mpga", ".m4a", ".wav", ".webm"})
+
+# Env-driven settings, resolved lazily by __getattr__ below
+
+# Extracted audio format: mp3 (small uploads) or wav (PCM, no encoder run)
+DEFAULT_AUDIO_FORMAT: str
+
 # OpenAI API for transcription
-OPENAI_API_KEY: str = os.getenv("OPENAI_API_KEY", "")
-OPENAI_BASE_URL: str | None = os.getenv("OPENAI_BASE_URL")  # Optional, uses default if None
+OPENAI_API_KEY: str
+OPENAI_BASE_URL: str | None  # Optional, uses default if None
 
 # Speech-to-text settings (provider-agnostic)
-SPEECH_TO_TEXT_PROVIDER: str = os.getenv("SPEECH_TO_TEXT_PROVIDER", "zai")  # openai | zai
-SPEECH_TO_TEXT_API_KEY: str = (
-    os.getenv("SPEECH_TO_TEXT_API_KEY", "")
-    or os.getenv("OPENAI_API_KEY", "")
-    or os.getenv("ZAI_API_KEY", "")
-)
-SPEECH_TO_TEXT_BASE_URL: str = os.getenv(
-    "SPEECH_TO_TEXT_BASE_URL", "https://api.z.ai/api/paas/v4"
-)
-SPEECH_TO_TEXT_MODEL: str = os.getenv("SPEECH_TO_TEXT_MODEL", "glm-asr-2512")
-
-# API limits
-OPENAI_MAX_FILE_SIZE_MB: int = 25
-OPENAI_SUPPORTED_AUDIO_FORMATS = {".mp3", ".mp4", ".mpeg", ".mpga", ".m4a", ".wav", ".webm"}
+SPEECH_TO_TEXT_PROVIDER: str  # openai | zai
+SPEECH_TO_TEXT_API_KEY: str
+SPEECH_TO_TEXT_BASE_URL: str
+SPEECH_TO_TEXT_MODEL: str
 
 # Chunking settings
-CHUNK_MAX_SIZE_MB: int = int(os.getenv("CHUNK_MAX_SIZE_MB", "20"))
-CHUNK_OVERLAP_SEC: float = float(os.getenv("CHUNK_OVERLAP_SEC", "2.0"))
-CHUNK_MAX_DURATION_SEC: float = float(os.getenv("CHUNK_MAX_DURATION_SEC", "30.0"))
+CHUNK_MAX_SIZE_MB: int
+CHUNK_OVERLAP_SEC: float
+CHUNK_MAX_DURATION_SEC: float
+
+# Number of chunks transcribed concurrently (each is a blocking API call)
+TRANSCRIBE_CONCURRENCY: int
+
+# Transcript cache directory (optional)
+TRANSCRIPT_CACHE_DIR: str | None  # None = caching disabled
 
 # Post-processing settings
-POSTPROCESS_API_KEY: str = os.getenv("POSTPROCESS_API_KEY", "") or os.getenv("OPENAI_API_KEY", "")
-POSTPROCESS_BASE_URL: str | None = os.getenv("POSTPROCESS_BASE_URL")  # Optional, uses default if None
-DEFAULT_POSTPROCESS_MODEL: str = os.getenv("POSTPROCESS_MODEL", "gpt-5-mini")
-DEFAULT_POSTPROCESS_TEMPERATURE: float = float(os.getenv("POSTPROCESS_TEMPERATURE", "0.3"))
+POSTPROCESS_API_KEY: str
+POSTPROCESS_BASE_URL: str | None  # Optional, uses default if None
+DEFAULT_POSTPROCESS_MODEL: str
+DEFAULT_POSTPROCESS_TEMPERATURE: float
+POSTPROCESS_MAX_RPM: int  # 0 = no client-side rate limit
 
 # Post-processing output directory (optional)
-OUTPUT_DIR: str | None = os.getenv("OUTPUT_DIR")  # None = use video file's directory
+OUTPUT_DIR: str | None  # None = use video file's directory
 
 # Legacy aliases (for backward compatibility)
-GLM_API_KEY: str = POSTPROCESS_API_KEY
-GLM_BASE_URL: str | None = POSTPROCESS_BASE_URL
+GLM_API_KEY: str
+GLM_BASE_URL: str | None
 
 # NeMo settings (local speech recognition)
-NEMO_MODEL_NAME: str = os.getenv("NEMO_MODEL_NAME", "nvidia/parakeet-tdt-0.6b-v3")
-NEMO_DEVICE: str = os.getenv("NEMO_DEVICE", "cpu")  # cuda or cpu
+NEMO_MODEL_NAME: str
+NEMO_DEVICE: str  # cuda or cpu
+
+_SETTINGS: dict[str, Callable[[], object]] = {
+    "DEFAULT_AUDIO_FORMAT": lambda: os.getenv("AUDIO_FORMAT", "mp3").lower(),
+    "OPENAI_API_KEY": lambda: os.getenv("OPENAI_API_KEY", ""),
+    "OPENAI_BASE_URL": lambda: os.getenv("OPENAI_BASE_URL"),
+    "SPEECH_TO_TEXT_PROVIDER": lambda: os.getenv("SPEECH_TO_TEXT_PROVIDER", "zai"),
+    "SPEECH_TO_TEXT_API_KEY": lambda: (
+        os.getenv("SPEECH_TO_TEXT_API_KEY", "")
+        or os.getenv("OPENAI_API_KEY", "")
+        or os.getenv("ZAI_API_KEY", "")
+    ),
+    "SPEECH_TO_TEXT_BASE_URL": lambda: os.getenv(
+        "SPEECH_TO_TEXT_BASE_URL", "https://api.z.ai/api/paas/v4"
+    ),
+    "SPEECH_TO_TEXT_MODEL": lambda: os.getenv("SPEECH_TO_TEXT_MODEL", "glm-asr-2512"),
+    "CHUNK_MAX_SIZE_MB": lambda: int(os.getenv("CHUNK_MAX_SIZE_MB", "20")),
+    "CHUNK_OVERLAP_SEC": lambda: float(os.getenv("CHUNK_OVERLAP_SEC", "2.0")),
+    "CHUNK_MAX_DURATION_SEC": lambda: float(os.getenv("CHUNK_MAX_DURATION_SEC", "30.0")),
+    "TRANSCRIBE_CONCURRENCY": lambda: int(os.getenv("TRANSCRIBE_CONCURRENCY", "4")),
+    "TRANSCRIPT_CACHE_DIR": lambda: (
+        os.path.expanduser(os.environ["TRANSCRIPT_CACHE_DIR"])
+        if os.getenv("TRANSCRIPT_CACHE_DIR")
+        else None
+    ),
+    "POSTPROCESS_API_KEY": lambda: (
+        os.getenv("POSTPROCESS_API_KEY", "") or os.getenv("OPENAI_API_KEY", "")
+    ),
+    "POSTPROCESS_BASE_URL": lambda: os.getenv("POSTPROCESS_BASE_URL"),
+    "DEFAULT_POSTPROCESS_MODEL": lambda: os.getenv("POSTPROCESS_MODEL", "gpt-5-mini"),
+    "DEFAULT_POSTPROCESS_TEMPERATURE": lambda: float(os.getenv("POSTPROCESS_TEMPERATURE", "0.3")),
+    "POSTPROCESS_MAX_RPM": lambda: int(os.getenv("POSTPROCESS_MAX_RPM", "0")),
+    "OUTPUT_DIR": lambda: os.getenv("OUTPUT_DIR"),
+    "GLM_API_KEY": lambda: _get("POSTPROCESS_API_KEY"),
+    "GLM_BASE_URL": lambda: _get("POSTPROCESS_BASE_URL"),
+    "NEMO_MODEL_NAME": lambda: os.getenv("NEMO_MODEL_NAME", "nvidia/parakeet-tdt-0.6b-v3"),
+    "NEMO_DEVICE": lambda: os.getenv("NEMO_DEVICE", "cpu"),
+}
+
+# Cleared by reload(), so the next access picks up a changed environment
+_cache: dict[str, object] = {}
+_dotenv_loaded = False
+
+
+def _get(name: str) -> Any:
+    """Resolve an env-driven setting, loading .env on first use."""
+    global _dotenv_loaded
+    try:
+        return _cache[name]
+    except KeyError:
+        pass
+    if not _dotenv_loaded:
+        load_dotenv(override=False)  # Real env vars win over .env
+        _dotenv_loaded = True
+    value = _cache[name] = _SETTINGS[name]()
+    return value
+
+
+def reload() -> None:
+    """Forget resolved settings so the next access re-reads the environment.
+
+    Cheaper than ``importlib.reload()``: only the memoized values and the
+    ``.env`` flag are reset, the module itself is not re-executed.
+    """
+    global _dotenv_loaded
+    _cache.clear()
+    _dotenv_loaded = False
+
+
+def __getattr__(name: str) -> Any:
+    if name in _SETTINGS:
+        return _get(name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *_SETTINGS})
 
 
 def validate_config() -> None:
@@ -65,23 +152,38 @@ def validate_config() -> None:
     Raises:
         ValueError: If configuration values are invalid.
     """
-    if CHUNK_MAX_SIZE_MB >= OPENAI_MAX_FILE_SIZE_MB:
+    chunk_max_size_mb = _get("CHUNK_MAX_SIZE_MB")
+    chunk_overlap_sec = _get("CHUNK_OVERLAP_SEC")
+    chunk_max_duration_sec = _get("CHUNK_MAX_DURATION_SEC")
+    transcribe_concurrency = _get("TRANSCRIBE_CONCURRENCY")
+    audio_format = _get("DEFAULT_AUDIO_FORMAT")
+    postprocess_max_rpm = _get("POSTPROCESS_MAX_RPM")
+
+    if chunk_max_size_mb >= OPENAI_MAX_FILE_SIZE_MB:
         raise ValueError(
-            f"CHUNK_MAX_SIZE_MB ({CHUNK_MAX_SIZE_MB}) must be less than "
+            f"CHUNK_MAX_SIZE_MB ({chunk_max_size_mb}) must be less than "
             f"OPENAI_MAX_FILE_SIZE_MB ({OPENAI_MAX_FILE_SIZE_MB})"
         )
-    if CHUNK_OVERLAP_SEC < 0:
-        raise ValueError(f"CHUNK_OVERLAP_SEC must be non-negative, got {CHUNK_OVERLAP_SEC}")
-    if CHUNK_MAX_DURATION_SEC <= 0:
-        raise ValueError(f"CHUNK_MAX_DURATION_SEC must be positive, got {CHUNK_MAX_DURATION_SEC}")
-    if CHUNK_OVERLAP_SEC >= CHUNK_MAX_DURATION_SEC:
+    if chunk_overlap_sec < 0:
+        raise ValueError(f"CHUNK_OVERLAP_SEC must be non-negative, got {chunk_overlap_sec}")
+    if chunk_max_duration_sec <= 0:
+        raise ValueError(f"CHUNK_MAX_DURATION_SEC must be positive, got {chunk_max_duration_sec}")
+    if chunk_overlap_sec >= chunk_max_duration_sec:
+        raise ValueError(
+            f"CHUNK_OVERLAP_SEC ({chunk_overlap_sec}) must be less than "
+            f"CHUNK_MAX_DURATION_SEC ({chunk_max_duration_sec})"
+        )
+    if transcribe_concurrency < 1:
         raise ValueError(
-            f"CHUNK_OVERLAP_SEC ({CHUNK_OVERLAP_SEC}) must be less than "
-            f"CHUNK_MAX_DURATION_SEC ({CHUNK_MAX_DURATION_SEC})"
+            f"TRANSCRIBE_CONCURRENCY must be at least 1, got {transcribe_concurrency}"
         )
+    if audio_format not in ("mp3", "wav"):
+        raise ValueError(f"AUDIO_FORMAT must be 'mp3' or 'wav', got {audio_format!r}")
+    if postprocess_max_rpm < 0:
+        raise ValueError(f"POSTPROCESS_MAX_RPM must be non-negative, got {postprocess_max_rpm}")
 
     # Post-process API key warning (not error - post-processing is optional)
-    if not POSTPROCESS_API_KEY:
+    if not _get("POSTPROCESS_API_KEY"):
         import warnings
         warnings.warn(
             "POSTPROCESS_API_KEY not set in .env - post-processing will not be available. "
@@ -0,0 +1,36 @@
+"""Filesystem helpers shared by the pipeline stages."""
+
+import os
+import uuid
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from typing import TextIO
+
+
+@contextmanager
+def atomic_write(path: str | Path, buffering: int = -1) -> Iterator[TextIO]:
+    """Open a UTF-8 text file for writing that appears all at once.
+
+    Writes go to a hidden temp file next to path, which replaces path only
+    when the block exits cleanly. A crash or error mid-write leaves any
+    previous file untouched instead of truncated. The parent directory
+    must exist.
+
+    Args:
+        path: Destination file.
+        buffering: Buffer size passed to open().
+
+    Yields:
+        Text file object to write to.
+    """
+    target = Path(path)
+    tmp_path = target.with_name(f".{target.name}.{uuid.uuid4().hex[:8]}.tmp")
+    # O_EXCL reserves the name; mode 0o666 lets the umask apply as for open()
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666)
+    try:
+        with open(fd, "w", encoding="utf-8", buffering=buffering) as f:
+            yield f
+        os.replace(tmp_path, target)
+    finally:
+        tmp_path.unlink(missing_ok=True)
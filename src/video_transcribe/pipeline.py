@@ -1,14 +1,23 @@
 """Video to text pipeline orchestration."""
 
+import functools
+import hashlib
 import json
+import os
+import shutil
 import tempfile
+import time
+import uuid
 import warnings
-from collections.abc import Callable
+from typing import Any
+from collections.abc import Callable, Iterator, Sequence
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
 from pathlib import Path
 
 from video_transcribe.audio import video_to_audio
-from video_transcribe.transcribe import create_speech_to_text
+from video_transcribe.files import atomic_write
+from video_transcribe.transcribe import SpeechToTextClient, create_speech_to_text
 from video_transcribe.transcribe.models import (
     TranscriptionModel,
     ResponseFormat,
@@ -19,13 +28,26 @@ from video_transcribe.postprocess.prompts import load_prompt_file, PromptTemplat
 from video_transcribe.postprocess.models import PostprocessResult
 from video_transcribe.postprocess.exceptions import PostprocessError
 from video_transcribe.postprocess.filename import generate_safe_filename
-from video_transcribe.config import OUTPUT_DIR
+from video_transcribe.transcribe.cache import cache_key, load_cached, store_cached
+from video_transcribe.config import (
+    DEFAULT_AUDIO_FORMAT,
+    OUTPUT_DIR,
+    SPEECH_TO_TEXT_MODEL,
+    SPEECH_TO_TEXT_PROVIDER,
+    TRANSCRIPT_CACHE_DIR,
+)
 
 # Video file extensions to recognize
-VIDEO_EXTENSIONS = {".mp4", ".mov", ".avi", ".mkv", ".webm"}
+VIDEO_EXTENSIONS = frozenset({".mp4", ".mov", ".avi", ".mkv", ".webm"})
+
+# Buffer size for transcript writes
+_WRITE_BUFFER_SIZE = 1024 * 1024
 
+# Extracted audio left behind by failed or killed runs is evicted after this
+_STALE_AUDIO_AGE_SEC = 7 * 24 * 3600
 
-@dataclass
+
+@dataclass(slots=True)
 class ProcessResult:
     """Result of video processing pipeline."""
 
@@ -45,7 +67,172 @@ def is_video_file(path: str) -> bool:
     Returns:
         True if file has a video extension, False otherwise.
     """
-    return Path(path).suffix.lower() in VIDEO_EXTENSIONS
+    return os.path.splitext(path)[1].lower() in VIDEO_EXTENSIONS
+
+
+@functools.cache
+def _temp_dir() -> Path:
+    """Return the temp directory for extracted audio, creating it once.
+
+    Audio from failed runs is kept there so the next run can reuse it;
+    files untouched for _STALE_AUDIO_AGE_SEC are evicted here.
+    """
+    temp_dir = Path(tempfile.gettempdir()) / "video-transcribe"
+    temp_dir.mkdir(parents=True, exist_ok=True)
+    cutoff = time.time() - _STALE_AUDIO_AGE_SEC
+    for path in temp_dir.iterdir():
+        try:
+            if path.is_file() and path.stat().st_mtime < cutoff:
+                path.unlink()
+        except OSError:
+            pass  # Removed concurrently or not ours to remove
+    return temp_dir
+
+
+@functools.cache
+def _speech_to_text_client() -> SpeechToTextClient:
+    """Return the process-wide speech-to-text client.
+
+    Reusing one client across process_video calls keeps its HTTP
+    connection pool (and TLS sessions) alive between videos.
+    """
+    return create_speech_to_text()
+
+
+@functools.cache
+def _text_processor() -> TextProcessor:
+    """Return the process-wide post-processor.
+
+    Shares one LLM client (and its connection pool) across videos, like
+    _speech_to_text_client().
+    """
+    return TextProcessor()
+
+
+def _fingerprint(video_path: str) -> str:
+    """Return a short hash identifying this version of a video file.
+
+    Derived from the absolute path, size and modification time, so it is
+    stable across runs and changes when the file is replaced or edited.
+    """
+    st = os.stat(video_path)
+    key = f"{os.path.abspath(video_path)}|{st.st_size}|{st.st_mtime_ns}"
+    return hashlib.blake2b(key.encode(), digest_size=8).hexdigest()
+
+
+def _extract_audio_once(video_path: str, audio_file: Path) -> None:
+    """Convert video to audio unless a previous run already did.
+
+    FFmpeg writes to a uniquely named ``.part`` sibling that is renamed
+    into place on success, so an existing ``audio_file`` is always
+    complete and concurrent extractions never write to the same file.
+    Concurrent runs do share the finished ``audio_file``; each one
+    transcribes from its own _run_audio_link() instead.
+    """
+    if audio_file.exists() and audio_file.stat().st_size > 0:
+        return
+
+    fd, partial_path = tempfile.mkstemp(
+        prefix=f"{audio_file.stem}.",
+        suffix=f".part{audio_file.suffix}",
+        dir=audio_file.parent,
+    )
+    os.close(fd)
+    partial = Path(partial_path)
+    try:
+        video_to_audio(video_path, str(partial))
+        os.replace(partial, audio_file)
+    finally:
+        partial.unlink(missing_ok=True)
+
+
+def _markdown_output_dir(video_file: Path, postprocess_dir: str | None) -> Path:
+    """Return the directory post-processing output is written to.
+
+    Priority: 1) postprocess_dir param, 2) OUTPUT_DIR env var, 3) video file's directory.
+    """
+    if postprocess_dir is not None:
+        # CLI option takes highest priority
+        return Path(postprocess_dir)
+    if OUTPUT_DIR is not None:
+        # Environment variable takes second priority
+        return Path(OUTPUT_DIR)
+    # Default: use video file's directory (current behavior)
+    return video_file.parent
+
+
+def _output_files(
+    video_path: str,
+    keep_audio: bool = False,
+    postprocess: bool = True,
+    postprocess_dir: str | None = None,
+    **_: Any,
+) -> list[str]:
+    """Return the absolute paths process_video writes for video_path.
+
+    The post-processing entry stands for the default-named markdown file;
+    its suffix depends only on the preset, which every job shares.
+    """
+    video_file = Path(video_path)
+    transcript = video_file.with_suffix(".txt")
+    outputs = [transcript]
+    if keep_audio:
+        outputs.append(video_file.with_suffix(f".{DEFAULT_AUDIO_FORMAT}"))
+    if postprocess:
+        outputs.append(_markdown_output_dir(video_file, postprocess_dir) / transcript.name)
+    return [os.path.abspath(path) for path in outputs]
+
+
+def _run_audio_link(audio_file: Path) -> Path:
+    """Give this run its own name for the shared extracted audio.
+
+    The first run to finish deletes ``audio_file``; transcribing from a
+    private hard link (or a copy where links aren't supported) keeps
+    concurrent runs on the same video, even in other processes, from
+    losing their input mid-upload.
+    """
+    run_audio = audio_file.with_name(
+        f"{audio_file.stem}.run-{uuid.uuid4().hex[:8]}{audio_file.suffix}"
+    )
+    try:
+        os.link(audio_file, run_audio)
+    except OSError:
+        shutil.copyfile(audio_file, run_audio)
+    return run_audio
+
+
+def save_transcript(
+    transcript: TranscriptionResult,
+    output_path: str | Path,
+    response_format: ResponseFormat,
+    columnar: bool = False,
+) -> None:
+    """Write transcript to file as plain text or JSON.
+
+    JSON is streamed to the open file so large transcripts are never
+    materialized as a single string. The file is replaced atomically, so
+    a failed write never leaves a truncated transcript behind.
+
+    Args:
+        transcript: Transcription result to save.
+        output_path: Destination file path. Parent directories are created.
+        response_format: "text" writes plain text, anything else writes JSON.
+        columnar: Write JSON segments as parallel per-field lists
+            (see TranscriptionResult.to_columnar_dict()).
+    """
+    output_file = Path(output_path)
+    output_file.parent.mkdir(parents=True, exist_ok=True)
+
+    if response_format == "text":
+        with atomic_write(output_file) as f:
+            f.write(transcript.text)
+        return
+
+    payload = transcript.to_columnar_dict() if columnar else transcript.to_dict()
+    # json.dump emits many small fragments; a large buffer turns them
+    # into a few big writes
+    with atomic_write(output_file, buffering=_WRITE_BUFFER_SIZE) as f:
+        json.dump(payload, f, ensure_ascii=False, indent=2)
 
 
 def process_video(
@@ -63,6 +250,7 @@ def process_video(
     smart_filename: bool = False,
     postprocess_dir: str | None = None,
     prompt_file: str | None = None,
+    columnar: bool = False,
 ) -> ProcessResult:
     """Process video file to text transcript.
 
@@ -86,6 +274,7 @@ def process_video(
                         Priority: 1) this param, 2) OUTPUT_DIR env var, 3) video dir.
         prompt_file: Path to custom prompt file (markdown with YAML frontmatter).
                      Takes priority over postprocess_preset if specified.
+        columnar: Write JSON transcript segments as parallel per-field lists.
 
     Returns:
         ProcessResult with video path, audio path (None if deleted),
@@ -104,65 +293,79 @@ def process_video(
 
     # 2. Determine audio output path
     if keep_audio:
-        audio_path = str(video_file.with_suffix(".mp3"))
+        audio_file = video_file.with_suffix(f".{DEFAULT_AUDIO_FORMAT}")
     else:
         # Use system temp directory for temp file
-        temp_dir = Path(tempfile.gettempdir()) / "video-transcribe"
-        temp_dir.mkdir(parents=True, exist_ok=True)
-        audio_path = str(temp_dir / f"{video_file.stem}-{id(video_path)}.mp3")
+        temp_dir = _temp_dir()
+        # Stable name: a failed run's audio is reused instead of re-decoded
+        audio_file = temp_dir / f"{video_file.stem}-{_fingerprint(video_path)}.{DEFAULT_AUDIO_FORMAT}"
 
     # 3. Convert video to audio
-    audio_path_result = video_to_audio(video_path, audio_path)
-
-    # 4. Transcribe audio with automatic chunking
-    client = create_speech_to_text()
-    transcript = client.transcribe_chunked(
-        audio_path=audio_path_result,
-        model=model,
-        prompt=prompt,
-        response_format=response_format,
-        language=language,
-        temperature=temperature,
-        progress_callback=progress_callback,
-    )
+    run_audio: Path | None = None
+    if keep_audio:
+        audio_path_result = video_to_audio(video_path, str(audio_file))
+    else:
+        _extract_audio_once(video_path, audio_file)
+        run_audio = _run_audio_link(audio_file)
+        audio_path_result = str(run_audio)
+
+    # 4. Transcribe audio with automatic chunking (or reuse a cached result)
+    transcript: TranscriptionResult | None = None
+    try:
+        if TRANSCRIPT_CACHE_DIR:
+            key = cache_key(
+                audio_path_result,
+                provider=SPEECH_TO_TEXT_PROVIDER,
+                provider_model=SPEECH_TO_TEXT_MODEL,
+                model=model,
+                prompt=prompt,
+                response_format=response_format,
+                language=language,
+                temperature=temperature,
+            )
+            transcript = load_cached(TRANSCRIPT_CACHE_DIR, key, response_format)
+
+        if transcript is None:
+            client = _speech_to_text_client()
+            transcript = client.transcribe_chunked(
+                audio_path=audio_path_result,
+                model=model,
+                prompt=prompt,
+                response_format=response_format,
+                language=language,
+                temperature=temperature,
+                progress_callback=progress_callback,
+            )
+            if TRANSCRIPT_CACHE_DIR:
+                store_cached(TRANSCRIPT_CACHE_DIR, key, transcript)
+    finally:
+        # This run's link goes either way; the shared audio_file stays on
+        # failure for the next run to reuse
+        if run_audio is not None:
+            run_audio.unlink(missing_ok=True)
+
+    # 4.5. Cleanup temp audio if not keeping. Done as soon as the transcript
+    # exists so the file isn't held through post-processing; a failed
+    # transcription leaves it in place for the next run to reuse. Other
+    # runs on this video keep reading their own links.
+    final_audio_path: str | None = audio_path_result
+    if not keep_audio:
+        audio_file.unlink(missing_ok=True)
+        final_audio_path = None
 
     # 5. Determine output path
-    if output_path is None:
-        output_path = str(video_file.with_suffix(".txt"))
-    else:
-        output_path = str(Path(output_path))
+    output_file = video_file.with_suffix(".txt") if output_path is None else Path(output_path)
+    output_path = str(output_file)
 
     # 6. Save transcript to file
-    output_file = Path(output_path)
-    output_file.parent.mkdir(parents=True, exist_ok=True)
-
-    if response_format == "text":
-        output_file.write_text(transcript.text, encoding="utf-8")
-    else:
-        output_file.write_text(
-            json.dumps({
-                "text": transcript.text,
-                "duration": transcript.duration,
-                "model": transcript.model_used,
-                "segments": [
-                    {
-                        "speaker": s.speaker,
-                        "start": s.start,
-                        "end": s.end,
-                        "text": s.text,
-                    }
-                    for s in transcript.segments
-                ],
-            }, ensure_ascii=False, indent=2),
-            encoding="utf-8",
-        )
+    save_transcript(transcript, output_file, response_format, columnar=columnar)
 
     # 6.5. Optional post-processing
     postprocess_result: PostprocessResult | None = None
 
     if postprocess:
         try:
-            processor = TextProcessor()
+            processor = _text_processor()
 
             # Load template: custom prompt file or preset
             custom_template: PromptTemplate | None = None
@@ -179,25 +382,15 @@ def process_video(
                 preset,
                 smart_filename=smart_filename,
                 custom_template=custom_template,
-                video_filename=Path(video_path).stem,
+                video_filename=video_file.stem,
             )
 
             # Determine output path for post-processed file
-            # Priority: 1) postprocess_dir param, 2) OUTPUT_DIR env var, 3) video file's directory
-            markdown_output_dir: Path
-            if postprocess_dir is not None:
-                # CLI option takes highest priority
-                markdown_output_dir = Path(postprocess_dir)
-            elif OUTPUT_DIR is not None:
-                # Environment variable takes second priority
-                markdown_output_dir = Path(OUTPUT_DIR)
-            else:
-                # Default: use video file's directory (current behavior)
-                markdown_output_dir = Path(video_path).parent
+            markdown_output_dir = _markdown_output_dir(video_file, postprocess_dir)
 
             if smart_filename and postprocess_result.suggested_filename:
                 # Use AI-suggested filename
-                default_prefix = Path(video_path).stem
+                default_prefix = video_file.stem
                 postprocess_path = generate_safe_filename(
                     postprocess_result.suggested_filename,
                     markdown_output_dir,
@@ -223,12 +416,6 @@ def process_video(
             warnings.warn(f"Unexpected error in post-processing: {e}")
             postprocess_result = None
 
-    # 7. Cleanup temp audio if not keeping
-    final_audio_path: str | None = audio_path_result
-    if not keep_audio:
-        Path(audio_path_result).unlink(missing_ok=True)
-        final_audio_path = None
-
     return ProcessResult(
         video_path=video_path,
         audio_path=final_audio_path,
@@ -236,3 +423,100 @@ def process_video(
         postprocess=postprocess_result,
         output_path=output_path,
     )
+
+
+def unique_videos(video_paths: Sequence[str]) -> list[str]:
+    """Drop repeated videos, keeping the first spelling of each file.
+
+    Args:
+        video_paths: Video paths, possibly naming one file several ways.
+
+    Returns:
+        Paths in input order, one per distinct absolute path.
+    """
+    unique_paths: dict[str, str] = {}
+    for video_path in video_paths:
+        unique_paths.setdefault(os.path.abspath(video_path), video_path)
+    return list(unique_paths.values())
+
+
+def check_output_collisions(video_paths: Sequence[str], **kwargs: Any) -> None:
+    """Refuse videos that would overwrite each other's outputs.
+
+    Different videos sharing a stem (a/x.mp4 and b/x.mp4 with a shared
+    output dir, or x.mp4 and x.mov) write the same transcript, audio or
+    post-processing file, whether run one after another or concurrently.
+
+    Args:
+        video_paths: Distinct videos to process (see unique_videos()).
+        **kwargs: The process_video options shared by every video.
+
+    Raises:
+        ValueError: If two videos would write the same output file.
+    """
+    writers: dict[str, str] = {}
+    for video_path in video_paths:
+        for output in _output_files(video_path, **kwargs):
+            other = writers.setdefault(output, video_path)
+            if other != video_path:
+                raise ValueError(
+                    f"{other} and {video_path} would both write {output}; "
+                    f"process them in separate runs"
+                )
+
+
+def process_videos(
+    video_paths: Sequence[str],
+    max_workers: int = 3,
+    **kwargs: Any,
+) -> Iterator[tuple[str, ProcessResult | Exception]]:
+    """Process several videos concurrently.
+
+    Each video runs the full process_video pipeline in a worker thread;
+    the stages are dominated by FFmpeg subprocesses and HTTP calls, so
+    threads overlap them well. All workers share one speech-to-text
+    client. Note that every video also transcribes its own chunks with
+    TRANSCRIBE_CONCURRENCY workers.
+
+    Args:
+        video_paths: Video files to process. A file listed more than
+            once (under any path spelling) is processed once.
+        max_workers: Maximum number of videos processed at once.
+        **kwargs: Passed to process_video for every video. output_path
+            is only allowed for a single video.
+
+    Yields:
+        (video_path, result) pairs in completion order, where result is
+        the ProcessResult or the exception that video failed with.
+
+    Raises:
+        ValueError: If max_workers < 1, output_path is given for several
+            videos, or two videos would write the same output file.
+    """
+    if max_workers < 1:
+        raise ValueError(f"max_workers must be at least 1, got {max_workers}")
+    if kwargs.get("output_path") is not None and len(video_paths) > 1:
+        raise ValueError("output_path can only be used with a single video")
+    # The same file twice would be transcribed twice and write the same
+    # outputs
+    unique_paths = unique_videos(video_paths)
+    if not unique_paths:
+        return
+
+    check_output_collisions(unique_paths, **kwargs)
+
+    executor = ThreadPoolExecutor(max_workers=min(max_workers, len(unique_paths)))
+    try:
+        futures = {
+            executor.submit(process_video, video_path, **kwargs): video_path
+            for video_path in unique_paths
+        }
+        for future in as_completed(futures):
+            try:
+                result: ProcessResult | Exception = future.result()
+            except Exception as e:
+                result = e
+            yield futures[future], result
+    finally:
+        # Closing the generator early drops videos that haven't started
+        executor.shutdown(wait=True, cancel_futures=True)
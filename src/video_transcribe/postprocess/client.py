@@ -4,17 +4,77 @@ OpenAI-compatible client that supports any provider (OpenAI, GLM, etc.)
 based on configuration.
 """
 
+import functools
+import json
+import threading
+import time
+from pathlib import Path
+
 from openai import OpenAI, APIConnectionError, RateLimitError, APIError
 
 from video_transcribe.config import (
     POSTPROCESS_API_KEY,
     POSTPROCESS_BASE_URL,
+    POSTPROCESS_MAX_RPM,
     DEFAULT_POSTPROCESS_MODEL,
     DEFAULT_POSTPROCESS_TEMPERATURE,
 )
 from video_transcribe.postprocess.exceptions import GLMClientError
 
 
+class _RateLimiter:
+    """Thread-safe token bucket: ``per_minute`` calls per minute, bursts up to the same."""
+
+    def __init__(self, per_minute: int) -> None:
+        self._capacity = float(per_minute)
+        self._rate = per_minute / 60.0  # tokens per second
+        self._tokens = self._capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Block until a call is allowed, then consume one token."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(
+                    self._capacity, self._tokens + (now - self._updated) * self._rate
+                )
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self._rate
+            time.sleep(wait)
+
+
+@functools.cache
+def _shared_rate_limiter(per_minute: int) -> _RateLimiter:
+    """Return one limiter per limit, shared by every client in the process."""
+    return _RateLimiter(per_minute)
+
+
+# Batch API endpoint for post-processing requests
+_BATCH_ENDPOINT = "/v1/chat/completions"
+_BATCH_FINAL_STATUSES = frozenset({"completed", "failed", "expired", "cancelled"})
+# Default wait: the 24h completion window plus slack for the final status
+_BATCH_TIMEOUT = 25 * 3600.0
+
+
+def _supports_cache_control(base_url: str | None) -> bool:
+    """Check whether the provider honours explicit ``cache_control`` markers.
+
+    OpenAI caches prompt prefixes automatically; Anthropic only caches
+    content blocks marked with ``cache_control``.
+    """
+    return bool(base_url) and "anthropic.com" in base_url.lower()
+
+
+def _cacheable_text(text: str) -> list[dict]:
+    """Wrap text in a content block marked for ephemeral prompt caching."""
+    return [{"type": "text", "text": text, "cache_control": {"type": "ephemeral"}}]
+
+
 class LLMClient:
     """OpenAI-compatible LLM client for post-processing.
 
@@ -39,15 +99,23 @@ class LLMClient:
         base_url: str | None = None,
         model: str | None = None,
         temperature: float | None = None,
+        max_requests_per_minute: int | None = None,
     ) -> None:
         """Initialize LLM client.
 
+        Rate-limit errors are retried with exponential backoff by the
+        OpenAI SDK (honouring Retry-After). A requests-per-minute limit
+        additionally paces calls up front; clients with the same limit
+        share one budget, so concurrent videos stay under it together.
+
         Args:
             api_key: API key. Defaults to POSTPROCESS_API_KEY from config.
             base_url: Base URL for API. Defaults to POSTPROCESS_BASE_URL from config.
                       If None, uses OpenAI's default URL.
             model: Model name. Defaults to POSTPROCESS_MODEL from config.
             temperature: Sampling temperature. Defaults to POSTPROCESS_TEMPERATURE from config.
+            max_requests_per_minute: Request rate limit, 0 for none.
+                Defaults to POSTPROCESS_MAX_RPM from config.
 
         Raises:
             GLMClientError: If API key is not set.
@@ -64,6 +132,11 @@ class LLMClient:
         self.model = model if model is not None else DEFAULT_POSTPROCESS_MODEL
         self.temperature = temperature if temperature is not None else DEFAULT_POSTPROCESS_TEMPERATURE
 
+        self._cache_control = _supports_cache_control(base_url)
+
+        rpm = max_requests_per_minute if max_requests_per_minute is not None else POSTPROCESS_MAX_RPM
+        self._rate_limiter = _shared_rate_limiter(rpm) if rpm > 0 else None
+
         self._client = OpenAI(
             api_key=api_key,
             base_url=base_url,
@@ -73,12 +146,22 @@ class LLMClient:
         self,
         prompt: str,
         system_prompt: str | None = None,
+        cacheable_system: bool = True,
+        prompt_prefix: str = "",
     ) -> str:
         """Execute chat completion.
 
+        The system prompt and then prompt_prefix are always sent first so
+        providers can reuse the cached prefix across calls.
+
         Args:
-            prompt: User prompt.
+            prompt: User prompt (the part that changes between calls).
             system_prompt: Optional system prompt.
+            cacheable_system: Mark the static parts (system prompt and
+                prompt_prefix) for prompt caching on providers that need
+                explicit markers (Anthropic).
+            prompt_prefix: Static start of the user prompt, sent right
+                before prompt in the same message.
 
         Returns:
             Generated text response.
@@ -86,10 +169,10 @@ class LLMClient:
         Raises:
             GLMClientError: If API call fails.
         """
-        messages = []
-        if system_prompt:
-            messages.append({"role": "system", "content": system_prompt})
-        messages.append({"role": "user", "content": prompt})
+        messages = self._build_messages(prompt, system_prompt, cacheable_system, prompt_prefix)
+
+        if self._rate_limiter:
+            self._rate_limiter.acquire()
 
         try:
             response = self._client.chat.completions.create(
@@ -108,6 +191,164 @@ class LLMClient:
         except Exception as e:
             raise GLMClientError(f"Unexpected error: {e}")
 
+    def _build_messages(
+        self,
+        prompt: str,
+        system_prompt: str | None,
+        cacheable_system: bool,
+        prompt_prefix: str,
+    ) -> list[dict]:
+        """Build the chat messages for complete() and batch_request()."""
+        mark_cacheable = cacheable_system and self._cache_control
+        messages: list[dict] = []
+        if system_prompt:
+            messages.append({
+                "role": "system",
+                "content": _cacheable_text(system_prompt) if mark_cacheable else system_prompt,
+            })
+        if mark_cacheable and prompt_prefix:
+            user_content: str | list[dict] = [
+                *_cacheable_text(prompt_prefix),
+                {"type": "text", "text": prompt},
+            ]
+        else:
+            user_content = prompt_prefix + prompt
+        messages.append({"role": "user", "content": user_content})
+        return messages
+
+    def batch_request(
+        self,
+        custom_id: str,
+        prompt: str,
+        system_prompt: str | None = None,
+        prompt_prefix: str = "",
+    ) -> dict:
+        """Build one Batch API input line for a chat completion.
+
+        Args:
+            custom_id: Identifier echoed back in the batch output.
+            prompt: User prompt (see complete()).
+            system_prompt: Optional system prompt.
+            prompt_prefix: Static start of the user prompt.
+
+        Returns:
+            Request object to write as a line of the batch input JSONL.
+        """
+        return {
+            "custom_id": custom_id,
+            "method": "POST",
+            "url": _BATCH_ENDPOINT,
+            "body": {
+                "model": self.model,
+                "messages": self._build_messages(prompt, system_prompt, True, prompt_prefix),
+                "temperature": self.temperature,
+            },
+        }
+
+    def submit_batch(self, batch_file: str | Path) -> str:
+        """Upload a batch input file and start the batch.
+
+        Batches complete within 24 hours at a lower price than
+        synchronous calls; use them for backlogs that aren't urgent.
+
+        Args:
+            batch_file: JSONL file of batch_request() lines.
+
+        Returns:
+            Batch ID to pass to wait_for_batch().
+
+        Raises:
+            GLMClientError: If the upload or batch creation fails.
+        """
+        try:
+            with open(batch_file, "rb") as f:
+                input_file = self._client.files.create(file=f, purpose="batch")
+            batch = self._client.batches.create(
+                input_file_id=input_file.id,
+                endpoint=_BATCH_ENDPOINT,
+                completion_window="24h",
+            )
+        except APIError as e:
+            raise GLMClientError(f"Failed to submit batch: {e}") from e
+        return batch.id
+
+    def wait_for_batch(
+        self,
+        batch_id: str,
+        poll_interval: float = 60.0,
+        timeout: float | None = _BATCH_TIMEOUT,
+    ) -> dict[str, str]:
+        """Wait for a batch to finish and return its completions.
+
+        Args:
+            batch_id: ID returned by submit_batch().
+            poll_interval: Seconds between status checks.
+            timeout: Seconds to wait for a final status before giving up
+                (None waits indefinitely).
+
+        Returns:
+            Mapping of custom_id to generated text, for every request
+            that succeeded.
+
+        Raises:
+            GLMClientError: If the batch fails, expires, is cancelled or
+                doesn't finish within timeout, an API call fails, or the
+                output contains a malformed result.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        try:
+            batch = self._client.batches.retrieve(batch_id)
+            while batch.status not in _BATCH_FINAL_STATUSES:
+                wait = poll_interval
+                if deadline is not None:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        raise GLMClientError(
+                            f"Batch {batch_id} still {batch.status!r} after {timeout:g}s"
+                        )
+                    wait = min(wait, remaining)
+                time.sleep(wait)
+                batch = self._client.batches.retrieve(batch_id)
+
+            if batch.status != "completed":
+                raise GLMClientError(f"Batch {batch_id} ended with status {batch.status!r}")
+            if not batch.output_file_id:
+                return {}
+            output = self._client.files.content(batch.output_file_id).text
+        except APIError as e:
+            raise GLMClientError(f"Failed to retrieve batch {batch_id}: {e}") from e
+
+        results: dict[str, str] = {}
+        for line_no, line in enumerate(output.splitlines(), start=1):
+            if not line.strip():
+                continue
+            custom_id = None
+            try:
+                record = json.loads(line)
+                custom_id = record.get("custom_id")
+                response = record.get("response") or {}
+                if response.get("status_code") != 200:
+                    continue
+                results[record["custom_id"]] = (
+                    response["body"]["choices"][0]["message"]["content"] or ""
+                )
+            except (ValueError, LookupError, TypeError, AttributeError) as e:
+                raise GLMClientError(
+                    f"Malformed result for request {custom_id!r} in batch {batch_id} "
+                    f"(line {line_no}): {e!r}"
+                ) from e
+        return results
+
+    def close(self) -> None:
+        """Close the underlying HTTP connection pool."""
+        self._client.close()
+
+    def __enter__(self) -> "LLMClient":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
 
 # Backward compatibility alias
 GLMClient = LLMClient
@@ -1,8 +1,10 @@
 """Filename utilities for AI-suggested filenames."""
 
+import os
 import re
 import time
-from pathlib import Path
+import unicodedata
+from pathlib import Path, PurePosixPath
 from typing import Final
 
 # Characters invalid in filenames (Windows + Linux + macOS)
@@ -17,6 +19,15 @@ RESERVED_NAMES: Final = {
 }
 MAX_FILENAME_LENGTH: Final = 255  # Common filesystem limit
 
+# str.translate table: drop control characters, replace invalid ones with "_"
+_SANITIZE_TABLE: Final = {ord(c): None for c in CONTROL_CHARS} | {
+    ord(c): ord('_') for c in INVALID_CHARS
+}
+
+# FILENAME marker the LLM appends: <!-- FILENAME: name.md -->
+_EXTRACT_RE: Final = re.compile(r'<!--\s*FILENAME:\s*([^\n]+?)\s*-->', re.IGNORECASE)
+_STRIP_RE: Final = re.compile(r'\n?<!--\s*FILENAME:.+?-->\s*$', re.IGNORECASE)
+
 
 def extract_filename_from_response(response: str) -> str | None:
     """Extract filename from HTML comment in LLM response.
@@ -35,8 +46,7 @@ def extract_filename_from_response(response: str) -> str | None:
         >>> extract_filename_from_response("No filename here")
         None
     """
-    pattern = r'<!--\s*FILENAME:\s*([^\n]+?)\s*-->'
-    match = re.search(pattern, response, re.IGNORECASE)
+    match = _EXTRACT_RE.search(response)
     if match:
         filename = match.group(1).strip()
         # Remove any path components (keep only basename)
@@ -57,8 +67,7 @@ def strip_filename_marker(response: str) -> str:
         >>> strip_filename_marker("Content...\\n\\n<!-- FILENAME: test.md -->")
         'Content...'
     """
-    pattern = r'\n?<!--\s*FILENAME:.+?-->\s*$'
-    return re.sub(pattern, '', response, flags=re.IGNORECASE).strip()
+    return _STRIP_RE.sub('', response).strip()
 
 
 def sanitize_filename(filename: str) -> str:
@@ -78,34 +87,31 @@ def sanitize_filename(filename: str) -> str:
         >>> sanitize_filename("../../etc/passwd")
         'passwd'
     """
-    # Remove control characters
-    filename = ''.join(c for c in filename if c not in CONTROL_CHARS)
-
-    # Replace invalid chars with underscore
-    filename = ''.join(c if c not in INVALID_CHARS else '_' for c in filename)
+    # Remove control characters, replace invalid chars with underscore
+    filename = filename.translate(_SANITIZE_TABLE)
 
     # Remove leading/trailing spaces and dots
     filename = filename.strip('. ')
 
-    # Prevent path traversal - keep only basename
-    filename = str(Path(filename).name)
+    # Prevent path traversal - keep only basename. Parsed once: separators
+    # are already replaced, so POSIX rules apply on every platform
+    path = PurePosixPath(filename)
+    filename, stem, ext = path.name, path.stem, path.suffix
 
     # Check for reserved names (case-insensitive)
-    name_without_ext = Path(filename).stem.upper()
-    if name_without_ext in RESERVED_NAMES:
+    if stem.upper() in RESERVED_NAMES:
         filename = f"_{filename}"
+        stem = f"_{stem}"
 
     # Limit length (reserve space for extension and collision suffix)
     max_len = MAX_FILENAME_LENGTH - 20  # Reserve for .md and _999 suffix
     if len(filename) > max_len:
         # Truncate from start, preserve extension
-        stem = Path(filename).stem
-        ext = Path(filename).suffix
         stem = stem[:max_len - len(ext)]
         filename = stem + ext
 
     # Ensure .md extension
-    if not Path(filename).suffix:
+    if not ext:
         filename = f"{filename}.md"
 
     return filename
@@ -135,6 +141,11 @@ def validate_filename(filename: str) -> bool:
     return True
 
 
+def _name_key(name: str) -> str:
+    """Return the key under which a filesystem may consider names equal."""
+    return unicodedata.normalize("NFC", name).casefold()
+
+
 def resolve_collision(output_dir: Path, filename: str) -> Path:
     """Resolve filename collision by adding numeric suffix.
 
@@ -152,10 +163,18 @@ def resolve_collision(output_dir: Path, filename: str) -> Path:
         >>> resolve_collision(Path("/tmp"), "test.md")
         Path('/tmp/test_1.md')
     """
-    output_path = output_dir / filename
-
-    if not output_path.exists():
-        return output_path
+    # One directory read instead of a stat per candidate. Names are
+    # compared normalized and case-folded, so a file that exists on a
+    # case-insensitive or normalizing filesystem (macOS, Windows) is never
+    # missed; at worst a suffix is added that wasn't strictly needed.
+    try:
+        with os.scandir(output_dir) as entries:
+            existing = {_name_key(entry.name) for entry in entries}
+    except FileNotFoundError:
+        existing = set()
+
+    if _name_key(filename) not in existing:
+        return output_dir / filename
 
     stem = Path(filename).stem
     ext = Path(filename).suffix
@@ -163,9 +182,8 @@ def resolve_collision(output_dir: Path, filename: str) -> Path:
     counter = 1
     while counter < 1000:  # Prevent infinite loop
         new_filename = f"{stem}_{counter}{ext}"
-        new_path = output_dir / new_filename
-        if not new_path.exists():
-            return new_path
+        if _name_key(new_filename) not in existing:
+            return output_dir / new_filename
         counter += 1
 
     # Fallback: use timestamp
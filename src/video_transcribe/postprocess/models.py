@@ -3,7 +3,7 @@
 from dataclasses import dataclass, field
 
 
-@dataclass
+@dataclass(slots=True)
 class PostprocessResult:
     """Result of text transformation via LLM.
 
@@ -1,10 +1,17 @@
 """Text processing logic for post-processing transcripts."""
 
+import functools
+import json
 import re
+import string
+from collections.abc import Callable, Sequence
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
+from typing import Any
 
-from video_transcribe.postprocess.client import GLMClient
+from video_transcribe.files import atomic_write
+from video_transcribe.postprocess.client import _BATCH_TIMEOUT, GLMClient
 from video_transcribe.postprocess.prompts import get_preset, PromptPreset, PromptTemplate
 from video_transcribe.postprocess.models import PostprocessResult
 from video_transcribe.transcribe.models import TranscriptionResult, TranscriptionSegment
@@ -13,11 +20,69 @@ from video_transcribe.postprocess import filename
 
 
 class _SafeDict(dict):
-    """Dict that returns empty string for missing keys (optional placeholders)."""
+    """Placeholder values computed on first use; unknown keys format as "".
 
-    def __missing__(self, key: str) -> str:
-        """Return empty string for missing placeholder keys."""
-        return ""
+    Each value is a zero-argument callable, so templates only pay for the
+    placeholders they actually contain (formatting every segment is
+    expensive on long transcripts).
+    """
+
+    def __init__(self, factories: dict[str, Callable[[], object]]) -> None:
+        super().__init__()
+        self._factories = factories
+
+    def __missing__(self, key: str) -> object:
+        """Compute and memoize a known placeholder, or return ""."""
+        factory = self._factories.get(key)
+        if factory is None:
+            return ""
+        value = self[key] = factory()
+        return value
+
+
+_FORMATTER = string.Formatter()
+
+# (literal_text, field_name, format_spec, conversion) tuples
+_ParsedTemplate = tuple[tuple[str, str | None, str | None, str | None], ...]
+
+
+@functools.lru_cache(maxsize=32)
+def _parse_template(template: str) -> _ParsedTemplate:
+    """Parse a format string once; presets are rendered for every video."""
+    return tuple(_FORMATTER.parse(template))
+
+
+def _render(template: str, values: dict[str, Any]) -> str:
+    """Render template like str.format_map(values), reusing its parse.
+
+    Supports the same syntax: escaped braces, attribute/index access,
+    conversions and (nested) format specs.
+    """
+    parts = []
+    for literal, field_name, format_spec, conversion in _parse_template(template):
+        parts.append(literal)
+        if field_name is None:
+            continue
+        value, _ = _FORMATTER.get_field(field_name, (), values)
+        value = _FORMATTER.convert_field(value, conversion)
+        if format_spec and "{" in format_spec:
+            format_spec = _render(format_spec, values)
+        parts.append(format(value, format_spec or ""))
+    return "".join(parts)
+
+
+def _static_head(template: str) -> str:
+    """Return the template's literal text before its first placeholder.
+
+    Escaped braces are unescaped, so the result is a prefix of the
+    formatted template.
+    """
+    head = []
+    for literal, field_name, _, _ in _parse_template(template):
+        head.append(literal)
+        if field_name is not None:
+            break
+    return "".join(head)
 
 
 class TextProcessor:
@@ -26,11 +91,26 @@ class TextProcessor:
     def __init__(self, client: GLMClient | None = None) -> None:
         """Initialize processor.
 
+        The client keeps HTTP connections alive between calls, so reuse
+        one processor for many process() calls rather than creating one
+        per transcript; close it (or use it as a context manager) when
+        done.
+
         Args:
             client: GLM client. If None, creates default instance.
         """
         self.client = client or GLMClient()
 
+    def close(self) -> None:
+        """Close the client's HTTP connection pool."""
+        self.client.close()
+
+    def __enter__(self) -> "TextProcessor":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
     def process(
         self,
         transcript: TranscriptionResult,
@@ -41,6 +121,12 @@ class TextProcessor:
     ) -> PostprocessResult:
         """Transform transcript using preset or custom template.
 
+        The static system prompt is sent first, followed by the user
+        template's text up to its first placeholder; together they form a
+        stable prefix that providers can cache between calls. Custom
+        templates should therefore put fixed instructions before
+        {transcript} and other placeholders.
+
         Args:
             transcript: Transcription result to transform.
             preset: Prompt preset to use (ignored if custom_template is provided).
@@ -55,6 +141,98 @@ class TextProcessor:
             PromptTemplateError: If template formatting fails.
             GLMClientError: If LLM call fails.
         """
+        system_prompt, static_head, dynamic_prompt = self._build_prompt(
+            transcript, preset, smart_filename, custom_template, video_filename
+        )
+        raw_output = self.client.complete(
+            prompt=dynamic_prompt,
+            system_prompt=system_prompt,
+            prompt_prefix=static_head,
+        )
+        return self._make_result(raw_output, preset, smart_filename)
+
+    def enqueue(
+        self,
+        transcript: TranscriptionResult,
+        batch_file: str | Path,
+        custom_id: str,
+        preset: PromptPreset = PromptPreset.MEETING,
+        smart_filename: bool = False,
+        custom_template: PromptTemplate | None = None,
+        video_filename: str | None = None,
+    ) -> None:
+        """Append a request for this transcript to a Batch API input file.
+
+        Offline alternative to process() for large backlogs: collect
+        requests with enqueue(), start them with client.submit_batch()
+        and fetch the results with collect_batch().
+
+        Args:
+            transcript: Transcription result to transform.
+            batch_file: JSONL file to append to (created if missing).
+            custom_id: Unique ID for this request within the batch.
+            preset: Prompt preset to use (ignored if custom_template is provided).
+            smart_filename: Ask for an AI-suggested filename.
+            custom_template: Optional custom prompt template.
+            video_filename: Original filename without extension (for placeholders).
+
+        Raises:
+            PromptTemplateError: If template formatting fails.
+        """
+        system_prompt, static_head, dynamic_prompt = self._build_prompt(
+            transcript, preset, smart_filename, custom_template, video_filename
+        )
+        request = self.client.batch_request(
+            custom_id,
+            prompt=dynamic_prompt,
+            system_prompt=system_prompt,
+            prompt_prefix=static_head,
+        )
+        with open(batch_file, "a", encoding="utf-8") as f:
+            f.write(json.dumps(request, ensure_ascii=False) + "\n")
+
+    def collect_batch(
+        self,
+        batch_id: str,
+        preset: PromptPreset = PromptPreset.MEETING,
+        smart_filename: bool = False,
+        poll_interval: float = 60.0,
+        timeout: float | None = _BATCH_TIMEOUT,
+    ) -> dict[str, PostprocessResult]:
+        """Wait for a submitted batch and turn its output into results.
+
+        Args:
+            batch_id: ID returned by client.submit_batch().
+            preset: Preset the requests were enqueued with.
+            smart_filename: Whether the requests asked for a filename.
+            poll_interval: Seconds between status checks.
+            timeout: Seconds to wait for the batch (None waits indefinitely).
+
+        Returns:
+            Mapping of custom_id to PostprocessResult for every request
+            that succeeded.
+
+        Raises:
+            GLMClientError: If the batch fails, times out, cannot be
+                retrieved or returns malformed output.
+        """
+        outputs = self.client.wait_for_batch(
+            batch_id, poll_interval=poll_interval, timeout=timeout
+        )
+        return {
+            custom_id: self._make_result(raw_output, preset, smart_filename)
+            for custom_id, raw_output in outputs.items()
+        }
+
+    def _build_prompt(
+        self,
+        transcript: TranscriptionResult,
+        preset: PromptPreset,
+        smart_filename: bool,
+        custom_template: PromptTemplate | None,
+        video_filename: str | None,
+    ) -> tuple[str, str, str]:
+        """Build (system prompt, static user prefix, dynamic user prompt)."""
         # 1. Get prompt template
         if custom_template:
             template = custom_template
@@ -87,17 +265,23 @@ class TextProcessor:
         # 3. Format with transcript data
         user_prompt = self._format_prompt(template.user, transcript, video_filename)
 
-        # 4. Call LLM
-        raw_output = self.client.complete(
-            prompt=user_prompt,
-            system_prompt=template.system,
-        )
+        # 4. The text before the first placeholder is identical on every
+        # call and is sent as a cacheable prefix
+        static_head = _static_head(template.user)
+        return template.system, static_head, user_prompt[len(static_head):]
 
-        # 4. Extract token usage (if available)
+    def _make_result(
+        self,
+        raw_output: str,
+        preset: PromptPreset,
+        smart_filename: bool,
+    ) -> PostprocessResult:
+        """Wrap LLM output in a PostprocessResult, extracting the filename."""
+        # 1. Extract token usage (if available)
         input_tokens = None
         output_tokens = None
 
-        # 5. Extract suggested filename (if enabled)
+        # 2. Extract suggested filename (if enabled)
         suggested_filename = None
         if smart_filename:
             suggested_filename = filename.extract_filename_from_response(raw_output)
@@ -109,7 +293,7 @@ class TextProcessor:
                     # Remove the FILENAME comment from output
                     raw_output = filename.strip_filename_marker(raw_output)
 
-        # 6. Return result
+        # 3. Return result
         return PostprocessResult(
             preset_name=preset.value if preset else "custom",
             raw_output=raw_output,
@@ -119,6 +303,75 @@ class TextProcessor:
             suggested_filename=suggested_filename,
         )
 
+    def process_many(
+        self,
+        transcripts: Sequence[TranscriptionResult],
+        max_workers: int = 10,
+        **kwargs: Any,
+    ) -> list[PostprocessResult]:
+        """Transform several transcripts concurrently.
+
+        LLM calls are network-bound, so up to ``max_workers`` of them run
+        at once on a thread pool sharing this processor's client.
+
+        Args:
+            transcripts: Transcription results to transform.
+            max_workers: Maximum concurrent LLM calls.
+            **kwargs: Passed to process() for every transcript (preset,
+                smart_filename, custom_template, ...).
+
+        Returns:
+            One PostprocessResult per transcript, in input order.
+
+        Raises:
+            ValueError: If max_workers < 1.
+            PromptTemplateError: If template formatting fails.
+            GLMClientError: If an LLM call fails (the first failure in
+                input order is raised).
+        """
+        if max_workers < 1:
+            raise ValueError(f"max_workers must be at least 1, got {max_workers}")
+        if not transcripts:
+            return []
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(transcripts))) as executor:
+            return list(executor.map(lambda t: self.process(t, **kwargs), transcripts))
+
+    def process_multi(
+        self,
+        transcript: TranscriptionResult,
+        presets: Sequence[PromptPreset],
+        **kwargs: Any,
+    ) -> dict[PromptPreset, PostprocessResult]:
+        """Transform one transcript with several presets concurrently.
+
+        Each preset is an independent LLM call; they run in parallel on a
+        thread pool sharing this processor's client.
+
+        Args:
+            transcript: Transcription result to transform.
+            presets: Presets to apply (duplicates are run once).
+            **kwargs: Passed to process() for every preset
+                (smart_filename, video_filename, ...).
+
+        Returns:
+            Mapping of preset to its result, in the order given.
+
+        Raises:
+            PromptTemplateError: If template formatting fails.
+            GLMClientError: If an LLM call fails.
+        """
+        unique_presets = list(dict.fromkeys(presets))
+        if not unique_presets:
+            return {}
+
+        with ThreadPoolExecutor(max_workers=len(unique_presets)) as executor:
+            results = executor.map(
+                lambda preset: self.process(transcript, preset=preset, **kwargs),
+                unique_presets,
+            )
+            return dict(zip(unique_presets, results))
+
     def _format_prompt(
         self,
         template: str,
@@ -151,24 +404,20 @@ class TextProcessor:
             Optional placeholders return empty string if not found in template.
             {transcript} is required and will raise an error if missing.
         """
-        duration_min = transcript.duration / 60 if transcript.duration else 0
-
-        # Format duration as HH:MM:SS
-        duration_formatted = self._format_duration(transcript.duration)
-
-        # Use SafeDict for optional placeholders (returns empty string if missing)
-        return template.format_map(_SafeDict({
-            "transcript": transcript.text,
-            "segments": self._format_segments(transcript.segments),
-            "speakers_info": self._extract_speakers_info(transcript.segments),
-            "duration": transcript.duration,
-            "duration_minutes": duration_min,
-            "duration_formatted": duration_formatted,
-            "model": transcript.model_used,
-            "date": datetime.now().strftime("%Y-%m-%d"),
-            "date_iso": datetime.now().strftime("%Y-%m-%d"),
-            "filename": video_filename or "",
-        }))
+        # SafeDict computes only the placeholders the template uses
+        values = _SafeDict({
+            "transcript": lambda: transcript.text,
+            "segments": lambda: self._format_segments(transcript.segments),
+            "speakers_info": lambda: self._extract_speakers_info(transcript.segments),
+            "duration": lambda: transcript.duration,
+            "duration_minutes": lambda: transcript.duration / 60 if transcript.duration else 0,
+            "duration_formatted": lambda: self._format_duration(transcript.duration),
+            "model": lambda: transcript.model_used,
+            "date": lambda: datetime.now().strftime("%Y-%m-%d"),
+            "date_iso": lambda: values["date"],
+            "filename": lambda: video_filename or "",
+        })
+        return _render(template, values)
 
     def _format_duration(self, seconds: float | None) -> str:
         """Format duration as HH:MM:SS.
@@ -195,12 +444,12 @@ class TextProcessor:
         Returns:
             Formatted string with one segment per line.
         """
-        lines = []
-        for seg in segments:
-            speaker = f"[{seg.speaker}] " if seg.speaker else ""
-            timestamp = f"({seg.start:.1f}-{seg.end:.1f}) "
-            lines.append(f"{timestamp}{speaker}{seg.text}")
-        return "\n".join(lines)
+        return "\n".join(
+            f"({seg.start:.1f}-{seg.end:.1f}) [{seg.speaker}] {seg.text}"
+            if seg.speaker
+            else f"({seg.start:.1f}-{seg.end:.1f}) {seg.text}"
+            for seg in segments
+        )
 
     def _extract_speakers_info(self, segments: list[TranscriptionSegment]) -> str:
         """Extract speakers statistics from segments.
@@ -240,10 +489,18 @@ class TextProcessor:
         """
         output_file = Path(output_path)
         output_file.parent.mkdir(parents=True, exist_ok=True)
-        output_file.write_text(result.raw_output, encoding="utf-8")
+        with atomic_write(output_file) as f:
+            f.write(result.raw_output)
         result.set_output_path(str(output_file))
 
 
+# Output file suffix per preset (replaces the transcript's .txt)
+_OUTPUT_SUFFIXES: dict[PromptPreset, str] = {
+    PromptPreset.MEETING: ".summary.md",
+    PromptPreset.SCREENCAST: ".screencast.md",
+}
+
+
 def save_postprocess_result(
     transcript_path: str,
     preset: PromptPreset,
@@ -280,18 +537,10 @@ def save_postprocess_result(
         final_output_dir = output_dir
 
     # Determine suffix based on preset
-    if preset == PromptPreset.MEETING:
-        suffix = ".summary.md"
-    elif preset == PromptPreset.SCREENCAST:
-        suffix = ".screencast.md"
-    else:
-        suffix = ".processed.md"
+    suffix = _OUTPUT_SUFFIXES.get(preset, ".processed.md")
 
-    # Remove .txt if present, add new suffix
-    if path.suffix == ".txt":
-        filename = path.with_suffix(suffix).name
-    else:
-        filename = path.with_suffix(path.suffix + suffix).name
+    # Replace .txt if present, otherwise append the new suffix
+    stem = path.stem if path.suffix == ".txt" else path.name
 
     # Return full path in output directory
-    return str(final_output_dir / filename)
+    return str(final_output_dir / f"{stem}{suffix}")
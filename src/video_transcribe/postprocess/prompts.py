@@ -1,6 +1,11 @@
 """Built-in prompt presets for post-processing."""
 
+import functools
+import os
+import re
+import textwrap
 from pathlib import Path
+from typing import Any
 from dataclasses import dataclass
 from enum import Enum
 
@@ -13,7 +18,7 @@ class PromptPreset(str, Enum):
     SCREENCAST = "screencast"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class PromptTemplate:
     """Prompt template with system and user parts.
 
@@ -169,18 +174,22 @@ def get_preset(preset: PromptPreset) -> PromptTemplate:
     return PRESETS[preset]
 
 
-def list_presets() -> list[str]:
-    """Return list of available preset names.
+@functools.cache
+def list_presets() -> tuple[str, ...]:
+    """Return available preset names.
 
     Returns:
-        List of preset name strings.
+        Tuple of preset name strings (computed once).
     """
-    return [p.value for p in PromptPreset]
+    return tuple(p.value for p in PromptPreset)
 
 
 def load_prompt_file(path: str) -> PromptTemplate:
     """Load custom prompt from markdown file with YAML frontmatter.
 
+    Parsed templates are cached per file version, so processing a batch
+    of videos with one prompt file reads and parses it once.
+
     Args:
         path: Path to custom prompt file.
 
@@ -198,6 +207,15 @@ def load_prompt_file(path: str) -> PromptTemplate:
 
         User prompt with {transcript} placeholder
     """
+    stat = os.stat(path)
+    return _load_prompt_file_cached(
+        os.path.abspath(path), stat.st_mtime_ns, stat.st_size
+    )
+
+
+@functools.lru_cache(maxsize=32)
+def _load_prompt_file_cached(path: str, mtime_ns: int, size: int) -> PromptTemplate:
+    """Parse a prompt file; mtime_ns and size key the cache to its version."""
     content = Path(path).read_text(encoding="utf-8")
 
     # Parse frontmatter
@@ -219,8 +237,7 @@ def load_prompt_file(path: str) -> PromptTemplate:
             "   File must contain exactly two --- delimiters"
         )
 
-    import yaml
-    frontmatter = yaml.safe_load(parts[1]) or {}
+    frontmatter = _parse_frontmatter(parts[1])
     user = parts[2].strip()
 
     system = frontmatter.get("system", "")
@@ -233,3 +250,49 @@ def load_prompt_file(path: str) -> PromptTemplate:
         )
 
     return PromptTemplate(system=system, user=user)
+
+
+_BLOCK_HEADER_RE = re.compile(r"system:[ ]*\|[ ]*")
+
+
+def _parse_frontmatter(text: str) -> dict[str, Any]:
+    """Parse prompt-file frontmatter.
+
+    The documented form, a lone ``system: |`` literal block, is parsed
+    directly; anything else falls back to PyYAML, so its import and
+    parser are only paid for unusual files.
+    """
+    system = _parse_system_block(text)
+    if system is not None:
+        return {"system": system}
+
+    import yaml
+    return yaml.safe_load(text) or {}
+
+
+def _parse_system_block(text: str) -> str | None:
+    """Return the value of a lone ``system: |`` block, or None if not that form.
+
+    Matches YAML literal-block semantics with default chomping: lines are
+    dedented, trailing blank lines dropped and a single newline kept.
+    """
+    header, *body = text.strip("\n").split("\n")
+    if not _BLOCK_HEADER_RE.fullmatch(header):
+        return None
+    block_indent: int | None = None
+    for line in body:
+        if not line.strip():
+            continue
+        indent = line[:len(line) - len(line.lstrip())]
+        if not indent or "\t" in indent:
+            return None  # another key, or tab indentation: let YAML decide
+        if block_indent is None:
+            block_indent = len(indent)  # The first line sets the block's indent
+        elif len(indent) < block_indent:
+            return None  # Less indented than the first line: YAML rejects it
+
+    while body and not body[-1].strip():
+        body.pop()
+    if not body:
+        return ""
+    return textwrap.dedent("\n".join(body)) + "\n"
@@ -0,0 +1,204 @@
+"""Tests for video_transcribe.postprocess.client module."""
+
+from unittest.mock import MagicMock
+
+import pytest
+from pytest_mock import MockerFixture
+
+from video_transcribe.postprocess.client import LLMClient, _RateLimiter
+from video_transcribe.postprocess.exceptions import GLMClientError
+
+
+@pytest.fixture
+def mock_openai(mocker: MockerFixture) -> MagicMock:
+    """Patch the OpenAI SDK class used by LLMClient."""
+    openai_cls = mocker.patch("video_transcribe.postprocess.client.OpenAI")
+    response = MagicMock()
+    response.choices[0].message.content = "summary"
+    openai_cls.return_value.chat.completions.create.return_value = response
+    return openai_cls
+
+
+def _sent_messages(mock_openai: MagicMock) -> list[dict]:
+    return mock_openai.return_value.chat.completions.create.call_args.kwargs["messages"]
+
+
+class TestLLMClientComplete:
+    """Test suite for LLMClient.complete() prompt caching."""
+
+    def test_system_prompt_is_plain_string_for_openai(self, mock_openai: MagicMock) -> None:
+        """Test that OpenAI-style providers get the system prompt unchanged first.
+
+        Given: A client for an OpenAI-compatible base URL
+        When: complete() is called with a system prompt
+        Then: The system message comes first with plain string content
+        """
+        # Arrange
+        client = LLMClient(api_key="key", base_url="https://api.z.ai/api/coding/paas/v4")
+
+        # Act
+        result = client.complete("transcript", system_prompt="static rules")
+
+        # Assert
+        assert result == "summary"
+        assert _sent_messages(mock_openai) == [
+            {"role": "system", "content": "static rules"},
+            {"role": "user", "content": "transcript"},
+        ]
+
+    def test_system_prompt_marked_for_anthropic(self, mock_openai: MagicMock) -> None:
+        """Test that Anthropic gets an ephemeral cache_control marker."""
+        # Arrange
+        client = LLMClient(api_key="key", base_url="https://api.anthropic.com/v1/")
+
+        # Act
+        client.complete("transcript", system_prompt="static rules")
+
+        # Assert
+        assert _sent_messages(mock_openai)[0] == {
+            "role": "system",
+            "content": [{
+                "type": "text",
+                "text": "static rules",
+                "cache_control": {"type": "ephemeral"},
+            }],
+        }
+
+    def test_prompt_prefix_marked_for_anthropic(self, mock_openai: MagicMock) -> None:
+        """Test that the static prompt prefix gets its own cached block."""
+        # Arrange
+        client = LLMClient(api_key="key", base_url="https://api.anthropic.com/v1/")
+
+        # Act
+        client.complete("transcript", system_prompt="rules", prompt_prefix="Summarize:\n")
+
+        # Assert
+        assert _sent_messages(mock_openai)[1] == {
+            "role": "user",
+            "content": [
+                {"type": "text", "text": "Summarize:\n", "cache_control": {"type": "ephemeral"}},
+                {"type": "text", "text": "transcript"},
+            ],
+        }
+
+    def test_prompt_prefix_joined_for_openai(self, mock_openai: MagicMock) -> None:
+        """Test that OpenAI-style providers get prefix and prompt as one string."""
+        # Arrange
+        client = LLMClient(api_key="key", base_url=None)
+
+        # Act
+        client.complete("transcript", prompt_prefix="Summarize:\n")
+
+        # Assert
+        assert _sent_messages(mock_openai) == [
+            {"role": "user", "content": "Summarize:\ntranscript"},
+        ]
+
+    def test_cacheable_system_can_be_disabled(self, mock_openai: MagicMock) -> None:
+        """Test that cacheable_system=False sends a plain system prompt."""
+        # Arrange
+        client = LLMClient(api_key="key", base_url="https://api.anthropic.com/v1/")
+
+        # Act
+        client.complete("transcript", system_prompt="static rules", cacheable_system=False)
+
+        # Assert
+        assert _sent_messages(mock_openai)[0] == {"role": "system", "content": "static rules"}
+
+
+class TestRateLimiter:
+    """Test suite for _RateLimiter."""
+
+    def test_waits_once_burst_is_spent(self, mocker: MockerFixture) -> None:
+        """Test that calls beyond the burst wait for the bucket to refill.
+
+        Given: A 60/min limiter (one token per second) on a frozen clock
+        When: 61 calls are made
+        Then: The first 60 pass immediately, the 61st sleeps about a second
+        """
+        # Arrange
+        clock = [100.0]
+        mocker.patch("video_transcribe.postprocess.client.time.monotonic", side_effect=lambda: clock[0])
+        sleep = mocker.patch(
+            "video_transcribe.postprocess.client.time.sleep",
+            side_effect=lambda seconds: clock.__setitem__(0, clock[0] + seconds),
+        )
+        limiter = _RateLimiter(60)
+
+        # Act
+        for _ in range(61):
+            limiter.acquire()
+
+        # Assert
+        sleep.assert_called_once()
+        assert sleep.call_args.args[0] == pytest.approx(1.0)
+
+    def test_client_shares_limiter_per_limit(self, mock_openai: MagicMock) -> None:
+        """Test that clients with the same limit share one bucket."""
+        # Act
+        first = LLMClient(api_key="key", max_requests_per_minute=30)
+        second = LLMClient(api_key="key", max_requests_per_minute=30)
+        unlimited = LLMClient(api_key="key", max_requests_per_minute=0)
+
+        # Assert
+        assert first._rate_limiter is second._rate_limiter
+        assert unlimited._rate_limiter is None
+
+
+class TestWaitForBatch:
+    """Test suite for LLMClient.wait_for_batch()."""
+
+    def test_times_out_on_stuck_batch(self, mock_openai: MagicMock, mocker: MockerFixture) -> None:
+        """Test that a batch that never finishes raises once the deadline passes.
+
+        Given: A batch stuck in_progress and a 90 s timeout on a fake clock
+        When: wait_for_batch() polls every 60 s
+        Then: It sleeps 60 s, then the remaining 30 s, then raises
+        """
+        # Arrange
+        clock = [0.0]
+        mocker.patch("video_transcribe.postprocess.client.time.monotonic", side_effect=lambda: clock[0])
+        sleep = mocker.patch(
+            "video_transcribe.postprocess.client.time.sleep",
+            side_effect=lambda seconds: clock.__setitem__(0, clock[0] + seconds),
+        )
+        mock_openai.return_value.batches.retrieve.return_value = MagicMock(status="in_progress")
+
+        # Act & Assert
+        with pytest.raises(GLMClientError, match="batch_1 still 'in_progress' after 90s"):
+            LLMClient(api_key="key").wait_for_batch("batch_1", poll_interval=60, timeout=90)
+        assert [c.args[0] for c in sleep.call_args_list] == [60, 30]
+
+    @pytest.mark.parametrize(
+        "line",
+        [
+            "not json",
+            '{"custom_id": "req-1", "response": {"status_code": 200, "body": {}}}',
+        ],
+        ids=["invalid-json", "missing-choices"],
+    )
+    def test_malformed_line_raises_client_error(self, mock_openai: MagicMock, line: str) -> None:
+        """Test that unparsable output lines become GLMClientError with context."""
+        # Arrange
+        sdk = mock_openai.return_value
+        sdk.batches.retrieve.return_value = MagicMock(status="completed", output_file_id="out")
+        sdk.files.content.return_value.text = line
+
+        # Act & Assert
+        with pytest.raises(GLMClientError, match="in batch batch_1 \\(line 1\\)") as exc_info:
+            LLMClient(api_key="key").wait_for_batch("batch_1", poll_interval=0)
+        if "req-1" in line:
+            assert "'req-1'" in str(exc_info.value)
+
+
+class TestLLMClientClose:
+    """Test suite for LLMClient connection cleanup."""
+
+    def test_context_manager_closes_sdk_client(self, mock_openai: MagicMock) -> None:
+        """Test that leaving the with-block closes the SDK client."""
+        # Act
+        with LLMClient(api_key="key") as client:
+            client.complete("transcript")
+
+        # Assert
+        mock_openai.return_value.close.assert_called_once()
@@ -274,6 +274,30 @@ class TestResolveCollision:
         # Assert
         assert result.name == 'file_1.txt'
 
+    def test_resolve_collision_ignores_case(self, tmp_path: Path) -> None:
+        """Test that names differing only in case count as a collision.
+
+        Given: Notes.md exists
+        When: resolve_collision() is called for notes.md
+        Then: Returns notes_1.md (safe on case-insensitive filesystems)
+        """
+        # Arrange
+        (tmp_path / 'Notes.md').touch()
+
+        # Act
+        result = resolve_collision(tmp_path, 'notes.md')
+
+        # Assert
+        assert result == tmp_path / 'notes_1.md'
+
+    def test_resolve_collision_missing_dir(self, tmp_path: Path) -> None:
+        """Test that a not-yet-created output directory has no collisions."""
+        # Act
+        result = resolve_collision(tmp_path / 'missing', 'test.md')
+
+        # Assert
+        assert result == tmp_path / 'missing' / 'test.md'
+
 
 class TestGenerateSafeFilename:
     """Test suite for generate_safe_filename() function."""
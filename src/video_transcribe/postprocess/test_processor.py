@@ -0,0 +1,270 @@
+"""Tests for video_transcribe.postprocess.processor module."""
+
+import json
+import threading
+import time
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+from pytest_mock import MockerFixture
+
+from video_transcribe.postprocess.client import LLMClient
+from video_transcribe.postprocess.exceptions import GLMClientError
+from video_transcribe.postprocess.processor import (
+    TextProcessor,
+    _render,
+    _static_head,
+    save_postprocess_result,
+)
+from video_transcribe.postprocess.prompts import PromptPreset, PromptTemplate
+from video_transcribe.transcribe.models import TranscriptionResult, TranscriptionSegment
+
+
+def _make_transcript(text: str) -> TranscriptionResult:
+    return TranscriptionResult(
+        text=text,
+        duration=60.0,
+        segments=[],
+        model_used="gpt-4o-transcribe",
+        response_format="json",
+    )
+
+
+class TestProcessMany:
+    """Test suite for TextProcessor.process_many()."""
+
+    def test_returns_results_in_input_order_concurrently(self) -> None:
+        """Test that results keep input order while calls overlap.
+
+        Given: A client whose calls take longer for earlier transcripts
+        When: process_many() is called for three transcripts
+        Then: Results are in input order and calls ran concurrently
+        """
+        # Arrange
+        lock = threading.Lock()
+        active = peak = 0
+
+        def complete(prompt: str, **kwargs: object) -> str:
+            nonlocal active, peak
+            with lock:
+                active += 1
+                peak = max(peak, active)
+            time.sleep(0.05 if "first" in prompt else 0.01)
+            with lock:
+                active -= 1
+            return "summary of " + ("first" if "first" in prompt else "other")
+
+        client = MagicMock(model="gpt-5-mini")
+        client.complete.side_effect = complete
+        processor = TextProcessor(client=client)
+        transcripts = [_make_transcript(t) for t in ("first", "second", "third")]
+
+        # Act
+        results = processor.process_many(transcripts, max_workers=3, preset=PromptPreset.MEETING)
+
+        # Assert
+        assert [r.raw_output for r in results] == [
+            "summary of first",
+            "summary of other",
+            "summary of other",
+        ]
+        assert all(r.preset_name == "meeting" for r in results)
+        assert peak > 1
+
+    def test_rejects_non_positive_workers(self) -> None:
+        """Test that max_workers < 1 raises ValueError."""
+        processor = TextProcessor(client=MagicMock())
+        with pytest.raises(ValueError, match="max_workers must be at least 1"):
+            processor.process_many([_make_transcript("x")], max_workers=0)
+
+
+class TestProcessMulti:
+    """Test suite for TextProcessor.process_multi()."""
+
+    def test_runs_each_preset_once(self) -> None:
+        """Test that every distinct preset yields its own result."""
+        # Arrange
+        client = MagicMock(model="gpt-5-mini")
+        client.complete.side_effect = lambda prompt, **kwargs: kwargs["system_prompt"][:10]
+        processor = TextProcessor(client=client)
+        presets = [PromptPreset.SCREENCAST, PromptPreset.MEETING, PromptPreset.SCREENCAST]
+
+        # Act
+        results = processor.process_multi(_make_transcript("hello"), presets)
+
+        # Assert
+        assert list(results) == [PromptPreset.SCREENCAST, PromptPreset.MEETING]
+        assert {p: r.preset_name for p, r in results.items()} == {
+            PromptPreset.SCREENCAST: "screencast",
+            PromptPreset.MEETING: "meeting",
+        }
+        assert results[PromptPreset.MEETING].raw_output != results[PromptPreset.SCREENCAST].raw_output
+        assert client.complete.call_count == 2
+
+
+class TestBatch:
+    """Test suite for TextProcessor.enqueue() and collect_batch()."""
+
+    def test_enqueue_and_collect_round_trip(self, tmp_path: Path, mocker: MockerFixture) -> None:
+        """Test that enqueued requests come back as results by custom_id.
+
+        Given: Two transcripts enqueued into one batch file
+        When: The batch output is collected
+        Then: Each line is a chat-completions request and successful
+              outputs become PostprocessResults with the marker stripped
+        """
+        # Arrange
+        openai_cls = mocker.patch("video_transcribe.postprocess.client.OpenAI")
+        sdk = openai_cls.return_value
+        processor = TextProcessor(client=LLMClient(api_key="key", model="gpt-5-mini"))
+        batch_file = tmp_path / "batch.jsonl"
+
+        output_lines = [
+            {"custom_id": "a", "response": {"status_code": 200, "body": {"choices": [
+                {"message": {"content": "Summary A\n<!-- FILENAME: Встреча.md -->"}}
+            ]}}},
+            {"custom_id": "b", "response": {"status_code": 500, "body": {}}},
+        ]
+        sdk.batches.retrieve.return_value = MagicMock(status="completed", output_file_id="out")
+        sdk.files.content.return_value.text = "\n".join(json.dumps(line) for line in output_lines)
+
+        # Act
+        processor.enqueue(_make_transcript("first"), batch_file, "a", smart_filename=True)
+        processor.enqueue(_make_transcript("second"), batch_file, "b", smart_filename=True)
+        results = processor.collect_batch("batch_1", smart_filename=True, poll_interval=0)
+
+        # Assert
+        requests = [json.loads(line) for line in batch_file.read_text(encoding="utf-8").splitlines()]
+        assert [r["custom_id"] for r in requests] == ["a", "b"]
+        assert requests[0]["url"] == "/v1/chat/completions"
+        assert requests[0]["body"]["model"] == "gpt-5-mini"
+        assert "first" in requests[0]["body"]["messages"][-1]["content"]
+        assert list(results) == ["a"]
+        assert results["a"].raw_output == "Summary A"
+        assert results["a"].suggested_filename == "Встреча.md"
+
+    def test_failed_batch_raises(self, mocker: MockerFixture) -> None:
+        """Test that a batch ending in a non-completed state raises."""
+        # Arrange
+        openai_cls = mocker.patch("video_transcribe.postprocess.client.OpenAI")
+        openai_cls.return_value.batches.retrieve.return_value = MagicMock(status="expired")
+        processor = TextProcessor(client=LLMClient(api_key="key"))
+
+        # Act & Assert
+        with pytest.raises(GLMClientError, match="expired"):
+            processor.collect_batch("batch_1", poll_interval=0)
+
+
+class TestProcessPromptPrefix:
+    """Test suite for the cacheable prompt prefix in TextProcessor.process()."""
+
+    def test_sends_static_head_as_prefix(self) -> None:
+        """Test that the text before the first placeholder is sent as prefix.
+
+        Given: A custom template with fixed instructions before {transcript}
+        When: process() is called
+        Then: The instructions go in prompt_prefix and prefix + prompt is
+              the fully formatted template
+        """
+        # Arrange
+        client = MagicMock(model="gpt-5-mini")
+        client.complete.return_value = "summary"
+        template = PromptTemplate(system="rules", user="Use {{braces}}.\n{transcript}\nBye")
+
+        # Act
+        TextProcessor(client=client).process(_make_transcript("hello"), custom_template=template)
+
+        # Assert
+        kwargs = client.complete.call_args.kwargs
+        assert kwargs["prompt_prefix"] == "Use {braces}.\n"
+        assert kwargs["prompt"] == "hello\nBye"
+        assert kwargs["system_prompt"] == "rules"
+
+    def test_static_head_without_placeholders(self) -> None:
+        """Test that a template without placeholders is entirely static."""
+        assert _static_head("No {{fields}} here") == "No {fields} here"
+
+
+class TestFormatSegments:
+    """Test suite for TextProcessor._format_segments()."""
+
+    def test_formats_timestamps_and_optional_speaker(self) -> None:
+        """Test one line per segment, with the speaker tag only when known."""
+        # Arrange
+        segments = [
+            TranscriptionSegment(speaker="A", start=0.0, end=1.25, text="Привет"),
+            TranscriptionSegment(speaker=None, start=1.25, end=3.0, text="Hello"),
+        ]
+
+        # Act
+        formatted = TextProcessor(client=MagicMock())._format_segments(segments)
+
+        # Assert
+        assert formatted == "(0.0-1.2) [A] Привет\n(1.2-3.0) Hello"
+
+
+class TestFormatPrompt:
+    """Test suite for TextProcessor._format_prompt()."""
+
+    def test_only_used_placeholders_are_computed(self, mocker: MockerFixture) -> None:
+        """Test that unused placeholders are never formatted.
+
+        Given: A template using {transcript} and an unknown placeholder
+        When: _format_prompt() is called
+        Then: Segments are not formatted and the unknown one renders empty
+        """
+        # Arrange
+        processor = TextProcessor(client=MagicMock())
+        format_segments = mocker.spy(processor, "_format_segments")
+
+        # Act
+        prompt = processor._format_prompt(
+            "{transcript}|{unknown}|{duration_minutes:.1f}", _make_transcript("hi")
+        )
+
+        # Assert
+        assert prompt == "hi||1.0"
+        format_segments.assert_not_called()
+
+
+class TestRender:
+    """Test suite for _render()."""
+
+    @pytest.mark.parametrize(
+        "template",
+        [
+            "plain text",
+            "{{escaped}} {name}",
+            "{name!r} {number:>{width}.2f}",
+            "{items[0]} {name.upper}",
+            "tail {name}",
+        ],
+    )
+    def test_matches_format_map(self, template: str) -> None:
+        """Test that rendering is identical to str.format_map()."""
+        values = {"name": "Иван", "number": 3.14159, "width": 8, "items": ["x"]}
+        assert _render(template, values) == template.format_map(values)
+
+
+class TestSavePostprocessResult:
+    """Test suite for save_postprocess_result()."""
+
+    @pytest.mark.parametrize(
+        ("transcript_path", "preset", "output_dir", "expected"),
+        [
+            ("dir/meeting.txt", PromptPreset.MEETING, None, "dir/meeting.summary.md"),
+            ("tutorial.mp4.txt", PromptPreset.SCREENCAST, None, "tutorial.mp4.screencast.md"),
+            ("dir/meeting.json", PromptPreset.MEETING, None, "dir/meeting.json.summary.md"),
+            ("dir/meeting.txt", PromptPreset.MEETING, Path("out"), "out/meeting.summary.md"),
+        ],
+    )
+    def test_output_path(
+        self,
+        transcript_path: str,
+        preset: PromptPreset,
+        output_dir: Path | None,
+        expected: str,
+    ) -> None:
+        """Test that .txt is replaced by the preset suffix, other names kept."""
+        assert save_postprocess_result(transcript_path, preset, output_dir) == str(Path(expected))
@@ -0,0 +1,105 @@
+"""Tests for video_transcribe.postprocess.prompts module."""
+
+import os
+from pathlib import Path
+
+import pytest
+
+from video_transcribe.postprocess.exceptions import PromptTemplateError
+from video_transcribe.postprocess.prompts import _parse_frontmatter, load_prompt_file
+
+_PROMPT = """---
+system: |
+  You are a note taker.
+---
+
+Summarize: {transcript}
+"""
+
+
+class TestLoadPromptFile:
+    """Test suite for load_prompt_file()."""
+
+    def test_parses_frontmatter_and_user_prompt(self, tmp_path: Path) -> None:
+        """Test that system and user parts are split out of the file."""
+        # Arrange
+        prompt_file = tmp_path / "prompt.md"
+        prompt_file.write_text(_PROMPT, encoding="utf-8")
+
+        # Act
+        template = load_prompt_file(str(prompt_file))
+
+        # Assert
+        assert template.system == "You are a note taker.\n"
+        assert template.user == "Summarize: {transcript}"
+
+    def test_reloads_after_file_changes(self, tmp_path: Path) -> None:
+        """Test that the parse cache is invalidated when the file changes.
+
+        Given: A prompt file loaded twice without changes
+        When: The file is rewritten and loaded again
+        Then: Unchanged loads share one template, the rewrite is picked up
+        """
+        # Arrange
+        prompt_file = tmp_path / "prompt.md"
+        prompt_file.write_text(_PROMPT, encoding="utf-8")
+
+        # Act
+        first = load_prompt_file(str(prompt_file))
+        second = load_prompt_file(str(prompt_file))
+        prompt_file.write_text(_PROMPT.replace("Summarize", "Outline"), encoding="utf-8")
+        stat = prompt_file.stat()
+        os.utime(prompt_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        changed = load_prompt_file(str(prompt_file))
+
+        # Assert
+        assert second is first
+        assert changed.user == "Outline: {transcript}"
+
+    def test_missing_transcript_placeholder_raises(self, tmp_path: Path) -> None:
+        """Test that a prompt without {transcript} is rejected."""
+        # Arrange
+        prompt_file = tmp_path / "prompt.md"
+        prompt_file.write_text(_PROMPT.replace("{transcript}", ""), encoding="utf-8")
+
+        # Act & Assert
+        with pytest.raises(PromptTemplateError, match="transcript"):
+            load_prompt_file(str(prompt_file))
+
+
+class TestParseFrontmatter:
+    """Test suite for _parse_frontmatter()."""
+
+    @pytest.mark.parametrize(
+        "frontmatter",
+        [
+            "\nsystem: |\n  Line one.\n\n    Indented line.\n  Last: with colon # and hash\n\n",
+            "\nsystem: |\n",
+            "\nsystem: |\n    Deeply indented.\n",
+            "\nsystem: Inline value\n",
+            "\nsystem: |\n  Block\nextra: key\n",
+            "\nsystem: >\n  Folded\n  text\n",
+            "\n",
+        ],
+    )
+    def test_matches_yaml(self, frontmatter: str) -> None:
+        """Test that the fast path and the YAML fallback agree with PyYAML."""
+        import yaml
+
+        assert _parse_frontmatter(frontmatter) == (yaml.safe_load(frontmatter) or {})
+
+    def test_decreasing_indent_rejected_like_yaml(self) -> None:
+        """Test that a block whose indent drops after the first line is an error.
+
+        Given: A system block whose second line is less indented than the first
+        When: The frontmatter is parsed
+        Then: The YAML error surfaces, as PyYAML itself rejects the block
+        """
+        import yaml
+
+        frontmatter = "\nsystem: |\n    First line.\n  Second line.\n"
+
+        with pytest.raises(yaml.YAMLError):
+            yaml.safe_load(frontmatter)
+        with pytest.raises(yaml.YAMLError):
+            _parse_frontmatter(frontmatter)
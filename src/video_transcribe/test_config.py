@@ -1,15 +1,45 @@
 """Tests for video_transcribe.config module."""
 
-import importlib
+from collections.abc import Callable
+from types import ModuleType
 
 import pytest
 from _pytest.monkeypatch import MonkeyPatch
 
+_VALIDATED_ENV_VARS = (
+    "CHUNK_MAX_SIZE_MB",
+    "CHUNK_OVERLAP_SEC",
+    "CHUNK_MAX_DURATION_SEC",
+    "TRANSCRIBE_CONCURRENCY",
+    "AUDIO_FORMAT",
+    "POSTPROCESS_MAX_RPM",
+)
+
+
+@pytest.fixture
+def reload_config() -> Callable[[], ModuleType]:
+    """Return a function that resets config to pick up env changes."""
+    import video_transcribe.config
+
+    def reload() -> ModuleType:
+        video_transcribe.config.reload()
+        return video_transcribe.config
+
+    return reload
+
 
 class TestValidateConfig:
     """Test suite for config.validate_config() function."""
 
-    def test_validate_chunk_overlap_negative_raises(self, monkeypatch: MonkeyPatch) -> None:
+    @pytest.fixture(autouse=True)
+    def _clean_env(self, monkeypatch: MonkeyPatch) -> None:
+        """Start every test from defaults for the validated settings."""
+        for name in _VALIDATED_ENV_VARS:
+            monkeypatch.delenv(name, raising=False)
+
+    def test_validate_chunk_overlap_negative_raises(
+        self, monkeypatch: MonkeyPatch, reload_config: Callable[[], ModuleType]
+    ) -> None:
         """Test that CHUNK_OVERLAP_SEC < 0 raises ValueError.
 
         Given: CHUNK_OVERLAP_SEC is set to -1.0
@@ -20,14 +50,15 @@ class TestValidateConfig:
         monkeypatch.setenv("CHUNK_OVERLAP_SEC", "-1.0")
 
         # Act: Reload config to pick up env change
-        import video_transcribe.config
-        config = importlib.reload(video_transcribe.config)
+        config = reload_config()
 
         # Assert: Should raise ValueError
         with pytest.raises(ValueError, match="CHUNK_OVERLAP_SEC must be non-negative"):
             config.validate_config()
 
-    def test_validate_chunk_duration_positive(self, monkeypatch: MonkeyPatch) -> None:
+    def test_validate_chunk_duration_positive(
+        self, monkeypatch: MonkeyPatch, reload_config: Callable[[], ModuleType]
+    ) -> None:
         """Test that CHUNK_MAX_DURATION_SEC <= 0 raises ValueError.
 
         Given: CHUNK_MAX_DURATION_SEC is set to 0 (invalid)
@@ -38,14 +69,15 @@ class TestValidateConfig:
         monkeypatch.setenv("CHUNK_MAX_DURATION_SEC", "0")
 
         # Act: Reload config
-        import video_transcribe.config
-        config = importlib.reload(video_transcribe.config)
+        config = reload_config()
 
         # Assert: Should raise ValueError
         with pytest.raises(ValueError, match="CHUNK_MAX_DURATION_SEC must be positive"):
             config.validate_config()
 
-    def test_validate_chunk_duration_negative_also_raises(self, monkeypatch: MonkeyPatch) -> None:
+    def test_validate_chunk_duration_negative_also_raises(
+        self, monkeypatch: MonkeyPatch, reload_config: Callable[[], ModuleType]
+    ) -> None:
         """Test that negative CHUNK_MAX_DURATION_SEC also raises ValueError.
 
         This is an edge case for the <= 0 check.
@@ -54,14 +86,15 @@ class TestValidateConfig:
         monkeypatch.setenv("CHUNK_MAX_DURATION_SEC", "-10")
 
         # Act
-        import video_transcribe.config
-        config = importlib.reload(video_transcribe.config)
+        config = reload_config()
 
         # Assert
         with pytest.raises(ValueError, match="CHUNK_MAX_DURATION_SEC must be positive"):
             config.validate_config()
 
-    def test_validate_overlap_less_than_duration(self, monkeypatch: MonkeyPatch) -> None:
+    def test_validate_overlap_less_than_duration(
+        self, monkeypatch: MonkeyPatch, reload_config: Callable[[], ModuleType]
+    ) -> None:
         """Test that overlap >= duration raises ValueError.
 
         Given: CHUNK_OVERLAP_SEC (2) >= CHUNK_MAX_DURATION_SEC (2)
@@ -73,28 +106,72 @@ class TestValidateConfig:
         monkeypatch.setenv("CHUNK_MAX_DURATION_SEC", "2.0")
 
         # Act
-        import video_transcribe.config
-        config = importlib.reload(video_transcribe.config)
+        config = reload_config()
 
         # Assert
         with pytest.raises(ValueError, match="CHUNK_OVERLAP_SEC .* must be less than CHUNK_MAX_DURATION_SEC"):
             config.validate_config()
 
-    def test_validate_overlap_greater_than_duration_raises(self, monkeypatch: MonkeyPatch) -> None:
+    def test_validate_overlap_greater_than_duration_raises(
+        self, monkeypatch: MonkeyPatch, reload_config: Callable[[], ModuleType]
+    ) -> None:
         """Test that overlap > duration also raises ValueError."""
         # Arrange: overlap greater than duration
         monkeypatch.setenv("CHUNK_OVERLAP_SEC", "5.0")
         monkeypatch.setenv("CHUNK_MAX_DURATION_SEC", "3.0")
 
         # Act
-        import video_transcribe.config
-        config = importlib.reload(video_transcribe.config)
+        config = reload_config()
 
         # Assert
         with pytest.raises(ValueError, match="CHUNK_OVERLAP_SEC .* must be less than CHUNK_MAX_DURATION_SEC"):
             config.validate_config()
 
-    def test_validate_max_size_less_than_openai_limit(self, monkeypatch: MonkeyPatch) -> None:
+    def test_validate_postprocess_max_rpm_non_negative(
+        self, monkeypatch: MonkeyPatch, reload_config: Callable[[], ModuleType]
+    ) -> None:
+        """Test that a negative POSTPROCESS_MAX_RPM raises ValueError."""
+        # Arrange
+        monkeypatch.setenv("POSTPROCESS_MAX_RPM", "-1")
+
+        # Act
+        config = reload_config()
+
+        # Assert
+        with pytest.raises(ValueError, match="POSTPROCESS_MAX_RPM must be non-negative"):
+            config.validate_config()
+
+    def test_validate_concurrency_positive(
+        self, monkeypatch: MonkeyPatch, reload_config: Callable[[], ModuleType]
+    ) -> None:
+        """Test that TRANSCRIBE_CONCURRENCY < 1 raises ValueError."""
+        # Arrange
+        monkeypatch.setenv("TRANSCRIBE_CONCURRENCY", "0")
+
+        # Act
+        config = reload_config()
+
+        # Assert
+        with pytest.raises(ValueError, match="TRANSCRIBE_CONCURRENCY must be at least 1"):
+            config.validate_config()
+
+    def test_validate_audio_format(
+        self, monkeypatch: MonkeyPatch, reload_config: Callable[[], ModuleType]
+    ) -> None:
+        """Test that an unsupported AUDIO_FORMAT raises ValueError."""
+        # Arrange
+        monkeypatch.setenv("AUDIO_FORMAT", "flac")
+
+        # Act
+        config = reload_config()
+
+        # Assert
+        with pytest.raises(ValueError, match="AUDIO_FORMAT must be 'mp3' or 'wav'"):
+            config.validate_config()
+
+    def test_validate_max_size_less_than_openai_limit(
+        self, monkeypatch: MonkeyPatch, reload_config: Callable[[], ModuleType]
+    ) -> None:
         """Test that CHUNK_MAX_SIZE_MB >= 25 raises ValueError.
 
         Given: CHUNK_MAX_SIZE_MB is set to 25 (equal to OPENAI_MAX_FILE_SIZE_MB)
@@ -105,44 +182,42 @@ class TestValidateConfig:
         monkeypatch.setenv("CHUNK_MAX_SIZE_MB", "25")
 
         # Act
-        import video_transcribe.config
-        config = importlib.reload(video_transcribe.config)
+        config = reload_config()
 
         # Assert
         with pytest.raises(ValueError, match="CHUNK_MAX_SIZE_MB .* must be less than OPENAI_MAX_FILE_SIZE_MB"):
             config.validate_config()
 
-    def test_validate_max_size_greater_than_limit_raises(self, monkeypatch: MonkeyPatch) -> None:
+    def test_validate_max_size_greater_than_limit_raises(
+        self, monkeypatch: MonkeyPatch, reload_config: Callable[[], ModuleType]
+    ) -> None:
         """Test that CHUNK_MAX_SIZE_MB > 25 also raises ValueError."""
         # Arrange
         monkeypatch.setenv("CHUNK_MAX_SIZE_MB", "30")
 
         # Act
-        import video_transcribe.config
-        config = importlib.reload(video_transcribe.config)
+        config = reload_config()
 
         # Assert
         with pytest.raises(ValueError, match="CHUNK_MAX_SIZE_MB .* must be less than OPENAI_MAX_FILE_SIZE_MB"):
             config.validate_config()
 
-    def test_validate_config_passes_with_valid_defaults(self, monkeypatch: MonkeyPatch) -> None:
+    def test_validate_config_passes_with_valid_defaults(
+        self, reload_config: Callable[[], ModuleType]
+    ) -> None:
         """Test that validate_config() passes with default valid values.
 
         This is a positive test case to ensure valid config doesn't raise.
         """
-        # Arrange: Use valid values (or clear env to use defaults)
-        monkeypatch.delenv("CHUNK_OVERLAP_SEC", raising=False)
-        monkeypatch.delenv("CHUNK_MAX_DURATION_SEC", raising=False)
-        monkeypatch.delenv("CHUNK_MAX_SIZE_MB", raising=False)
-
-        # Act
-        import video_transcribe.config
-        config = importlib.reload(video_transcribe.config)
+        # Act: _clean_env already cleared the env, so defaults apply
+        config = reload_config()
 
         # Assert: Should not raise
         config.validate_config()  # No exception expected
 
-    def test_validate_config_passes_with_custom_valid_values(self, monkeypatch: MonkeyPatch) -> None:
+    def test_validate_config_passes_with_custom_valid_values(
+        self, monkeypatch: MonkeyPatch, reload_config: Callable[[], ModuleType]
+    ) -> None:
         """Test that validate_config() passes with custom valid values."""
         # Arrange: Set valid custom values
         monkeypatch.setenv("CHUNK_OVERLAP_SEC", "1.5")
@@ -150,11 +225,43 @@ class TestValidateConfig:
         monkeypatch.setenv("CHUNK_MAX_SIZE_MB", "20")
 
         # Act
-        import video_transcribe.config
-        config = importlib.reload(video_transcribe.config)
+        config = reload_config()
 
         # Assert
         config.validate_config()  # No exception
         assert config.CHUNK_OVERLAP_SEC == 1.5
         assert config.CHUNK_MAX_DURATION_SEC == 60.0
         assert config.CHUNK_MAX_SIZE_MB == 20
+
+
+class TestLazySettings:
+    """Test suite for lazy resolution of env-driven settings."""
+
+    def test_value_memoized_until_reload(self, monkeypatch: MonkeyPatch) -> None:
+        """Test that a setting is read once and refreshed by reload().
+
+        Given: CHUNK_OVERLAP_SEC resolved after a reload
+        When: The env var changes without and then with a reload
+        Then: The old value is kept until config.reload() is called
+        """
+        # Arrange
+        monkeypatch.setenv("CHUNK_OVERLAP_SEC", "1.0")
+        from video_transcribe import config
+        config.reload()
+        assert config.CHUNK_OVERLAP_SEC == 1.0
+
+        # Act
+        monkeypatch.setenv("CHUNK_OVERLAP_SEC", "3.0")
+        cached = config.CHUNK_OVERLAP_SEC
+        config.reload()
+
+        # Assert
+        assert cached == 1.0
+        assert config.CHUNK_OVERLAP_SEC == 3.0
+
+    def test_unknown_attribute_raises(self) -> None:
+        """Test that unknown names still raise AttributeError."""
+        from video_transcribe import config
+
+        with pytest.raises(AttributeError):
+            config.NOT_A_SETTING
@@ -0,0 +1,46 @@
+"""Tests for video_transcribe.files module."""
+
+from pathlib import Path
+
+import pytest
+
+from video_transcribe.files import atomic_write
+
+
+class TestAtomicWrite:
+    """Test suite for atomic_write()."""
+
+    def test_replaces_file_and_leaves_no_temp(self, tmp_path: Path) -> None:
+        """Test that the new content replaces the file with no temp left over."""
+        # Arrange
+        target = tmp_path / "out.txt"
+        target.write_text("old", encoding="utf-8")
+
+        # Act
+        with atomic_write(target) as f:
+            f.write("новый")
+
+        # Assert
+        assert target.read_text(encoding="utf-8") == "новый"
+        assert [p.name for p in tmp_path.iterdir()] == ["out.txt"]
+
+    def test_error_keeps_previous_file(self, tmp_path: Path) -> None:
+        """Test that a failed write leaves the old file intact.
+
+        Given: An existing output file
+        When: The write block raises midway
+        Then: The old content survives and the temp file is removed
+        """
+        # Arrange
+        target = tmp_path / "out.txt"
+        target.write_text("old", encoding="utf-8")
+
+        # Act
+        with pytest.raises(RuntimeError):
+            with atomic_write(target) as f:
+                f.write("partial")
+                raise RuntimeError("boom")
+
+        # Assert
+        assert target.read_text(encoding="utf-8") == "old"
+        assert [p.name for p in tmp_path.iterdir()] == ["out.txt"]
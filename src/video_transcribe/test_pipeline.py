@@ -0,0 +1,290 @@
+"""Tests for video_transcribe.pipeline module."""
+
+import json
+import os
+import time
+from pathlib import Path
+
+import pytest
+from pytest_mock import MockerFixture
+
+from video_transcribe.pipeline import (
+    _fingerprint,
+    _run_audio_link,
+    _temp_dir,
+    check_output_collisions,
+    is_video_file,
+    process_videos,
+    save_transcript,
+    unique_videos,
+)
+from video_transcribe.transcribe.models import (
+    TranscriptionResult,
+    TranscriptionSegment,
+)
+
+
+def _make_transcript() -> TranscriptionResult:
+    return TranscriptionResult(
+        text="Привет. Hello.",
+        duration=4.0,
+        segments=[
+            TranscriptionSegment(speaker="A", start=0.0, end=2.0, text="Привет."),
+            TranscriptionSegment(speaker="B", start=2.0, end=4.0, text="Hello."),
+        ],
+        model_used="gpt-4o-transcribe-diarize",
+        response_format="diarized_json",
+    )
+
+
+class TestSaveTranscript:
+    """Test suite for save_transcript()."""
+
+    def test_writes_json_payload(self, tmp_path: Path) -> None:
+        """Test that JSON output contains all fields and keeps non-ASCII text.
+
+        Given: A diarized transcript with two segments
+        When: save_transcript() is called with a JSON format into a missing dir
+        Then: The file is created with text, duration, model and segments
+        """
+        # Arrange
+        output = tmp_path / "nested" / "out.json"
+
+        # Act
+        save_transcript(_make_transcript(), output, "diarized_json")
+
+        # Assert
+        raw = output.read_text(encoding="utf-8")
+        assert "Привет." in raw
+        data = json.loads(raw)
+        assert data["text"] == "Привет. Hello."
+        assert data["duration"] == 4.0
+        assert data["model"] == "gpt-4o-transcribe-diarize"
+        assert data["segments"] == [
+            {"speaker": "A", "start": 0.0, "end": 2.0, "text": "Привет."},
+            {"speaker": "B", "start": 2.0, "end": 4.0, "text": "Hello."},
+        ]
+
+    def test_writes_columnar_json(self, tmp_path: Path) -> None:
+        """Test that columnar output stores segments as per-field lists."""
+        # Arrange
+        output = tmp_path / "out.json"
+
+        # Act
+        save_transcript(_make_transcript(), output, "diarized_json", columnar=True)
+
+        # Assert
+        data = json.loads(output.read_text(encoding="utf-8"))
+        assert data["text"] == "Привет. Hello."
+        assert data["segments"] == {
+            "speaker": ["A", "B"],
+            "start": [0.0, 2.0],
+            "end": [2.0, 4.0],
+            "text": ["Привет.", "Hello."],
+        }
+
+    def test_writes_plain_text(self, tmp_path: Path) -> None:
+        """Test that "text" format writes only the transcript text."""
+        # Arrange
+        output = tmp_path / "out.txt"
+
+        # Act
+        save_transcript(_make_transcript(), str(output), "text")
+
+        # Assert
+        assert output.read_text(encoding="utf-8") == "Привет. Hello."
+
+
+class TestFingerprint:
+    """Test suite for _fingerprint()."""
+
+    def test_stable_until_file_changes(self, tmp_path: Path) -> None:
+        """Test that the fingerprint is stable and tracks file changes.
+
+        Given: A file fingerprinted twice without changes
+        When: The file is rewritten with different content
+        Then: The first two fingerprints match and the third differs
+        """
+        # Arrange
+        video = tmp_path / "video.mp4"
+        video.write_bytes(b"a" * 10)
+
+        # Act
+        first = _fingerprint(str(video))
+        second = _fingerprint(str(video))
+        video.write_bytes(b"b" * 20)
+        changed = _fingerprint(str(video))
+
+        # Assert
+        assert first == second
+        assert changed != first
+
+
+class TestIsVideoFile:
+    """Test suite for is_video_file()."""
+
+    @pytest.mark.parametrize(
+        ("path", "expected"),
+        [
+            ("meeting.mp4", True),
+            ("/videos/Meeting.MOV", True),
+            ("archive.tar.mkv", True),
+            ("notes.txt", False),
+            ("dir.mp4/file", False),
+            (".mp4", False),
+        ],
+    )
+    def test_matches_extension_case_insensitively(self, path: str, expected: bool) -> None:
+        """Test that only known video extensions match, in any case."""
+        assert is_video_file(path) is expected
+
+
+class TestProcessVideos:
+    """Test suite for process_videos()."""
+
+    def test_yields_results_and_errors_per_video(self, mocker: MockerFixture) -> None:
+        """Test that every video yields either its result or its exception.
+
+        Given: Three videos, one of which fails
+        When: process_videos() is consumed
+        Then: Each path appears once, the failure carries its exception,
+              and shared kwargs reach process_video
+        """
+        # Arrange
+        error = RuntimeError("FFmpeg conversion failed")
+
+        def fake_process_video(video_path: str, **kwargs: object) -> object:
+            if video_path == "bad.mp4":
+                raise error
+            return f"result:{video_path}:{kwargs['language']}"
+
+        mocker.patch("video_transcribe.pipeline.process_video", side_effect=fake_process_video)
+
+        # Act
+        results = dict(process_videos(["a.mp4", "bad.mp4", "b.mp4"], max_workers=2, language="ru"))
+
+        # Assert
+        assert results == {
+            "a.mp4": "result:a.mp4:ru",
+            "bad.mp4": error,
+            "b.mp4": "result:b.mp4:ru",
+        }
+
+    def test_processes_each_file_once(self, mocker: MockerFixture) -> None:
+        """Test that a file listed twice is processed only once."""
+        # Arrange
+        process = mocker.patch("video_transcribe.pipeline.process_video", return_value="ok")
+
+        # Act
+        results = list(process_videos(["a.mp4", "./a.mp4", "b.mp4"]))
+
+        # Assert
+        assert results.count(("a.mp4", "ok")) == 1
+        assert process.call_count == 2
+
+    def test_rejects_output_path_for_several_videos(self) -> None:
+        """Test that a shared output_path is refused for more than one video."""
+        with pytest.raises(ValueError, match="output_path can only be used with a single video"):
+            list(process_videos(["a.mp4", "b.mp4"], output_path="out.txt"))
+
+    @pytest.mark.parametrize(
+        ("videos", "kwargs"),
+        [
+            (["meeting.mp4", "meeting.mov"], {}),
+            (["a/meeting.mp4", "b/meeting.mp4"], {"postprocess_dir": "notes"}),
+        ],
+        ids=["same-dir-stem", "shared-postprocess-dir"],
+    )
+    def test_rejects_colliding_outputs(
+        self, videos: list[str], kwargs: dict[str, object], mocker: MockerFixture
+    ) -> None:
+        """Test that videos writing the same output file are refused up front."""
+        # Arrange
+        process = mocker.patch("video_transcribe.pipeline.process_video")
+
+        # Act & Assert
+        with pytest.raises(ValueError, match="would both write"):
+            list(process_videos(videos, **kwargs))
+        process.assert_not_called()
+
+    def test_same_stem_in_different_dirs_allowed(self, mocker: MockerFixture) -> None:
+        """Test that same-named videos with separate output dirs both run."""
+        # Arrange
+        mocker.patch("video_transcribe.pipeline.OUTPUT_DIR", None)
+        process = mocker.patch("video_transcribe.pipeline.process_video", return_value="ok")
+
+        # Act
+        list(process_videos(["a/meeting.mp4", "b/meeting.mp4"], keep_audio=True))
+
+        # Assert
+        assert process.call_count == 2
+
+
+class TestUniqueVideos:
+    """Test suite for unique_videos()."""
+
+    def test_keeps_first_spelling_in_order(self) -> None:
+        """Test that repeats under any spelling collapse to the first one."""
+        assert unique_videos(["b.mp4", "a.mp4", "./b.mp4", "a.mp4"]) == ["b.mp4", "a.mp4"]
+
+
+class TestCheckOutputCollisions:
+    """Test suite for check_output_collisions()."""
+
+    def test_same_stem_in_one_dir_rejected(self) -> None:
+        """Test that x.mp4 and x.mov are refused since both write x.txt."""
+        with pytest.raises(ValueError, match="would both write"):
+            check_output_collisions(["x.mp4", "x.mov"], postprocess=False)
+
+    def test_distinct_outputs_allowed(self) -> None:
+        """Test that videos with separate outputs pass."""
+        check_output_collisions(["a/x.mp4", "b/x.mp4"], postprocess=False, keep_audio=True)
+
+
+class TestRunAudioLink:
+    """Test suite for _run_audio_link()."""
+
+    def test_link_survives_shared_audio_removal(self, tmp_path: Path) -> None:
+        """Test that deleting the shared audio leaves each run's copy readable."""
+        # Arrange
+        shared = tmp_path / "talk-abc.mp3"
+        shared.write_bytes(b"audio")
+
+        # Act
+        first = _run_audio_link(shared)
+        second = _run_audio_link(shared)
+        shared.unlink()
+
+        # Assert
+        assert first != second
+        assert first.read_bytes() == b"audio"
+        assert second.read_bytes() == b"audio"
+
+
+class TestTempDir:
+    """Test suite for _temp_dir()."""
+
+    def test_evicts_stale_audio(self, tmp_path: Path, mocker: MockerFixture) -> None:
+        """Test that audio left by old failed runs is removed, recent audio kept."""
+        # Arrange
+        mocker.patch("video_transcribe.pipeline.tempfile.gettempdir", return_value=str(tmp_path))
+        audio_dir = tmp_path / "video-transcribe"
+        audio_dir.mkdir()
+        stale = audio_dir / "old-abc.mp3"
+        fresh = audio_dir / "new-def.mp3"
+        stale.write_bytes(b"a")
+        fresh.write_bytes(b"b")
+        week_ago = time.time() - 8 * 24 * 3600
+        os.utime(stale, (week_ago, week_ago))
+        _temp_dir.cache_clear()
+
+        # Act
+        try:
+            result = _temp_dir()
+        finally:
+            _temp_dir.cache_clear()
+
+        # Assert
+        assert result == audio_dir
+        assert not stale.exists()
+        assert fresh.exists()
@@ -1,47 +1,47 @@
-"""Speech-to-text transcription module."""
-
-from video_transcribe.transcribe.adapter import OpenAIAdapter
-from video_transcribe.transcribe.glm_asr_client import GLMASRClient
-from video_transcribe.transcribe.nemo_client import NeMoClient
-from video_transcribe.transcribe.factory import create_speech_to_text, SpeechToTextClient
-from video_transcribe.transcribe.models import (
-    TranscriptionModel,
-    ResponseFormat,
-    TranscriptionResult,
-    TranscriptionSegment,
-)
-from video_transcribe.transcribe.exceptions import (
-    TranscriptionError,
-    InvalidAudioFormatError,
-    FileSizeLimitError,
-    PromptNotSupportedError,
-    APIKeyMissingError,
-    AudioFileNotFoundError,
-    ChunkingError,
-)
-from video_transcribe.transcribe.merger import merge_results
-
-__all__ = [
+"""Speech-to-text transcription module.
+
+Public names are imported lazily on first access (PEP 562), so importing
+the package, e.g. for the exceptions, doesn't load the provider SDKs.
+"""
+
+import importlib
+
+_LAZY = {
     # Adapters
-    "OpenAIAdapter",
-    "GLMASRClient",
-    "NeMoClient",
+    "OpenAIAdapter": "video_transcribe.transcribe.adapter",
+    "GLMASRClient": "video_transcribe.transcribe.glm_asr_client",
+    "NeMoClient": "video_transcribe.transcribe.nemo_client",
     # Factory
-    "create_speech_to_text",
-    "SpeechToTextClient",
+    "create_speech_to_text": "video_transcribe.transcribe.factory",
+    "SpeechToTextClient": "video_transcribe.transcribe.factory",
     # Models
-    "TranscriptionModel",
-    "ResponseFormat",
-    "TranscriptionResult",
-    "TranscriptionSegment",
+    "TranscriptionModel": "video_transcribe.transcribe.models",
+    "ResponseFormat": "video_transcribe.transcribe.models",
+    "TranscriptionResult": "video_transcribe.transcribe.models",
+    "TranscriptionSegment": "video_transcribe.transcribe.models",
     # Exceptions
-    "TranscriptionError",
-    "InvalidAudioFormatError",
-    "FileSizeLimitError",
-    "PromptNotSupportedError",
-    "APIKeyMissingError",
-    "AudioFileNotFoundError",
-    "ChunkingError",
+    "TranscriptionError": "video_transcribe.transcribe.exceptions",
+    "InvalidAudioFormatError": "video_transcribe.transcribe.exceptions",
+    "FileSizeLimitError": "video_transcribe.transcribe.exceptions",
+    "PromptNotSupportedError": "video_transcribe.transcribe.exceptions",
+    "APIKeyMissingError": "video_transcribe.transcribe.exceptions",
+    "AudioFileNotFoundError": "video_transcribe.transcribe.exceptions",
+    "ChunkingError": "video_transcribe.transcribe.exceptions",
     # Merger
-    "merge_results",
-]
+    "merge_results": "video_transcribe.transcribe.merger",
+}
+
+__all__ = list(_LAZY)
+
+
+def __getattr__(name: str) -> object:
+    module_name = _LAZY.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_LAZY))
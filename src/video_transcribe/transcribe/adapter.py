@@ -1,10 +1,14 @@
 """Transcription adapter using OpenAI API."""
 
+import functools
+import os
 from collections.abc import Callable
-from pathlib import Path
-from openai import OpenAI
-from dotenv import load_dotenv
-from video_transcribe.config import CHUNK_MAX_SIZE_MB
+from typing import TYPE_CHECKING
+from video_transcribe.config import (
+    CHUNK_MAX_SIZE_MB,
+    OPENAI_MAX_FILE_SIZE_MB,
+    OPENAI_SUPPORTED_AUDIO_FORMATS,
+)
 from video_transcribe.transcribe.models import (
     TranscriptionModel,
     ResponseFormat,
@@ -19,19 +23,36 @@ from video_transcribe.transcribe.exceptions import (
     InvalidAudioFormatError,
     TranscriptionError,
 )
-from video_transcribe.audio import split_audio, cleanup_chunks, AudioChunk
+from video_transcribe.audio import cleanup_chunks, AudioChunk
 from video_transcribe.transcribe.merger import merge_results
+from video_transcribe.transcribe.parallel import stream_split_audio, transcribe_chunks
+
+if TYPE_CHECKING:
+    from openai import OpenAI
 
 # Supported audio formats per OpenAI docs
-SUPPORTED_FORMATS = {".mp3", ".mp4", ".mpeg", ".mpga", ".m4a", ".wav", ".webm"}
+SUPPORTED_FORMATS = OPENAI_SUPPORTED_AUDIO_FORMATS
 
 # File size limit: 25 MB per OpenAI API
-MAX_FILE_SIZE_MB = 25
+MAX_FILE_SIZE_MB = OPENAI_MAX_FILE_SIZE_MB
 
 # Models
 DIARIZE_MODEL = "gpt-4o-transcribe-diarize"
 
 
+@functools.cache
+def _openai_client(api_key: str) -> "OpenAI":
+    """Return one SDK client per API key, shared by every adapter.
+
+    Adapters created for the same key reuse its HTTP connection pool
+    instead of opening (and TLS-handshaking) their own.
+    """
+    # Deferred so importing the package doesn't pull in the SDK
+    from openai import OpenAI
+
+    return OpenAI(api_key=api_key)
+
+
 class OpenAIAdapter:
     """OpenAI transcription adapter using gpt-4o-transcribe models."""
 
@@ -48,10 +69,10 @@ class OpenAIAdapter:
         Raises:
             APIKeyMissingError: If API key not provided and not in environment.
         """
-        load_dotenv()
         if api_key is None:
-            import os
-            api_key = os.getenv("OPENAI_API_KEY")
+            # Memoized by config, which loads .env only once per process
+            from video_transcribe.config import OPENAI_API_KEY
+            api_key = OPENAI_API_KEY
 
         if not api_key:
             raise APIKeyMissingError(
@@ -59,7 +80,7 @@ class OpenAIAdapter:
                 "or pass api_key parameter."
             )
 
-        self.client = OpenAI(api_key=api_key)
+        self.client = _openai_client(api_key)
 
     def transcribe(
         self,
@@ -89,26 +110,38 @@ class OpenAIAdapter:
             FileSizeLimitError: If file exceeds 25 MB limit.
             PromptNotSupportedError: If prompt provided with diarize model.
         """
-        # Validate audio file exists
-        audio_file = Path(audio_path)
-        if not audio_file.exists():
-            raise AudioFileNotFoundError(f"Audio file not found: {audio_path}")
-
-        # Validate format
-        if audio_file.suffix.lower() not in self.SUPPORTED_FORMATS:
-            raise InvalidAudioFormatError(
-                f"Unsupported format: {audio_file.suffix}. "
-                f"Supported formats: {', '.join(self.SUPPORTED_FORMATS)}"
-            )
-
-        # Validate file size
-        file_size_mb = audio_file.stat().st_size / (1024 * 1024)
-        if file_size_mb > self.MAX_FILE_SIZE_MB:
+        # Validate existence and format; size comes from the same stat call
+        file_size = self._validate_audio(audio_path)
+        if file_size > self.MAX_FILE_SIZE_MB * 1024 * 1024:
+            file_size_mb = file_size / (1024 * 1024)
             raise FileSizeLimitError(
                 f"File size ({file_size_mb:.2f} MB) exceeds limit "
                 f"({self.MAX_FILE_SIZE_MB} MB). Use chunking for larger files."
             )
 
+        return self._transcribe_file(
+            audio_path=audio_path,
+            model=model,
+            prompt=prompt,
+            response_format=response_format,
+            language=language,
+            temperature=temperature,
+        )
+
+    def _transcribe_file(
+        self,
+        audio_path: str,
+        model: TranscriptionModel,
+        prompt: str | None,
+        response_format: ResponseFormat,
+        language: str | None,
+        temperature: float,
+    ) -> TranscriptionResult:
+        """Send an already validated audio file to the API.
+
+        The caller must have checked existence, format and size (see
+        _validate_audio()); only the parameter combination is checked here.
+        """
         # Validate prompt compatibility
         if model == self.DIARIZE_MODEL and prompt:
             raise PromptNotSupportedError(
@@ -154,6 +187,29 @@ class OpenAIAdapter:
         # Parse response
         return self._parse_response(response, model, response_format)
 
+    def _validate_audio(self, audio_path: str) -> int:
+        """Check that audio_path exists and has a supported format.
+
+        Returns:
+            File size in bytes.
+
+        Raises:
+            AudioFileNotFoundError: If audio file doesn't exist.
+            InvalidAudioFormatError: If file format not supported.
+        """
+        try:
+            st = os.stat(audio_path)
+        except FileNotFoundError:
+            raise AudioFileNotFoundError(f"Audio file not found: {audio_path}") from None
+
+        suffix = os.path.splitext(audio_path)[1]
+        if suffix.lower() not in self.SUPPORTED_FORMATS:
+            raise InvalidAudioFormatError(
+                f"Unsupported format: {suffix}. "
+                f"Supported formats: {', '.join(self.SUPPORTED_FORMATS)}"
+            )
+        return st.st_size
+
     def _parse_response(
         self,
         response,
@@ -180,30 +236,39 @@ class OpenAIAdapter:
             )
 
         # verbose_json and diarized_json have segments
-        segments = []
+        segments: list[TranscriptionSegment] = []
         if response_format == "verbose_json":
-            for seg in response.segments:
-                segments.append(TranscriptionSegment(
+            segments = [
+                TranscriptionSegment(
                     speaker=None,
                     start=getattr(seg, 'start', None),
                     end=getattr(seg, 'end', None),
                     text=seg.text,
-                ))
+                )
+                for seg in response.segments
+            ]
 
         elif response_format == "diarized_json":
-            for seg in response.segments:
-                segments.append(TranscriptionSegment(
+            segments = [
+                TranscriptionSegment(
                     speaker=getattr(seg, 'speaker', None),
                     start=getattr(seg, 'start', None),
                     end=getattr(seg, 'end', None),
                     text=seg.text,
-                ))
+                )
+                for seg in response.segments
+            ]
+
+        text = getattr(response, 'text', None)
+        if text is None:
+            text = ''.join([s.text for s in segments])
+        duration = getattr(response, 'duration', None)
+        if duration is None:
+            duration = (segments[-1].end or 0.0) if segments else 0.0
 
         return TranscriptionResult(
-            text=response.text if hasattr(response, 'text') else
-                   ''.join(s.text for s in segments),
-            duration=response.duration if hasattr(response, 'duration') else
-                      ((segments[-1].end if segments[-1].end is not None else 0.0) if segments else 0.0),
+            text=text,
+            duration=duration,
             segments=segments,
             model_used=model,
             response_format=response_format,
@@ -221,8 +286,9 @@ class OpenAIAdapter:
     ) -> TranscriptionResult:
         """Transcribe audio file with automatic chunking for large files.
 
-        Automatically detects when chunking is needed and processes chunks
-        sequentially.
+        Automatically detects when chunking is needed and transcribes up to
+        TRANSCRIBE_CONCURRENCY chunks concurrently. Results are merged in
+        chunk order regardless of completion order.
 
         Args:
             audio_path: Path to audio file.
@@ -231,7 +297,8 @@ class OpenAIAdapter:
             response_format: Output format.
             language: Optional language code.
             temperature: Sampling temperature.
-            progress_callback: Optional callback(current, total) for progress updates.
+            progress_callback: Optional callback(done, total) for progress updates,
+                called from the calling thread as chunks complete.
 
         Returns:
             TranscriptionResult with merged segments and adjusted timestamps.
@@ -242,15 +309,7 @@ class OpenAIAdapter:
             TranscriptionError: If transcription fails.
         """
         # Validate audio file exists and format
-        audio_file = Path(audio_path)
-        if not audio_file.exists():
-            raise AudioFileNotFoundError(f"Audio file not found: {audio_path}")
-
-        if audio_file.suffix.lower() not in self.SUPPORTED_FORMATS:
-            raise InvalidAudioFormatError(
-                f"Unsupported format: {audio_file.suffix}. "
-                f"Supported formats: {', '.join(self.SUPPORTED_FORMATS)}"
-            )
+        file_size = self._validate_audio(audio_path)
 
         # Validate prompt compatibility
         if model == self.DIARIZE_MODEL and prompt:
@@ -260,11 +319,9 @@ class OpenAIAdapter:
             )
 
         # Check if chunking needed
-        file_size_mb = audio_file.stat().st_size / (1024 * 1024)
-
-        if file_size_mb <= CHUNK_MAX_SIZE_MB:
-            # No chunking needed - use standard transcription
-            return self.transcribe(
+        if file_size <= CHUNK_MAX_SIZE_MB * 1024 * 1024:
+            # No chunking needed - file already validated above
+            return self._transcribe_file(
                 audio_path=audio_path,
                 model=model,
                 prompt=prompt,
@@ -273,37 +330,32 @@ class OpenAIAdapter:
                 temperature=temperature,
             )
 
-        # Chunking required
-        try:
-            chunks = split_audio(audio_path=audio_path)
-        except Exception as e:
-            raise TranscriptionError(f"Failed to split audio: {e}") from e
-
+        # Chunking required: chunks are uploaded while later ones are
+        # still being cut
+        chunks: list[AudioChunk] = []
+        split = stream_split_audio(audio_path, chunks)
         try:
             # Determine if diarization is enabled
             has_diarization = model == self.DIARIZE_MODEL or response_format == "diarized_json"
 
-            # Process chunks sequentially
-            results: list[TranscriptionResult] = []
-            chunk_offsets: list[float] = []
-
-            for i, chunk in enumerate(chunks):
-                if progress_callback:
-                    progress_callback(i + 1, len(chunks))
-
-                # Use verbose_json or diarized_json for chunking to get segments
-                chunk_response_format = "diarized_json" if has_diarization else "verbose_json"
-
-                result = self.transcribe(
-                    audio_path=chunk.path,
-                    model=model,
-                    prompt=None,  # Never use prompt with chunks
-                    response_format=chunk_response_format,
-                    language=language,
-                    temperature=temperature,
-                )
-                results.append(result)
-                chunk_offsets.append(chunk.start_sec)
+            # Use verbose_json or diarized_json for chunking to get segments;
+            # plain text output needs none, so skip building them
+            chunk_response_format: ResponseFormat
+            if has_diarization:
+                chunk_response_format = "diarized_json"
+            elif response_format == "text":
+                chunk_response_format = "text"
+            else:
+                chunk_response_format = "verbose_json"
+
+            results = transcribe_chunks(
+                split,
+                lambda chunk: self._transcribe_chunk(
+                    chunk, model, chunk_response_format, language, temperature
+                ),
+                progress_callback=progress_callback,
+            )
+            chunk_offsets = [chunk.start_sec for chunk in chunks]
 
             # Merge results
             merged = merge_results(
@@ -315,5 +367,30 @@ class OpenAIAdapter:
             return merged
 
         finally:
-            # Always cleanup chunks
+            # Stop the splitter (removing chunks it hadn't handed out), then
+            # cleanup the ones it did
+            split.close()
             cleanup_chunks(chunks)
+
+    def _transcribe_chunk(
+        self,
+        chunk: AudioChunk,
+        model: TranscriptionModel,
+        response_format: ResponseFormat,
+        language: str | None,
+        temperature: float,
+    ) -> TranscriptionResult:
+        """Transcribe one chunk and fill in the duration text output lacks."""
+        result = self.transcribe(
+            audio_path=chunk.path,
+            model=model,
+            prompt=None,  # Never use prompt with chunks
+            response_format=response_format,
+            language=language,
+            temperature=temperature,
+        )
+
+        # Text responses carry no duration; merge_results needs the last one
+        if not result.duration:
+            result.duration = chunk.end_sec - chunk.start_sec
+        return result
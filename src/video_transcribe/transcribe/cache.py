@@ -0,0 +1,59 @@
+"""On-disk cache of transcription results.
+
+Results are keyed by the audio content and the transcription parameters,
+so re-processing the same video (e.g. while tuning post-processing
+prompts) skips the API calls entirely.
+"""
+
+import hashlib
+import json
+from pathlib import Path
+
+from video_transcribe.files import atomic_write
+from video_transcribe.transcribe.models import ResponseFormat, TranscriptionResult
+
+
+def cache_key(audio_path: str | Path, **params: object) -> str:
+    """Build a cache key from audio content and transcription parameters.
+
+    Args:
+        audio_path: Path to the audio file that will be transcribed.
+        **params: Parameters that affect the transcript (model, language, ...).
+            Values must be JSON-serializable.
+
+    Returns:
+        Hex digest identifying this audio/parameter combination.
+    """
+    with open(audio_path, "rb") as f:
+        digest = hashlib.file_digest(f, lambda: hashlib.blake2b(digest_size=16))
+    digest.update(json.dumps(params, sort_keys=True).encode("utf-8"))
+    return digest.hexdigest()
+
+
+def load_cached(
+    cache_dir: str | Path,
+    key: str,
+    response_format: ResponseFormat,
+) -> TranscriptionResult | None:
+    """Return the cached result for key, or None on a miss.
+
+    Unreadable or corrupt entries count as a miss.
+    """
+    try:
+        with open(Path(cache_dir) / f"{key}.json", encoding="utf-8") as f:
+            data = json.load(f)
+        return TranscriptionResult.from_dict(data, response_format)
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+
+def store_cached(cache_dir: str | Path, key: str, result: TranscriptionResult) -> None:
+    """Store result under key.
+
+    The entry is replaced atomically, so concurrent runs never see a
+    partially written entry.
+    """
+    cache_path = Path(cache_dir)
+    cache_path.mkdir(parents=True, exist_ok=True)
+    with atomic_write(cache_path / f"{key}.json") as f:
+        json.dump(result.to_dict(), f, ensure_ascii=False)
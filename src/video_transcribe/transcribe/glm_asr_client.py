@@ -2,11 +2,13 @@
 
 import os
 from collections.abc import Callable
-from pathlib import Path
-from typing import Literal
+from typing import TYPE_CHECKING, Literal
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
+from video_transcribe.config import TRANSCRIBE_CONCURRENCY
 from video_transcribe.transcribe.models import (
     ResponseFormat,
     TranscriptionResult,
@@ -20,11 +22,14 @@ from video_transcribe.transcribe.exceptions import (
     TranscriptionError,
 )
 
+if TYPE_CHECKING:
+    from video_transcribe.audio import AudioChunk
+
 # Z.AI GLM-ASR-2512 model
 MODEL = "glm-asr-2512"
 
 # Supported audio formats per Z.AI docs
-SUPPORTED_FORMATS = {".wav", ".mp3"}
+SUPPORTED_FORMATS = frozenset({".wav", ".mp3"})
 
 # Z.AI API limits
 MAX_FILE_SIZE = 25 * 1024 * 1024  # 25 MB
@@ -33,6 +38,23 @@ MAX_DURATION = 30  # seconds (for future chunking)
 # Default prompt to prevent Chinese translation
 DEFAULT_PROMPT = "IMPORTANT! Target Language is RUSSIAN."
 
+# (connect, read) timeouts; a 30s clip is transcribed well within read
+REQUEST_TIMEOUT = (10, 120)
+
+# Transient failures retried with backoff before surfacing the status.
+# POST is included, but only for failures where the audio was not
+# transcribed: 429/503 rejections and connection errors. Other 5xx and
+# read timeouts may arrive after the server processed (and billed) the
+# request, so retrying them risks a billed duplicate.
+_RETRY = Retry(
+    total=3,
+    read=0,
+    backoff_factor=0.5,
+    status_forcelist=(429, 503),
+    allowed_methods=None,
+    raise_on_status=False,
+)
+
 
 class GLMASRClient:
     """Z.AI GLM-ASR-2512 client for audio transcription.
@@ -68,6 +90,14 @@ class GLMASRClient:
         self.api_key = api_key
         self.base_url = base_url or self.BASE_URL
 
+        # One keep-alive session for every request, so chunks don't each
+        # pay a TCP + TLS handshake. Sized for concurrent chunk uploads.
+        self._session = requests.Session()
+        self._session.headers["Authorization"] = f"Bearer {api_key}"
+        adapter = HTTPAdapter(pool_maxsize=max(TRANSCRIBE_CONCURRENCY, 10), max_retries=_RETRY)
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
+
     def transcribe(
         self,
         audio_path: str,
@@ -91,20 +121,8 @@ class GLMASRClient:
             FileSizeLimitError: If file exceeds 25 MB limit.
             TranscriptionError: If transcription fails.
         """
-        # Validate audio file exists
-        audio_file = Path(audio_path)
-        if not audio_file.exists():
-            raise AudioFileNotFoundError(f"Audio file not found: {audio_path}")
-
-        # Validate format
-        if audio_file.suffix.lower() not in self.SUPPORTED_FORMATS:
-            raise InvalidAudioFormatError(
-                f"Unsupported format: {audio_file.suffix}. "
-                f"Supported formats: {', '.join(self.SUPPORTED_FORMATS)}"
-            )
-
-        # Validate file size
-        file_size = audio_file.stat().st_size
+        # Validate existence and format; size comes from the same stat call
+        file_size = self._validate_audio(audio_path)
         if file_size > self.MAX_FILE_SIZE:
             raise FileSizeLimitError(
                 f"File size ({file_size / (1024 * 1024):.2f} MB) exceeds limit "
@@ -113,7 +131,6 @@ class GLMASRClient:
 
         # Build request
         url = f"{self.base_url}{self.ENDPOINT}"
-        headers = {"Authorization": f"Bearer {self.api_key}"}
 
         payload = {
             "model": MODEL,
@@ -127,8 +144,12 @@ class GLMASRClient:
         # Make request
         try:
             with open(audio_path, "rb") as f:
-                files = {"file": (audio_file.name, f, "audio/mpeg")}
-                response = requests.post(url, data=payload, files=files, headers=headers)
+                files = {"file": (os.path.basename(audio_path), f, "audio/mpeg")}
+                response = self._session.post(
+                    url, data=payload, files=files, timeout=REQUEST_TIMEOUT
+                )
+        except requests.RequestException as e:
+            raise TranscriptionError(f"Z.AI API request failed: {e}") from e
         except Exception as e:
             raise TranscriptionError(f"Failed to read audio file: {e}") from e
 
@@ -150,6 +171,29 @@ class GLMASRClient:
 
         return self._parse_response(data)
 
+    def _validate_audio(self, audio_path: str) -> int:
+        """Check that audio_path exists and has a supported format.
+
+        Returns:
+            File size in bytes.
+
+        Raises:
+            AudioFileNotFoundError: If audio file doesn't exist.
+            InvalidAudioFormatError: If file format not supported.
+        """
+        try:
+            st = os.stat(audio_path)
+        except FileNotFoundError:
+            raise AudioFileNotFoundError(f"Audio file not found: {audio_path}") from None
+
+        suffix = os.path.splitext(audio_path)[1]
+        if suffix.lower() not in self.SUPPORTED_FORMATS:
+            raise InvalidAudioFormatError(
+                f"Unsupported format: {suffix}. "
+                f"Supported formats: {', '.join(self.SUPPORTED_FORMATS)}"
+            )
+        return st.st_size
+
     def transcribe_chunked(
         self,
         audio_path: str,
@@ -163,7 +207,8 @@ class GLMASRClient:
         """Transcribe audio file with automatic duration-based chunking.
 
         Z.AI has a 30-second duration limit, so files longer than that
-        are automatically split into chunks using pydub.
+        are automatically split into chunks with ffmpeg. Chunks are
+        transcribed concurrently (TRANSCRIBE_CONCURRENCY at a time).
 
         Args:
             audio_path: Path to audio file.
@@ -178,29 +223,30 @@ class GLMASRClient:
         Returns:
             TranscriptionResult with transcribed text and corrected timestamps.
         """
-        from video_transcribe.audio import split_audio_by_duration, cleanup_chunks
+        from video_transcribe.audio import cleanup_chunks, split_audio_by_duration
         from video_transcribe.transcribe.merger import merge_results
-        from pydub import AudioSegment
+        from video_transcribe.transcribe.parallel import transcribe_chunks
 
         # Use default prompt if None to prevent Chinese translation
         if prompt is None:
             prompt = DEFAULT_PROMPT
 
-        # Get audio duration to check if chunking is needed
-        audio_file = Path(audio_path)
-        if not audio_file.exists():
-            raise AudioFileNotFoundError(f"Audio file not found: {audio_path}")
-
-        # Load audio to get duration using pydub
+        # The splitter is the single source of the duration: it probes the
+        # file once and returns the original file as the only chunk when it
+        # fits the Z.AI 30s limit
         try:
-            audio = AudioSegment.from_file(audio_path)
-            duration_sec = len(audio) / 1000.0
+            chunks = split_audio_by_duration(
+                audio_path=audio_path,
+                max_duration_sec=self.MAX_DURATION,
+            )
+        except FileNotFoundError as e:
+            raise AudioFileNotFoundError(str(e)) from e
         except Exception as e:
-            raise TranscriptionError(f"Failed to load audio: {e}") from e
+            raise TranscriptionError(f"Failed to split audio by duration: {e}") from e
 
-        # Check if chunking is needed (Z.AI 30s limit)
-        if duration_sec <= self.MAX_DURATION:
+        if len(chunks) == 1 and not chunks[0].is_temp:
             # No chunking needed - transcribe directly
+            duration_sec = chunks[0].original_duration_sec
             result = self.transcribe(
                 audio_path=audio_path,
                 prompt=prompt,
@@ -213,38 +259,13 @@ class GLMASRClient:
                 result.segments[0].end = duration_sec
             return result
 
-        # Chunking required - use duration-based chunking
         try:
-            chunks = split_audio_by_duration(
-                audio_path=audio_path,
-                max_duration_sec=self.MAX_DURATION,
+            results = transcribe_chunks(
+                chunks,
+                lambda chunk: self._transcribe_chunk(chunk, prompt, response_format),
+                progress_callback=progress_callback,
             )
-        except Exception as e:
-            raise TranscriptionError(f"Failed to split audio by duration: {e}") from e
-
-        try:
-            # Process chunks sequentially
-            results: list[TranscriptionResult] = []
-            chunk_offsets: list[float] = []
-
-            for i, chunk in enumerate(chunks):
-                if progress_callback:
-                    progress_callback(i + 1, len(chunks))
-
-                result = self.transcribe(
-                    audio_path=chunk.path,
-                    prompt=prompt,
-                    response_format=response_format,
-                )
-
-                # Fix duration using actual chunk duration from AudioChunk
-                chunk_duration = chunk.end_sec - chunk.start_sec
-                result.duration = chunk_duration
-                if result.segments and result.segments[0].end is None:
-                    result.segments[0].end = chunk_duration
-
-                results.append(result)
-                chunk_offsets.append(chunk.start_sec)
+            chunk_offsets = [chunk.start_sec for chunk in chunks]
 
             # Merge results (no diarization for Z.AI)
             merged = merge_results(
@@ -259,6 +280,36 @@ class GLMASRClient:
             # Always cleanup chunks
             cleanup_chunks(chunks)
 
+    def _transcribe_chunk(
+        self,
+        chunk: "AudioChunk",
+        prompt: str,
+        response_format: ResponseFormat,
+    ) -> TranscriptionResult:
+        """Transcribe one chunk and fill in the duration Z.AI doesn't return."""
+        result = self.transcribe(
+            audio_path=chunk.path,
+            prompt=prompt,
+            response_format=response_format,
+        )
+
+        # Fix duration using actual chunk duration from AudioChunk
+        chunk_duration = chunk.end_sec - chunk.start_sec
+        result.duration = chunk_duration
+        if result.segments and result.segments[0].end is None:
+            result.segments[0].end = chunk_duration
+        return result
+
+    def close(self) -> None:
+        """Close the underlying HTTP connection pool."""
+        self._session.close()
+
+    def __enter__(self) -> "GLMASRClient":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
     def _parse_response(self, response: dict) -> TranscriptionResult:
         """Parse Z.AI API response into TranscriptionResult.
 
@@ -1,10 +1,31 @@
 """Merge transcription results from multiple audio chunks."""
 
+from operator import attrgetter
+
 from video_transcribe.transcribe.models import (
     TranscriptionResult,
     TranscriptionSegment,
 )
 
+_START = attrgetter("start")
+
+# Global speaker IDs in assignment order: A, B, ..., Z, AA, AB, ..., ZZ
+_LETTERS = [chr(c) for c in range(ord("A"), ord("Z") + 1)]
+_SPEAKER_IDS = _LETTERS + [a + b for a in _LETTERS for b in _LETTERS]
+
+
+def _speaker_id(index: int) -> str:
+    """Return the global speaker ID for a 0-based index (A, ..., ZZ, AAA, ...)."""
+    if index < len(_SPEAKER_IDS):
+        return _SPEAKER_IDS[index]
+    # Spreadsheet-style column naming for the rare case beyond ZZ
+    label = ""
+    index += 1
+    while index:
+        index, letter = divmod(index - 1, 26)
+        label = _LETTERS[letter] + label
+    return label
+
 
 def merge_results(
     results: list[TranscriptionResult],
@@ -34,30 +55,38 @@ def merge_results(
     if not results:
         raise ValueError("At least one result required for merging")
 
-    # Merge all segments
-    all_segments: list[TranscriptionSegment] = []
-    for result, offset in zip(results, chunk_offsets):
-        for segment in result.segments:
-            # Adjust timestamps (handle None values)
-            adjusted_start = segment.start + offset if segment.start is not None else None
-            adjusted_end = segment.end + offset if segment.end is not None else None
-            adjusted_segment = TranscriptionSegment(
-                speaker=segment.speaker,
-                start=adjusted_start,
-                end=adjusted_end,
-                text=segment.text,
-            )
-            all_segments.append(adjusted_segment)
-
-    # Sort by timestamp
-    all_segments.sort(key=lambda s: s.start)
+    # A single chunk starting at 0 needs no shifting, sorting or renumbering
+    if len(results) == 1 and chunk_offsets[0] == 0.0 and not has_diarization:
+        return results[0]
+
+    # Merge all segments in one pass, adjusting timestamps (handle None values).
+    # Unshifted segments are reused unless renumbering will relabel them.
+    reuse_unshifted = not has_diarization
+    all_segments = [
+        segment if reuse_unshifted and offset == 0.0 else TranscriptionSegment(
+            # Positional: speaker, start, end, text
+            segment.speaker,
+            segment.start + offset if segment.start is not None else None,
+            segment.end + offset if segment.end is not None else None,
+            segment.text,
+        )
+        for result, offset in zip(results, chunk_offsets)
+        for segment in result.segments
+    ]
+
+    # Sort by timestamp. Chunks arrive in order and each is already sorted,
+    # so timsort only has to merge the overlapping runs.
+    all_segments.sort(key=_START)
 
     # Renumber speakers if diarization enabled
     if has_diarization:
         all_segments = _renumber_speakers(all_segments)
 
-    # Combine text
-    combined_text = " ".join(seg.text for seg in all_segments)
+    # Combine text (text-only chunk results have no segments to join)
+    if all_segments:
+        combined_text = " ".join(seg.text for seg in all_segments)
+    else:
+        combined_text = " ".join(result.text for result in results if result.text)
 
     # Calculate total duration
     last_duration = results[-1].duration if results[-1].duration is not None else 0.0
@@ -99,7 +128,7 @@ def _renumber_speakers(segments: list[TranscriptionSegment]) -> list[Transcripti
 
     # Map from original speaker ID to renumbered ID
     speaker_map: dict[str, str] = {}
-    next_speaker_num = ord('A')  # Start with 'A'
+    next_speaker = 0  # Index passed to _speaker_id()
 
     # Track last speaker to detect chunk boundaries
     last_speaker: str | None = None
@@ -118,16 +147,8 @@ def _renumber_speakers(segments: list[TranscriptionSegment]) -> list[Transcripti
 
         # Renumber speaker if not already mapped
         if original_speaker not in speaker_map:
-            # Generate speaker ID (A, B, ..., Z, AA, AB, ...)
-            if next_speaker_num <= ord('Z'):
-                new_id = chr(next_speaker_num)
-                next_speaker_num += 1
-            else:
-                # After Z, use AA, AB, AC, ...
-                idx = next_speaker_num - ord('A')
-                new_id = chr(ord('A') + idx // 26 - 1) + chr(ord('A') + idx % 26)
-                next_speaker_num += 1
-            speaker_map[original_speaker] = new_id
+            speaker_map[original_speaker] = _speaker_id(next_speaker)
+            next_speaker += 1
 
         # Update segment with renumbered speaker
         segment.speaker = speaker_map[original_speaker]
@@ -1,12 +1,13 @@
 """Data models for transcription responses."""
 
 from dataclasses import dataclass
-from typing import Literal
+from typing import Any, Literal
 
 # Model identifiers
 TranscriptionModel = Literal[
     "gpt-4o-transcribe",
     "gpt-4o-transcribe-diarize",
+    "glm-asr-2512",
     "nvidia/parakeet-tdt-0.6b-v3",
 ]
 
@@ -18,7 +19,7 @@ ResponseFormat = Literal[
 ]
 
 
-@dataclass
+@dataclass(slots=True)
 class TranscriptionSegment:
     """Single segment of transcribed text with speaker info."""
     speaker: str | None
@@ -26,8 +27,27 @@ class TranscriptionSegment:
     end: float | None
     text: str
 
+    def to_dict(self) -> dict[str, object]:
+        """Return the JSON representation of this segment."""
+        return {
+            "speaker": self.speaker,
+            "start": self.start,
+            "end": self.end,
+            "text": self.text,
+        }
 
-@dataclass
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "TranscriptionSegment":
+        """Build a segment from its to_dict() representation."""
+        return cls(
+            speaker=data["speaker"],
+            start=data["start"],
+            end=data["end"],
+            text=data["text"],
+        )
+
+
+@dataclass(slots=True)
 class TranscriptionResult:
     """Complete transcription result."""
     text: str
@@ -35,3 +55,53 @@ class TranscriptionResult:
     segments: list[TranscriptionSegment]
     model_used: TranscriptionModel
     response_format: ResponseFormat
+
+    def to_dict(self) -> dict[str, object]:
+        """Return the JSON document written for non-text output formats."""
+        return {
+            "text": self.text,
+            "duration": self.duration,
+            "model": self.model_used,
+            "segments": [segment.to_dict() for segment in self.segments],
+        }
+
+    @classmethod
+    def from_dict(
+        cls,
+        data: dict[str, Any],
+        response_format: ResponseFormat,
+    ) -> "TranscriptionResult":
+        """Build a result from its to_dict() representation.
+
+        Args:
+            data: Document produced by to_dict().
+            response_format: Format the result was requested in (not part
+                of the document).
+        """
+        return cls(
+            text=data["text"],
+            duration=data["duration"],
+            segments=[TranscriptionSegment.from_dict(s) for s in data["segments"]],
+            model_used=data["model"],
+            response_format=response_format,
+        )
+
+    def to_columnar_dict(self) -> dict[str, object]:
+        """Return the JSON document with segments as parallel lists.
+
+        Same fields as to_dict(), but "segments" holds one list per field
+        ("speaker", "start", "end", "text") instead of one object per
+        segment, which is much smaller for long transcripts.
+        """
+        segments = self.segments
+        return {
+            "text": self.text,
+            "duration": self.duration,
+            "model": self.model_used,
+            "segments": {
+                "speaker": [s.speaker for s in segments],
+                "start": [s.start for s in segments],
+                "end": [s.end for s in segments],
+                "text": [s.text for s in segments],
+            },
+        }
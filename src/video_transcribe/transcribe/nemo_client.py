@@ -1,9 +1,9 @@
 """NVIDIA NeMo speech recognition client for local transcription."""
 
 import os
+import threading
 from collections.abc import Callable
-from pathlib import Path
-from typing import Literal
+from typing import Any, Literal
 
 from video_transcribe.config import NEMO_MODEL_NAME, NEMO_DEVICE
 from video_transcribe.transcribe.models import (
@@ -18,11 +18,18 @@ from video_transcribe.transcribe.exceptions import (
 )
 
 # Supported audio formats for NeMo (via librosa/soundfile)
-SUPPORTED_FORMATS = {".wav", ".mp3"}
+SUPPORTED_FORMATS = frozenset({".wav", ".mp3"})
 
 # Default model
 MODEL = "nvidia/parakeet-tdt-0.6b-v3"
 
+# Loaded models shared by every client in the process, keyed by
+# (model_name, device): a checkpoint is loaded into memory only once.
+# Each model comes with the lock its inference calls hold, since NeMo
+# models are not documented as thread-safe.
+_MODELS: dict[tuple[str, str], tuple[Any, threading.Lock]] = {}
+_MODELS_LOCK = threading.Lock()
+
 
 class NeMoClient:
     """Local speech recognition via NVIDIA NeMo + Parakeet TDT.
@@ -49,10 +56,14 @@ class NeMoClient:
         self.model_name = model_name or NEMO_MODEL_NAME
         self.device = device or NEMO_DEVICE
         self._model = None  # Lazy loaded model
+        self._inference_lock: threading.Lock | None = None  # Shared with _model
 
     def _get_model(self):
         """Lazy load NeMo ASR model.
 
+        The model is shared with every other client using the same model
+        name and device, together with its inference lock.
+
         Returns:
             NeMo ASRModel instance.
 
@@ -60,15 +71,22 @@ class NeMoClient:
             ImportError: If NeMo dependencies are not installed.
         """
         if self._model is None:
-            try:
-                import nemo.collections.asr as nemo_asr
-            except ImportError as e:
-                raise ImportError(
-                    "NeMo dependencies not installed. "
-                    "Install with: pip install -e '.[nemo]'"
-                ) from e
-
-            self._model = nemo_asr.models.ASRModel.from_pretrained(self.model_name)
+            key = (self.model_name, self.device)
+            # Held while loading, so concurrent first calls load only once
+            with _MODELS_LOCK:
+                entry = _MODELS.get(key)
+                if entry is None:
+                    try:
+                        import nemo.collections.asr as nemo_asr
+                    except ImportError as e:
+                        raise ImportError(
+                            "NeMo dependencies not installed. "
+                            "Install with: pip install -e '.[nemo]'"
+                        ) from e
+
+                    model = nemo_asr.models.ASRModel.from_pretrained(self.model_name)
+                    entry = _MODELS[key] = (model, threading.Lock())
+            self._model, self._inference_lock = entry
 
         return self._model
 
@@ -93,30 +111,46 @@ class NeMoClient:
             InvalidAudioFormatError: If file format not supported.
             TranscriptionError: If transcription fails.
         """
-        # Validate audio file exists
-        audio_file = Path(audio_path)
-        if not audio_file.exists():
-            raise AudioFileNotFoundError(f"Audio file not found: {audio_path}")
-
-        # Validate format
-        if audio_file.suffix.lower() not in self.SUPPORTED_FORMATS:
-            raise InvalidAudioFormatError(
-                f"Unsupported format: {audio_file.suffix}. "
-                f"Supported formats: {', '.join(self.SUPPORTED_FORMATS)}"
-            )
+        self._validate_audio(audio_path)
 
         # Get model and transcribe
         model = self._get_model()
 
         try:
-            # NeMo transcribe returns a list of transcriptions (one per file)
-            results = model.transcribe([audio_path])
+            # NeMo transcribe returns a list of transcriptions (one per file).
+            # Clients share the model (e.g. across --jobs workers), so only
+            # one inference runs on it at a time.
+            with self._inference_lock:
+                results = model.transcribe([audio_path])
         except Exception as e:
             raise TranscriptionError(f"NeMo transcription failed: {e}") from e
 
         # Parse result (first/only item in list)
         return self._parse_result(results[0] if results else "", audio_path)
 
+    def _validate_audio(self, audio_path: str) -> int:
+        """Check that audio_path exists and has a supported format.
+
+        Returns:
+            File size in bytes.
+
+        Raises:
+            AudioFileNotFoundError: If audio file doesn't exist.
+            InvalidAudioFormatError: If file format not supported.
+        """
+        try:
+            st = os.stat(audio_path)
+        except FileNotFoundError:
+            raise AudioFileNotFoundError(f"Audio file not found: {audio_path}") from None
+
+        suffix = os.path.splitext(audio_path)[1]
+        if suffix.lower() not in self.SUPPORTED_FORMATS:
+            raise InvalidAudioFormatError(
+                f"Unsupported format: {suffix}. "
+                f"Supported formats: {', '.join(self.SUPPORTED_FORMATS)}"
+            )
+        return st.st_size
+
     def _parse_result(self, result, audio_path: str) -> TranscriptionResult:
         """Parse NeMo transcription result.
 
@@ -138,11 +172,11 @@ class NeMoClient:
         else:
             text = str(result)
 
-        # Get duration from audio file
+        # Get duration from the container header (ffprobe), without
+        # decoding the audio
         try:
-            from pydub import AudioSegment
-            audio = AudioSegment.from_file(audio_path)
-            duration = len(audio) / 1000.0  # ms to seconds
+            from video_transcribe.audio import get_audio_duration
+            duration = get_audio_duration(audio_path)
         except Exception:
             duration = None
 
@@ -176,7 +210,9 @@ class NeMoClient:
     ) -> TranscriptionResult:
         """Transcribe audio file with automatic chunking for large files.
 
-        Uses size-based chunking (similar to OpenAI adapter).
+        Uses size-based chunking (similar to OpenAI adapter). Chunks are
+        transcribed one at a time, in a worker thread, while later chunks
+        are still being cut.
 
         Args:
             audio_path: Path to audio file.
@@ -196,24 +232,15 @@ class NeMoClient:
             TranscriptionError: If transcription fails.
         """
         from video_transcribe.config import CHUNK_MAX_SIZE_MB
-        from video_transcribe.audio import split_audio, cleanup_chunks, AudioChunk
+        from video_transcribe.audio import cleanup_chunks, AudioChunk
         from video_transcribe.transcribe.merger import merge_results
+        from video_transcribe.transcribe.parallel import stream_split_audio, transcribe_chunks
 
         # Validate audio file exists and format
-        audio_file = Path(audio_path)
-        if not audio_file.exists():
-            raise AudioFileNotFoundError(f"Audio file not found: {audio_path}")
-
-        if audio_file.suffix.lower() not in self.SUPPORTED_FORMATS:
-            raise InvalidAudioFormatError(
-                f"Unsupported format: {audio_file.suffix}. "
-                f"Supported formats: {', '.join(self.SUPPORTED_FORMATS)}"
-            )
+        file_size = self._validate_audio(audio_path)
 
         # Check if chunking needed
-        file_size_mb = audio_file.stat().st_size / (1024 * 1024)
-
-        if file_size_mb <= CHUNK_MAX_SIZE_MB:
+        if file_size <= CHUNK_MAX_SIZE_MB * 1024 * 1024:
             # No chunking needed - use standard transcription
             return self.transcribe(
                 audio_path=audio_path,
@@ -221,28 +248,24 @@ class NeMoClient:
                 response_format=response_format,
             )
 
-        # Chunking required
-        try:
-            chunks = split_audio(audio_path=audio_path)
-        except Exception as e:
-            raise TranscriptionError(f"Failed to split audio: {e}") from e
-
+        # Chunking required: inference on a chunk overlaps with cutting
+        # the next ones
+        chunks: list[AudioChunk] = []
+        split = stream_split_audio(audio_path, chunks)
         try:
-            # Process chunks sequentially
-            results: list[TranscriptionResult] = []
-            chunk_offsets: list[float] = []
-
-            for i, chunk in enumerate(chunks):
-                if progress_callback:
-                    progress_callback(i + 1, len(chunks))
-
-                result = self.transcribe(
+            # One worker: the model runs one inference at a time anyway
+            # (see _MODELS)
+            results = transcribe_chunks(
+                split,
+                lambda chunk: self.transcribe(
                     audio_path=chunk.path,
                     prompt=None,
                     response_format=response_format,
-                )
-                results.append(result)
-                chunk_offsets.append(chunk.start_sec)
+                ),
+                progress_callback=progress_callback,
+                max_workers=1,
+            )
+            chunk_offsets = [chunk.start_sec for chunk in chunks]
 
             # Merge results (no diarization for NeMo)
             merged = merge_results(
@@ -254,5 +277,7 @@ class NeMoClient:
             return merged
 
         finally:
-            # Always cleanup chunks
+            # Stop the splitter (removing chunks it hadn't handed out), then
+            # cleanup the ones it did
+            split.close()
             cleanup_chunks(chunks)
@@ -0,0 +1,114 @@
+"""Concurrent transcription of audio chunks."""
+
+import threading
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+
+from video_transcribe.audio import AudioChunk, cleanup_chunks, iter_split_audio
+from video_transcribe.config import TRANSCRIBE_CONCURRENCY
+from video_transcribe.transcribe.exceptions import TranscriptionError
+from video_transcribe.transcribe.models import TranscriptionResult
+
+
+def transcribe_chunks(
+    chunks: Iterable[AudioChunk],
+    transcribe_chunk: Callable[[AudioChunk], TranscriptionResult],
+    progress_callback: Callable[[int, int], None] | None = None,
+    max_workers: int | None = None,
+) -> list[TranscriptionResult]:
+    """Transcribe chunks concurrently and return results in chunk order.
+
+    Each chunk is an independent blocking API call, so up to
+    ``max_workers`` of them run at once on a thread pool. Chunks are
+    submitted as the iterable yields them, so a lazy splitter such as
+    iter_split_audio() overlaps cutting with uploading. Results are put
+    back in chunk order regardless of completion order, ready for
+    merge_results().
+
+    Each temp chunk file (is_temp=True) is deleted as soon as it has been
+    transcribed, so disk use stays bounded by the chunks in flight.
+    Callers should still run cleanup_chunks() for chunks that failed or
+    never started; already deleted files are skipped.
+
+    Args:
+        chunks: Chunks to transcribe, in index order. May be a lazy iterator.
+        transcribe_chunk: Transcribes a single chunk.
+        progress_callback: Optional callback(done, total), called from the
+            calling thread as chunks complete. With a lazy iterator the
+            total is only known once it is exhausted, so reporting starts
+            then.
+        max_workers: Maximum concurrent calls. Defaults to
+            TRANSCRIBE_CONCURRENCY.
+
+    Returns:
+        One TranscriptionResult per chunk, in chunk order.
+
+    Raises:
+        Exception: The first error raised by transcribe_chunk or by the
+            iterable. Chunks that haven't started yet are cancelled and no
+            further chunks are pulled; running ones are awaited.
+    """
+    futures: dict[Future[TranscriptionResult], int] = {}
+    failed = threading.Event()
+
+    def _transcribe(chunk: AudioChunk) -> TranscriptionResult:
+        result = transcribe_chunk(chunk)
+        # Done with this temp file: free its space now rather than holding
+        # every chunk until the caller's final cleanup_chunks()
+        cleanup_chunks([chunk])
+        return result
+
+    def _on_done(future: Future[TranscriptionResult]) -> None:
+        if not future.cancelled() and future.exception() is not None:
+            failed.set()
+
+    # Threads are started on demand, so a short chunk list doesn't spawn
+    # idle workers
+    with ThreadPoolExecutor(max_workers=max_workers or TRANSCRIBE_CONCURRENCY) as executor:
+        try:
+            for i, chunk in enumerate(chunks):
+                if failed.is_set():
+                    break  # as_completed() below re-raises the error
+                future = executor.submit(_transcribe, chunk)
+                future.add_done_callback(_on_done)
+                futures[future] = i
+
+            total = len(futures)
+            results: list[TranscriptionResult | None] = [None] * total
+            for done, future in enumerate(as_completed(futures), start=1):
+                results[futures[future]] = future.result()
+                if progress_callback:
+                    progress_callback(done, total)
+        except BaseException:
+            # Fail fast: drop queued chunks instead of spending API calls
+            # on a transcript that can't be merged anyway
+            executor.shutdown(wait=False, cancel_futures=True)
+            raise
+
+    return results  # type: ignore[return-value]
+
+
+def stream_split_audio(audio_path: str, chunks: list[AudioChunk]) -> Iterator[AudioChunk]:
+    """Yield size-based chunks of audio_path as they are cut.
+
+    Wraps iter_split_audio() for transcribe_chunks(): each yielded chunk
+    is also appended to chunks, so the caller has the offsets for
+    merge_results() and the list for cleanup_chunks() afterwards. Close
+    the generator in a finally block to stop the split early.
+
+    Raises:
+        TranscriptionError: If audio splitting fails.
+    """
+    split: Iterator[AudioChunk] | None = None
+    try:
+        split = iter_split_audio(audio_path=audio_path)
+        for chunk in split:
+            chunks.append(chunk)
+            yield chunk
+    except Exception as e:
+        raise TranscriptionError(f"Failed to split audio: {e}") from e
+    finally:
+        # Closing a pending export generator removes its unyielded chunks
+        close = getattr(split, "close", None)
+        if close is not None:
+            close()
@@ -0,0 +1,171 @@
+"""Tests for video_transcribe.transcribe.adapter module."""
+
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+from pytest_mock import MockerFixture
+
+from video_transcribe.audio import AudioChunk
+from video_transcribe.transcribe.adapter import OpenAIAdapter
+from video_transcribe.transcribe.exceptions import (
+    AudioFileNotFoundError,
+    FileSizeLimitError,
+    InvalidAudioFormatError,
+)
+
+
+@pytest.fixture
+def adapter() -> OpenAIAdapter:
+    """Adapter with a dummy key; validation fails before any API call."""
+    return OpenAIAdapter(api_key="key")
+
+
+class TestInit:
+    """Test suite for OpenAIAdapter construction."""
+
+    def test_adapters_share_sdk_client_per_key(self) -> None:
+        """Test that adapters with the same key reuse one SDK client."""
+        # Act
+        first = OpenAIAdapter(api_key="key")
+        second = OpenAIAdapter(api_key="key")
+        other = OpenAIAdapter(api_key="other-key")
+
+        # Assert
+        assert first.client is second.client
+        assert other.client is not first.client
+
+
+class TestValidation:
+    """Test suite for OpenAIAdapter input validation."""
+
+    def test_missing_file_raises(self, adapter: OpenAIAdapter, tmp_path: Path) -> None:
+        """Test that a nonexistent file raises AudioFileNotFoundError."""
+        with pytest.raises(AudioFileNotFoundError, match="not found"):
+            adapter.transcribe(str(tmp_path / "missing.mp3"))
+
+    def test_unsupported_format_raises(self, adapter: OpenAIAdapter, tmp_path: Path) -> None:
+        """Test that the suffix check is case-insensitive and rejects others."""
+        # Arrange
+        audio = tmp_path / "audio.ogg"
+        audio.write_bytes(b"data")
+
+        # Act & Assert
+        with pytest.raises(InvalidAudioFormatError, match=r"\.ogg"):
+            adapter.transcribe_chunked(str(audio))
+
+    def test_oversized_file_raises(self, adapter: OpenAIAdapter, tmp_path: Path) -> None:
+        """Test that files over MAX_FILE_SIZE_MB are rejected before upload."""
+        # Arrange
+        audio = tmp_path / "AUDIO.MP3"
+        with open(audio, "wb") as f:
+            f.truncate(int(adapter.MAX_FILE_SIZE_MB * 1024 * 1024) + 1)
+
+        # Act & Assert
+        with pytest.raises(FileSizeLimitError, match="exceeds limit"):
+            adapter.transcribe(str(audio))
+
+
+class TestParseResponse:
+    """Test suite for OpenAIAdapter._parse_response()."""
+
+    def test_diarized_segments_keep_speaker_and_order(self, adapter: OpenAIAdapter) -> None:
+        """Test that diarized segments are built in order with speakers."""
+        # Arrange
+        response = SimpleNamespace(
+            text="Привет Hello",
+            duration=3.0,
+            segments=[
+                SimpleNamespace(speaker="A", start=0.0, end=1.0, text="Привет"),
+                SimpleNamespace(speaker="B", start=1.0, end=3.0, text="Hello"),
+            ],
+        )
+
+        # Act
+        result = adapter._parse_response(
+            response, "gpt-4o-transcribe-diarize", "diarized_json"
+        )
+
+        # Assert
+        assert [(s.speaker, s.start, s.text) for s in result.segments] == [
+            ("A", 0.0, "Привет"),
+            ("B", 1.0, "Hello"),
+        ]
+        assert result.duration == 3.0
+
+    def test_text_and_duration_fall_back_to_segments(self, adapter: OpenAIAdapter) -> None:
+        """Test that missing text/duration are derived from the segments."""
+        # Arrange
+        response = SimpleNamespace(
+            segments=[
+                SimpleNamespace(start=0.0, end=1.5, text="Раз "),
+                SimpleNamespace(start=1.5, end=4.0, text="два"),
+            ],
+        )
+
+        # Act
+        result = adapter._parse_response(response, "gpt-4o-transcribe", "verbose_json")
+
+        # Assert
+        assert result.text == "Раз два"
+        assert result.duration == 4.0
+
+
+class TestTranscribeChunked:
+    """Test suite for OpenAIAdapter.transcribe_chunked()."""
+
+    def test_small_file_validated_once(
+        self, adapter: OpenAIAdapter, small_audio_file: Path, mocker: MockerFixture
+    ) -> None:
+        """Test that a file below the chunk limit is validated and sent once."""
+        # Arrange
+        validate = mocker.spy(adapter, "_validate_audio")
+        adapter.client = MagicMock()
+        adapter.client.audio.transcriptions.create.return_value = SimpleNamespace(
+            text="hello", duration=5.0
+        )
+
+        # Act
+        result = adapter.transcribe_chunked(str(small_audio_file))
+
+        # Assert
+        assert result.text == "hello"
+        validate.assert_called_once()
+        adapter.client.audio.transcriptions.create.assert_called_once()
+
+    def test_text_chunks_merge_to_full_duration(
+        self, adapter: OpenAIAdapter, tmp_path: Path, mocker: MockerFixture
+    ) -> None:
+        """Test that chunked text output reports the whole audio duration.
+
+        Given: A file split into two chunks (0-1202 s and 1200-2400 s)
+        When: transcribe_chunked() is called with response_format="text"
+        Then: The merged duration ends at the last chunk's end, not its start
+        """
+        # Arrange
+        audio = tmp_path / "long.mp3"
+        audio.write_bytes(b"\0")
+        chunk_files = [tmp_path / f"chunk_{i}.mp3" for i in range(2)]
+        for path in chunk_files:
+            path.write_bytes(b"\0")
+        chunks = [
+            AudioChunk(str(path), i, start, end, original_duration_sec=2400.0)
+            for i, (path, start, end) in enumerate(
+                zip(chunk_files, [0.0, 1200.0], [1202.0, 2400.0])
+            )
+        ]
+        mocker.patch("video_transcribe.transcribe.adapter.CHUNK_MAX_SIZE_MB", 0)
+        mocker.patch(
+            "video_transcribe.transcribe.parallel.iter_split_audio",
+            return_value=iter(chunks),
+        )
+        adapter.client = MagicMock()
+        adapter.client.audio.transcriptions.create.side_effect = ["first", "second"]
+
+        # Act
+        result = adapter.transcribe_chunked(str(audio), response_format="text")
+
+        # Assert
+        assert result.text == "first second"
+        assert result.duration == 2400.0
@@ -0,0 +1,70 @@
+"""Tests for video_transcribe.transcribe.cache module."""
+
+from pathlib import Path
+
+from video_transcribe.transcribe.cache import cache_key, load_cached, store_cached
+from video_transcribe.transcribe.models import TranscriptionResult, TranscriptionSegment
+
+
+def _make_result() -> TranscriptionResult:
+    return TranscriptionResult(
+        text="Привет.",
+        duration=2.0,
+        segments=[TranscriptionSegment(speaker="A", start=0.0, end=2.0, text="Привет.")],
+        model_used="gpt-4o-transcribe-diarize",
+        response_format="diarized_json",
+    )
+
+
+class TestCacheKey:
+    """Test suite for cache_key()."""
+
+    def test_depends_on_content_and_params(self, tmp_path: Path) -> None:
+        """Test that the key changes with audio content or any parameter.
+
+        Given: An audio file hashed with fixed parameters
+        When: The parameters or the audio content change
+        Then: The key is stable for identical input and differs otherwise
+        """
+        # Arrange
+        audio = tmp_path / "audio.mp3"
+        audio.write_bytes(b"a" * 100)
+
+        # Act
+        base = cache_key(audio, model="m", language="ru")
+        same = cache_key(audio, language="ru", model="m")
+        other_params = cache_key(audio, model="m", language="en")
+        audio.write_bytes(b"b" * 100)
+        other_audio = cache_key(audio, model="m", language="ru")
+
+        # Assert
+        assert base == same
+        assert other_params != base
+        assert other_audio != base
+
+
+class TestLoadStore:
+    """Test suite for load_cached() and store_cached()."""
+
+    def test_round_trip(self, tmp_path: Path) -> None:
+        """Test that a stored result loads back unchanged."""
+        # Arrange
+        cache_dir = tmp_path / "cache"
+        result = _make_result()
+
+        # Act
+        store_cached(cache_dir, "key", result)
+        loaded = load_cached(cache_dir, "key", "diarized_json")
+
+        # Assert
+        assert loaded == result
+        assert [p.name for p in cache_dir.iterdir()] == ["key.json"]
+
+    def test_miss_and_corrupt_entry_return_none(self, tmp_path: Path) -> None:
+        """Test that missing and corrupt entries are treated as misses."""
+        # Arrange
+        (tmp_path / "bad.json").write_text("{not json", encoding="utf-8")
+
+        # Act & Assert
+        assert load_cached(tmp_path, "missing", "json") is None
+        assert load_cached(tmp_path, "bad", "json") is None
@@ -0,0 +1,110 @@
+"""Tests for video_transcribe.transcribe.glm_asr_client module."""
+
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+import requests
+from pytest_mock import MockerFixture
+
+from video_transcribe.transcribe.exceptions import (
+    AudioFileNotFoundError,
+    InvalidAudioFormatError,
+    TranscriptionError,
+)
+from video_transcribe.transcribe.glm_asr_client import REQUEST_TIMEOUT, GLMASRClient
+
+
+@pytest.fixture
+def client() -> GLMASRClient:
+    """Client with a dummy key."""
+    return GLMASRClient(api_key="key")
+
+
+class TestSession:
+    """Test suite for GLMASRClient HTTP connection reuse."""
+
+    def test_requests_share_one_session(
+        self, client: GLMASRClient, small_audio_file: Path, mocker: MockerFixture
+    ) -> None:
+        """Test that every request goes through the same authorized session.
+
+        Given: A client and a small audio file
+        When: transcribe() is called twice
+        Then: Both calls use the client's session with a timeout and the
+              Authorization header is set on the session, not per call
+        """
+        # Arrange
+        post = mocker.patch.object(client._session, "post")
+        post.return_value = MagicMock(status_code=200, json=lambda: {"text": "Привет"})
+
+        # Act
+        first = client.transcribe(str(small_audio_file))
+        second = client.transcribe(str(small_audio_file))
+
+        # Assert
+        assert first.text == second.text == "Привет"
+        assert post.call_count == 2
+        assert post.call_args.kwargs["timeout"] == REQUEST_TIMEOUT
+        assert "headers" not in post.call_args.kwargs
+        assert client._session.headers["Authorization"] == "Bearer key"
+
+    @pytest.mark.parametrize(
+        ("status", "retried"),
+        [(429, True), (503, True), (500, False), (502, False)],
+    )
+    def test_retries_only_rejected_uploads(
+        self, client: GLMASRClient, status: int, retried: bool
+    ) -> None:
+        """Test that only statuses where nothing was transcribed are retried.
+
+        Other 5xx may follow a processed (billed) request, so repeating the
+        upload could bill a duplicate transcription.
+        """
+        # Arrange
+        retry = client._session.get_adapter("https://").max_retries
+
+        # Act & Assert
+        assert retry.is_retry("POST", status) is retried
+        assert retry.read == 0
+
+    def test_connection_error_raises_transcription_error(
+        self, client: GLMASRClient, small_audio_file: Path, mocker: MockerFixture
+    ) -> None:
+        """Test that network failures surface as TranscriptionError."""
+        # Arrange
+        mocker.patch.object(
+            client._session, "post", side_effect=requests.ConnectionError("reset")
+        )
+
+        # Act & Assert
+        with pytest.raises(TranscriptionError, match="request failed"):
+            client.transcribe(str(small_audio_file))
+
+    def test_context_manager_closes_session(self, mocker: MockerFixture) -> None:
+        """Test that leaving the with-block closes the session."""
+        # Act
+        with GLMASRClient(api_key="key") as client:
+            close = mocker.spy(client._session, "close")
+
+        # Assert
+        close.assert_called_once()
+
+
+class TestValidation:
+    """Test suite for GLMASRClient input validation."""
+
+    def test_missing_file_raises(self, client: GLMASRClient, tmp_path: Path) -> None:
+        """Test that a nonexistent file raises AudioFileNotFoundError."""
+        with pytest.raises(AudioFileNotFoundError, match="not found"):
+            client.transcribe(str(tmp_path / "missing.mp3"))
+
+    def test_unsupported_format_raises(self, client: GLMASRClient, tmp_path: Path) -> None:
+        """Test that formats other than .wav/.mp3 are rejected."""
+        # Arrange
+        audio = tmp_path / "audio.m4a"
+        audio.write_bytes(b"data")
+
+        # Act & Assert
+        with pytest.raises(InvalidAudioFormatError, match=r"\.m4a"):
+            client.transcribe(str(audio))
@@ -2,152 +2,76 @@
 
 import pytest
 
-from video_transcribe.transcribe.merger import merge_results
+from video_transcribe.transcribe.merger import _speaker_id, merge_results
 from video_transcribe.transcribe.models import (
     TranscriptionResult,
     TranscriptionSegment,
 )
 
 
-class TestSpeakerRenumberingTwoChunks:
-    """Test suite for speaker renumbering across two chunks."""
-
-    def test_speaker_renumbering_two_chunks(self) -> None:
-        """Test speaker renumbering across two chunks.
-
-        Given: Two chunks with speakers A,B each
-        When: merge_results() is called with has_diarization=True
-        Then: Second chunk's A,B are renumbered to C,D
-
-        Chunk 1: A,B
-        Chunk 2: A,B (new chunk, so A,B → C,D)
-        Result:  A,B,C,D
-        """
-        # Arrange: Create two chunks with A,B pattern
-        chunk1 = TranscriptionResult(
-            text="Hello from chunk 1",
+def _make_ab_chunks(n_chunks: int) -> list[TranscriptionResult]:
+    """Build n_chunks diarized 10 s chunks, each with speakers A then B."""
+    return [
+        TranscriptionResult(
+            text=f"Chunk {i}",
             duration=10.0,
             segments=[
-                TranscriptionSegment(speaker='A', start=0.0, end=5.0, text='Hi A'),
-                TranscriptionSegment(speaker='B', start=5.0, end=10.0, text='Hi B'),
+                TranscriptionSegment(speaker='A', start=0.0, end=5.0, text=f'A{i}'),
+                TranscriptionSegment(speaker='B', start=5.0, end=10.0, text=f'B{i}'),
             ],
             model_used='gpt-4o-transcribe-diarize',
             response_format='diarized_json',
         )
-        chunk2 = TranscriptionResult(
-            text="Hello from chunk 2",
-            duration=10.0,
-            segments=[
-                TranscriptionSegment(speaker='A', start=0.0, end=5.0, text='Hello A'),
-                TranscriptionSegment(speaker='B', start=5.0, end=10.0, text='Hello B'),
-            ],
-            model_used='gpt-4o-transcribe-diarize',
-            response_format='diarized_json',
-        )
-
-        # Act
-        result = merge_results([chunk1, chunk2], [0.0, 10.0], has_diarization=True)
-
-        # Assert: First chunk A,B unchanged; second chunk A,B → C,D
-        assert len(result.segments) == 4
-        assert result.segments[0].speaker == 'A'
-        assert result.segments[1].speaker == 'B'
-        assert result.segments[2].speaker == 'C'
-        assert result.segments[3].speaker == 'D'
-
-
-class TestSpeakerRenumberingManyChunks:
-    """Test suite for speaker renumbering across many chunks."""
-
-    def test_speaker_renumbering_many_chunks(self) -> None:
-        """Test speaker renumbering across many chunks.
-
-        Given: Three chunks with A,B pattern repeating
+        for i in range(n_chunks)
+    ]
+
+
+class TestSpeakerRenumbering:
+    """Test suite for speaker renumbering across chunks."""
+
+    @pytest.mark.parametrize(
+        ("n_chunks", "expected"),
+        [
+            (2, ['A', 'B', 'C', 'D']),
+            (3, ['A', 'B', 'C', 'D', 'E', 'F']),
+            (14, [*'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'AA', 'AB']),
+        ],
+        ids=['2', '3', '14'],
+    )
+    def test_speaker_renumbering(self, n_chunks: int, expected: list[str]) -> None:
+        """Test that every chunk's A,B get the next global speaker IDs.
+
+        Given: n_chunks chunks with speakers A,B each
         When: merge_results() is called with has_diarization=True
-        Then: Speakers are renumbered sequentially across all chunks
+        Then: Speakers are renumbered sequentially across all chunks,
+              continuing with AA, AB after Z
 
         Chunk 1: A,B
         Chunk 2: A,B → C,D
         Chunk 3: A,B → E,F
-        Result:  A,B,C,D,E,F
         """
-        # Arrange: Create 3 chunks with A,B pattern
-        chunks = []
-        for i in range(3):
-            chunks.append(
-                TranscriptionResult(
-                    text=f"Chunk {i}",
-                    duration=10.0,
-                    segments=[
-                        TranscriptionSegment(
-                            speaker='A', start=0.0, end=5.0, text=f'A{i}'
-                        ),
-                        TranscriptionSegment(
-                            speaker='B', start=5.0, end=10.0, text=f'B{i}'
-                        ),
-                    ],
-                    model_used='gpt-4o-transcribe-diarize',
-                    response_format='diarized_json',
-                )
-            )
+        # Arrange
+        chunks = _make_ab_chunks(n_chunks)
+        offsets = [i * 10.0 for i in range(n_chunks)]
 
         # Act
-        offsets = [0.0, 10.0, 20.0]
         result = merge_results(chunks, offsets, has_diarization=True)
 
-        # Assert: Should be A,B,C,D,E,F
-        speakers = [s.speaker for s in result.segments]
-        assert speakers == ['A', 'B', 'C', 'D', 'E', 'F']
-
-
-class TestSpeakerRenumberingBeyondZ:
-    """Test suite for speaker renumbering beyond 26 speakers."""
-
-    def test_speaker_renumbering_beyond_z(self) -> None:
-        """Test speaker renumbering beyond 26 speakers.
-
-        Given: 14 chunks with 2 speakers each (28 total speakers)
-        When: merge_results() is called with has_diarization=True
-        Then: Speakers go A-Z, then AA, AB, AC...
-
-        First 26: A-Z
-        Next:    AA, AB
-        """
-        # Arrange: Create 14 chunks × 2 speakers = 28 speakers
-        chunks = []
-        for i in range(14):
-            chunks.append(
-                TranscriptionResult(
-                    text=f"Chunk {i}",
-                    duration=10.0,
-                    segments=[
-                        TranscriptionSegment(
-                            speaker='A', start=0.0, end=5.0, text=f'A{i}'
-                        ),
-                        TranscriptionSegment(
-                            speaker='B', start=5.0, end=10.0, text=f'B{i}'
-                        ),
-                    ],
-                    model_used='gpt-4o-transcribe-diarize',
-                    response_format='diarized_json',
-                )
-            )
+        # Assert
+        assert [s.speaker for s in result.segments] == expected
+        assert [_speaker_id(i) for i in range(len(expected))] == expected
 
-        # Act
-        offsets = [i * 10.0 for i in range(14)]
-        result = merge_results(chunks, offsets, has_diarization=True)
 
-        # Assert: First 26 are A-Z, then AA, AB
-        speakers = [s.speaker for s in result.segments]
-        assert len(speakers) == 28
+class TestSpeakerId:
+    """Test suite for _speaker_id()."""
 
-        # First 26 should be A-Z
-        expected_first_26 = [chr(ord('A') + i) for i in range(26)]
-        assert speakers[:26] == expected_first_26
-
-        # Last two should be AA, AB
-        assert speakers[26] == 'AA'
-        assert speakers[27] == 'AB'
+    @pytest.mark.parametrize(
+        ("index", "expected"),
+        [(0, 'A'), (25, 'Z'), (26, 'AA'), (701, 'ZZ'), (702, 'AAA'), (703, 'AAB')],
+    )
+    def test_spreadsheet_style_labels(self, index: int, expected: str) -> None:
+        """Test that labels continue past the precomputed table without gaps."""
+        assert _speaker_id(index) == expected
 
 
 class TestTimestampAdjustment:
@@ -321,6 +245,28 @@ class TestMergeResultsMetadata:
         # Assert: Text from segments is concatenated with spaces
         assert result.text == "Hello World"
 
+    def test_merge_results_text_only_chunks(self) -> None:
+        """Test that chunks without segments are merged by their text."""
+        # Arrange
+        chunks = [
+            TranscriptionResult(
+                text=text,
+                duration=0.0,
+                segments=[],
+                model_used='gpt-4o-transcribe',
+                response_format='text',
+            )
+            for text in ("Hello", "", "World")
+        ]
+
+        # Act
+        result = merge_results(chunks, [0.0, 5.0, 10.0], has_diarization=False)
+
+        # Assert
+        assert result.text == "Hello World"
+        assert result.segments == []
+        assert result.response_format == "text"
+
     def test_merge_results_without_diarization(self) -> None:
         """Test merge without speaker diarization.
 
@@ -354,3 +300,48 @@ class TestMergeResultsMetadata:
         # Assert: No speaker renumbering
         assert result.segments[0].speaker is None
         assert result.segments[1].speaker is None
+
+    def test_single_chunk_at_zero_returned_as_is(self) -> None:
+        """Test that one chunk at offset 0 without diarization is not copied."""
+        # Arrange
+        result = TranscriptionResult(
+            text="Only chunk",
+            duration=12.0,
+            segments=[TranscriptionSegment(speaker=None, start=0.0, end=12.0, text="Only chunk")],
+            model_used="gpt-4o-transcribe",
+            response_format="verbose_json",
+        )
+
+        # Act
+        merged = merge_results([result], [0.0])
+
+        # Assert
+        assert merged is result
+
+    def test_zero_offset_segments_reused_without_diarization(self) -> None:
+        """Test that only segments that need shifting are copied.
+
+        Given: Two chunks without diarization, the first at offset 0
+        When: merge_results() is called
+        Then: The first chunk's segments are reused, the second's are shifted copies
+        """
+        # Arrange
+        chunks = [
+            TranscriptionResult(
+                text=f"Chunk {i}",
+                duration=10.0,
+                segments=[TranscriptionSegment(speaker=None, start=0.0, end=5.0, text=f'T{i}')],
+                model_used='gpt-4o-transcribe',
+                response_format='json',
+            )
+            for i in range(2)
+        ]
+
+        # Act
+        result = merge_results(chunks, [0.0, 10.0])
+
+        # Assert
+        assert result.segments[0] is chunks[0].segments[0]
+        assert result.segments[1] is not chunks[1].segments[0]
+        assert result.segments[1].start == 10.0
+        assert chunks[1].segments[0].start == 0.0
@@ -0,0 +1,120 @@
+"""Tests for video_transcribe.transcribe.nemo_client module."""
+
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+from pytest_mock import MockerFixture
+
+from video_transcribe.transcribe import nemo_client
+from video_transcribe.transcribe.nemo_client import NeMoClient
+
+
+@pytest.fixture
+def fake_nemo(mocker: MockerFixture) -> MagicMock:
+    """Install a fake nemo.collections.asr and start with no loaded models."""
+    nemo = MagicMock()
+    mocker.patch.dict(sys.modules, {
+        "nemo": nemo,
+        "nemo.collections": nemo.collections,
+        "nemo.collections.asr": nemo.collections.asr,
+    })
+    mocker.patch.object(nemo_client, "_MODELS", {})
+    return nemo.collections.asr
+
+
+class TestGetModel:
+    """Test suite for NeMoClient._get_model()."""
+
+    def test_model_loaded_once_per_name_and_device(self, fake_nemo: MagicMock) -> None:
+        """Test that clients share a loaded model by (model_name, device).
+
+        Given: Two clients for the same model and device, and one for another device
+        When: Each asks for its model
+        Then: The same-key clients share one load, the other loads its own
+        """
+        # Arrange
+        from_pretrained = fake_nemo.models.ASRModel.from_pretrained
+        from_pretrained.side_effect = lambda name: object()
+
+        # Act
+        first = NeMoClient(model_name="parakeet", device="cpu")._get_model()
+        second = NeMoClient(model_name="parakeet", device="cpu")._get_model()
+        other = NeMoClient(model_name="parakeet", device="cuda")._get_model()
+
+        # Assert
+        assert first is second
+        assert other is not first
+        assert from_pretrained.call_count == 2
+
+
+    def test_shared_model_runs_one_inference_at_a_time(
+        self, fake_nemo: MagicMock, small_audio_file: Path
+    ) -> None:
+        """Test that clients sharing a model never run inference concurrently.
+
+        Given: Two clients sharing one loaded model
+        When: Both transcribe at the same time from separate threads
+        Then: The model's transcribe() calls never overlap
+        """
+        # Arrange
+        lock = threading.Lock()
+        active = peak = 0
+
+        def transcribe(paths: list[str]) -> list[str]:
+            nonlocal active, peak
+            with lock:
+                active += 1
+                peak = max(peak, active)
+            time.sleep(0.05)
+            with lock:
+                active -= 1
+            return ["text"]
+
+        fake_nemo.models.ASRModel.from_pretrained.return_value.transcribe.side_effect = transcribe
+        clients = [NeMoClient(model_name="parakeet", device="cpu") for _ in range(2)]
+
+        # Act
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            results = list(executor.map(
+                lambda client: client.transcribe(str(small_audio_file)), clients
+            ))
+
+        # Assert
+        assert [r.text for r in results] == ["text", "text"]
+        assert peak == 1
+
+
+class TestParseResult:
+    """Test suite for NeMoClient._parse_result()."""
+
+    def test_duration_read_from_header(self, small_audio_file: Path) -> None:
+        """Test that the result carries the audio duration and one segment."""
+        # Act
+        result = NeMoClient(model_name="parakeet", device="cpu")._parse_result(
+            SimpleNamespace(text="Привет"), str(small_audio_file)
+        )
+
+        # Assert
+        assert result.text == "Привет"
+        assert result.duration == pytest.approx(5.0, abs=0.1)
+        assert result.segments[0].end == result.duration
+        assert result.model_used == "parakeet"
+
+    def test_unreadable_audio_gives_no_duration(self, tmp_path: Path) -> None:
+        """Test that a file ffprobe can't read yields duration None."""
+        # Arrange
+        audio = tmp_path / "broken.wav"
+        audio.write_bytes(b"not audio")
+
+        # Act
+        result = NeMoClient(model_name="parakeet", device="cpu")._parse_result("text", str(audio))
+
+        # Assert
+        assert result.duration is None
+        assert result.text == "text"
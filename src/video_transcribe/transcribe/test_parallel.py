@@ -0,0 +1,237 @@
+"""Tests for video_transcribe.transcribe.parallel module."""
+
+import threading
+import time
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+from pytest_mock import MockerFixture
+
+from video_transcribe.audio import AudioChunk, iter_split_audio_by_duration
+from video_transcribe.transcribe.exceptions import TranscriptionError
+from video_transcribe.transcribe.models import TranscriptionResult
+from video_transcribe.transcribe.parallel import transcribe_chunks
+
+
+def _make_chunks(count: int) -> list[AudioChunk]:
+    return [
+        AudioChunk(
+            path=f"chunk_{i}.mp3",
+            index=i,
+            start_sec=i * 10.0,
+            end_sec=(i + 1) * 10.0,
+            original_duration_sec=count * 10.0,
+        )
+        for i in range(count)
+    ]
+
+
+def _result(text: str) -> TranscriptionResult:
+    return TranscriptionResult(
+        text=text,
+        duration=10.0,
+        segments=[],
+        model_used="gpt-4o-transcribe",
+        response_format="verbose_json",
+    )
+
+
+class TestTranscribeChunks:
+    """Test suite for transcribe_chunks()."""
+
+    def test_results_in_chunk_order(self) -> None:
+        """Test that results follow chunk order, not completion order.
+
+        Given: Four chunks where earlier chunks take longer
+        When: transcribe_chunks() runs them with four workers
+        Then: Results are in chunk order and progress counts up to total
+        """
+        # Arrange
+        chunks = _make_chunks(4)
+        progress: list[tuple[int, int]] = []
+
+        def transcribe_chunk(chunk: AudioChunk) -> TranscriptionResult:
+            time.sleep(0.01 * (len(chunks) - chunk.index))
+            return _result(chunk.path)
+
+        # Act
+        results = transcribe_chunks(
+            chunks,
+            transcribe_chunk,
+            progress_callback=lambda done, total: progress.append((done, total)),
+            max_workers=4,
+        )
+
+        # Assert
+        assert [r.text for r in results] == [c.path for c in chunks]
+        assert progress == [(1, 4), (2, 4), (3, 4), (4, 4)]
+
+    def test_respects_max_workers(self) -> None:
+        """Test that no more than max_workers chunks run at once."""
+        # Arrange
+        chunks = _make_chunks(6)
+        lock = threading.Lock()
+        running = 0
+        peak = 0
+
+        def transcribe_chunk(chunk: AudioChunk) -> TranscriptionResult:
+            nonlocal running, peak
+            with lock:
+                running += 1
+                peak = max(peak, running)
+            time.sleep(0.01)
+            with lock:
+                running -= 1
+            return _result(chunk.path)
+
+        # Act
+        transcribe_chunks(chunks, transcribe_chunk, max_workers=2)
+
+        # Assert
+        assert peak <= 2
+
+    def test_first_error_cancels_queued_chunks(self) -> None:
+        """Test that a failing chunk stops queued chunks from starting.
+
+        Given: Ten chunks on one worker where the first chunk fails
+        When: transcribe_chunks() runs
+        Then: The error propagates and the queued chunks never start
+        """
+        # Arrange
+        chunks = _make_chunks(10)
+        started: list[int] = []
+
+        def transcribe_chunk(chunk: AudioChunk) -> TranscriptionResult:
+            started.append(chunk.index)
+            if chunk.index == 0:
+                raise TranscriptionError("upload failed")
+            time.sleep(0.01)
+            return _result(chunk.path)
+
+        # Act & Assert
+        with pytest.raises(TranscriptionError, match="upload failed"):
+            transcribe_chunks(chunks, transcribe_chunk, max_workers=1)
+        # The worker may already have picked up the next chunk
+        assert started[0] == 0
+        assert len(started) <= 2
+
+    def test_lazy_chunks_overlap_with_transcription(self) -> None:
+        """Test that chunks from an iterator are sent before it is exhausted.
+
+        Given: A splitter that only yields chunk 1 once chunk 0 is uploading
+        When: transcribe_chunks() consumes it
+        Then: It completes (no deadlock) with results in order and the
+              final progress reports the full total
+        """
+        # Arrange
+        chunks = _make_chunks(3)
+        first_started = threading.Event()
+        progress: list[tuple[int, int]] = []
+
+        def split() -> Iterator[AudioChunk]:
+            yield chunks[0]
+            assert first_started.wait(timeout=5)
+            yield from chunks[1:]
+
+        def transcribe_chunk(chunk: AudioChunk) -> TranscriptionResult:
+            if chunk.index == 0:
+                first_started.set()
+            return _result(chunk.path)
+
+        # Act
+        results = transcribe_chunks(
+            split(),
+            transcribe_chunk,
+            progress_callback=lambda done, total: progress.append((done, total)),
+            max_workers=2,
+        )
+
+        # Assert
+        assert [r.text for r in results] == [c.path for c in chunks]
+        assert progress[-1] == (3, 3)
+
+    def test_failed_chunk_stops_pulling_from_iterator(self) -> None:
+        """Test that no more chunks are pulled once one has failed."""
+        # Arrange
+        chunks = _make_chunks(10)
+        pulled: list[int] = []
+
+        def split() -> Iterator[AudioChunk]:
+            for chunk in chunks:
+                pulled.append(chunk.index)
+                yield chunk
+                if chunk.index == 0:
+                    time.sleep(0.05)  # Let chunk 0 fail before the next pull
+
+        def transcribe_chunk(chunk: AudioChunk) -> TranscriptionResult:
+            if chunk.index == 0:
+                raise TranscriptionError("upload failed")
+            return _result(chunk.path)
+
+        # Act & Assert
+        with pytest.raises(TranscriptionError, match="upload failed"):
+            transcribe_chunks(split(), transcribe_chunk, max_workers=1)
+        assert len(pulled) <= 2
+
+    def test_temp_chunks_deleted_once_transcribed(self, tmp_path: Path) -> None:
+        """Test that each temp chunk file is removed right after its upload.
+
+        Given: Two temp chunk files and the original (non-temp) file
+        When: transcribe_chunks() transcribes them
+        Then: Temp files are gone after their call, the original is kept
+        """
+        # Arrange
+        paths = [tmp_path / f"chunk_{i}.mp3" for i in range(2)]
+        for path in paths:
+            path.write_bytes(b"audio")
+        original = tmp_path / "original.mp3"
+        original.write_bytes(b"audio")
+        chunks = [
+            AudioChunk(path=str(p), index=i, start_sec=0.0, end_sec=1.0, original_duration_sec=2.0)
+            for i, p in enumerate(paths)
+        ] + [
+            AudioChunk(
+                path=str(original), index=2, start_sec=0.0, end_sec=1.0,
+                original_duration_sec=2.0, is_temp=False,
+            )
+        ]
+
+        def transcribe_chunk(chunk: AudioChunk) -> TranscriptionResult:
+            assert Path(chunk.path).exists()
+            return _result(chunk.path)
+
+        # Act
+        transcribe_chunks(chunks, transcribe_chunk, max_workers=1)
+
+        # Assert
+        assert not any(p.exists() for p in paths)
+        assert original.exists()
+
+    def test_per_chunk_cleanup_keeps_split_dir_for_pending_exports(
+        self, large_audio_file: Path, tmp_path: Path, mocker: MockerFixture
+    ) -> None:
+        """Test that deleting finished chunks doesn't break queued exports.
+
+        Given: Overlapping windows cut by a single export worker, so later
+               chunks are still queued when earlier ones are deleted
+        When: Chunks are transcribed by a no-op transcriber that is faster
+              than the exports
+        Then: Every chunk is exported and the split directory is gone at the end
+        """
+        # Arrange
+        mocker.patch("video_transcribe.audio.chunker.os.cpu_count", return_value=1)
+        scratchpad = tmp_path / "chunks"
+        split = iter_split_audio_by_duration(
+            str(large_audio_file),
+            max_duration_sec=10.0,
+            overlap_sec=2.0,
+            scratchpad_dir=str(scratchpad),
+        )
+
+        # Act
+        results = transcribe_chunks(split, lambda chunk: _result(chunk.path), max_workers=2)
+
+        # Assert
+        assert len(results) > 5
+        assert list(scratchpad.iterdir()) == []
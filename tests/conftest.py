@@ -1,18 +1,46 @@
 """Shared fixtures for video-transcribe tests."""
 
-import importlib
+import math
+import os
+from pathlib import Path
 from unittest.mock import MagicMock
 
 import pytest
 from _pytest.monkeypatch import MonkeyPatch
 
 
+# Environment variables that config.py reads
+_CONFIG_ENV_VARS: frozenset[str] = frozenset({
+    "OPENAI_API_KEY",
+    "OPENAI_BASE_URL",
+    "SPEECH_TO_TEXT_PROVIDER",
+    "SPEECH_TO_TEXT_API_KEY",
+    "SPEECH_TO_TEXT_BASE_URL",
+    "SPEECH_TO_TEXT_MODEL",
+    "CHUNK_MAX_SIZE_MB",
+    "CHUNK_OVERLAP_SEC",
+    "CHUNK_MAX_DURATION_SEC",
+    "TRANSCRIBE_CONCURRENCY",
+    "AUDIO_FORMAT",
+    "TRANSCRIPT_CACHE_DIR",
+    "POSTPROCESS_API_KEY",
+    "POSTPROCESS_BASE_URL",
+    "POSTPROCESS_MODEL",
+    "POSTPROCESS_TEMPERATURE",
+    "POSTPROCESS_MAX_RPM",
+    "OUTPUT_DIR",
+    "ZAI_API_KEY",
+    "NEMO_MODEL_NAME",
+    "NEMO_DEVICE",
+})
+
+
 @pytest.fixture
 def clean_config(monkeypatch: MonkeyPatch):
     """Reset config module with clean environment (no env vars set).
 
-    This fixture clears all relevant environment variables and reloads
-    the config module to ensure tests start with a known state.
+    This fixture clears all relevant environment variables and resets
+    the config settings to ensure tests start with a known state.
 
     Usage:
         def test_something(clean_config):
@@ -20,34 +48,13 @@ def clean_config(monkeypatch: MonkeyPatch):
             from video_transcribe import config
             assert config.CHUNK_MAX_SIZE_MB == 20  # Default value
     """
-    # Environment variables that config.py reads
-    env_vars_to_clear = [
-        "OPENAI_API_KEY",
-        "OPENAI_BASE_URL",
-        "SPEECH_TO_TEXT_PROVIDER",
-        "SPEECH_TO_TEXT_API_KEY",
-        "SPEECH_TO_TEXT_BASE_URL",
-        "SPEECH_TO_TEXT_MODEL",
-        "CHUNK_MAX_SIZE_MB",
-        "CHUNK_OVERLAP_SEC",
-        "CHUNK_MAX_DURATION_SEC",
-        "POSTPROCESS_API_KEY",
-        "POSTPROCESS_BASE_URL",
-        "POSTPROCESS_MODEL",
-        "POSTPROCESS_TEMPERATURE",
-        "OUTPUT_DIR",
-        "ZAI_API_KEY",
-        "NEMO_MODEL_NAME",
-        "NEMO_DEVICE",
-    ]
-
     # Clear all env vars to get default config values
-    for var in env_vars_to_clear:
-        monkeypatch.delenv(var, raising=False)
+    for var in _CONFIG_ENV_VARS & os.environ.keys():
+        monkeypatch.delenv(var)
 
-    # Import and reload config module to pick up defaults
+    # Forget resolved settings to pick up defaults
     import video_transcribe.config
-    importlib.reload(video_transcribe.config)
+    video_transcribe.config.reload()
 
     return video_transcribe.config
 
@@ -78,9 +85,10 @@ def mock_env(monkeypatch: MonkeyPatch):
             self.monkeypatch.delenv(key, raising=False)
 
         def reload_config(self):
-            """Reload config module to pick up env changes."""
+            """Reset config settings to pick up env changes."""
             import video_transcribe.config
-            return importlib.reload(video_transcribe.config)
+            video_transcribe.config.reload()
+            return video_transcribe.config
 
     return MockEnvManager(monkeypatch)
 
@@ -103,37 +111,45 @@ def mock_dotenv(monkeypatch: MonkeyPatch) -> MagicMock:
     return mock
 
 
-@pytest.fixture
-def small_audio_file(tmp_path):
+# One MPEG-1 Layer III frame: 128 kbps, 44.1 kHz, mono, no padding.
+# A header followed by zeroed side info and main data decodes as silence.
+_SILENT_MP3_FRAME = b"\xff\xfb\x90\xc0" + bytes(413)
+_SAMPLES_PER_FRAME = 1152
+_SAMPLE_RATE = 44100
+
+
+def _write_silent_mp3(path: Path, duration_sec: float) -> Path:
+    """Write a silent CBR MP3 of at least duration_sec without encoding."""
+    frames = math.ceil(duration_sec * _SAMPLE_RATE / _SAMPLES_PER_FRAME)
+    path.write_bytes(_SILENT_MP3_FRAME * frames)
+    return path
+
+
+@pytest.fixture(scope="session")
+def small_audio_file(tmp_path_factory: pytest.TempPathFactory):
     """Create a small audio file for testing (no chunking needed).
 
-    Creates a 5 second silent MP3 file (~50-100KB) that is small enough
-    to not require chunking with default 20MB limit.
+    Creates a 5 second silent 128 kbps MP3 file (~80KB) that is small enough
+    to not require chunking with default 20MB limit. Session-scoped: the
+    file is shared by all tests, copy it before modifying.
 
     Returns:
         Path: Path to the small audio file.
     """
-    from pydub import AudioSegment
-
-    audio = AudioSegment.silent(duration=5000)  # 5 seconds in ms
-    audio_path = tmp_path / "small_audio.mp3"
-    audio.export(str(audio_path), format="mp3")
-    return audio_path
+    audio_path = tmp_path_factory.mktemp("audio") / "small_audio.mp3"
+    return _write_silent_mp3(audio_path, 5.0)
 
 
-@pytest.fixture
-def large_audio_file(tmp_path):
+@pytest.fixture(scope="session")
+def large_audio_file(tmp_path_factory: pytest.TempPathFactory):
     """Create a large audio file for testing (chunking required).
 
-    Creates a 90 second silent MP3 file (~1-2MB) that will require
-    chunking with default 30 second duration limit.
+    Creates a 90 second silent 128 kbps MP3 file (~1.4MB) that will require
+    chunking with default 30 second duration limit. Session-scoped: the
+    file is shared by all tests, copy it before modifying.
 
     Returns:
         Path: Path to the large audio file.
     """
-    from pydub import AudioSegment
-
-    audio = AudioSegment.silent(duration=90000)  # 90 seconds in ms
-    audio_path = tmp_path / "large_audio.mp3"
-    audio.export(str(audio_path), format="mp3")
-    return audio_path
+    audio_path = tmp_path_factory.mktemp("audio") / "large_audio.mp3"
+    return _write_silent_mp3(audio_path, 90.0)